@@ -0,0 +1,302 @@
+"""
+An Assets class to load, convert and keep every image, font and animation used
+by the game, and to report what each of them costs.
+
+Run this module to load every asset and print the report.
+"""
+
+# Import modules
+from atlas import Atlas
+import os
+import re
+import time
+import pygame as pg
+
+class Assets:
+    """Assets class. Assets are only loaded the first time they are requested
+    and images are converted to the display's pixel format once."""
+
+    # Directories containing all of the assets
+    ASSET_DIRS = ["Images", "Fonts", "Animations", "Tilesets"]
+
+    def __init__(self):
+        """Initialization method."""
+
+        # Loaded images, fonts and animations keyed by path (and size for
+        # fonts)
+        self.images = {}
+        self.fonts = {}
+        self.animations = {}
+
+        # Packed atlases keyed by name
+        self.atlases = {}
+
+        # Paths of images loaded before a display was set and so not yet
+        # converted
+        self.unconverted = set()
+
+        # Load time in seconds and memory in bytes of each asset, keyed the
+        # same as the assets themselves
+        self.stats = {}
+
+    def list_assets(self) -> list[str]:
+        """Return the paths of every asset file owned by the asset manager.
+
+        Returns:
+            paths
+                paths of all files in ASSET_DIRS
+        """
+
+        paths = []
+        for asset_dir in self.ASSET_DIRS:
+            for root, _, filenames in os.walk(asset_dir):
+                for filename in sorted(filenames):
+                    paths.append(os.path.join(root, filename))
+
+        return sorted(paths)
+
+    def convert(self, img: pg.Surface) -> pg.Surface:
+        """Convert an image to the display's pixel format, keeping its per pixel
+        transparency if it has any.
+
+        Arguments:
+            img
+                image to convert
+
+        Returns:
+            img
+                converted image
+        """
+
+        if img.get_flags() & pg.SRCALPHA or img.get_colorkey() is not None:
+            return img.convert_alpha()
+        return img.convert()
+
+    def get_image(self, path: str) -> pg.Surface:
+        """Return an image, loading it the first time it is requested.
+
+        Arguments:
+            path
+                path to the image file
+
+        Returns:
+            img
+                image converted to the display's pixel format if a display has
+                been set
+        """
+
+        if path not in self.images:
+            start = time.perf_counter()
+            self.images[path] = pg.image.load(path)
+            self.unconverted.add(path)
+            self.stats[path] = {
+                "load_time": time.perf_counter() - start,
+                "bytes": self.get_surface_bytes(self.images[path])}
+
+        # Convert once a display has been set
+        if path in self.unconverted and pg.display.get_surface() is not None:
+            start = time.perf_counter()
+            self.images[path] = self.convert(self.images[path])
+            self.unconverted.remove(path)
+            self.stats[path]["load_time"] += time.perf_counter() - start
+            self.stats[path]["bytes"] = \
+                self.get_surface_bytes(self.images[path])
+
+        return self.images[path]
+
+    def get_animation(self, animation_dir: str) -> list[pg.Surface]:
+        """Return all frames of an animation, loading them the first time the
+        animation is requested.
+
+        Arguments:
+            animation_dir
+                directory containing all of the images of the animation
+
+        Returns:
+            frames
+                animation frames ordered by the number in their filenames
+        """
+
+        if animation_dir not in self.animations:
+            # Only keep files, ordered by the frame number in the filename
+            filenames = [path for path in os.listdir(animation_dir)
+                         if os.path.isfile(os.path.join(animation_dir, path))]
+            filenames.sort(key=lambda path: int(re.sub(r"\D", "", path)))
+
+            self.animations[animation_dir] = \
+                [self.get_image(os.path.join(animation_dir, filename))
+                 for filename in filenames]
+
+        return self.animations[animation_dir]
+
+    def get_font(self, path: str, size: int) -> pg.font.Font:
+        """Return a font of the inputted size, loading it the first time it is
+        requested.
+
+        Arguments:
+            path
+                path to the font file
+            size
+                font size
+
+        Returns:
+            font
+                requested font with correct size
+        """
+
+        key = (path, size)
+
+        if key not in self.fonts:
+            start = time.perf_counter()
+            self.fonts[key] = pg.font.Font(path, size)
+
+            # Fonts keep the font file in memory
+            self.stats[key] = {"load_time": time.perf_counter() - start,
+                               "bytes": os.path.getsize(path)}
+
+        return self.fonts[key]
+
+    def get_coin_atlas(self, coin_dir="Animations/Coin") -> Atlas:
+        """Return an atlas of the coin animation at every resolution, building 
+        it the first time it is requested.
+
+        Frame i of the animation in coin_dir/<res> is the sprite named 
+        (coin_dir/<res>, i), and each resolution is registered under "coin".
+
+        Arguments:
+            coin_dir : str
+                directory containing a directory of frames per resolution
+
+        Returns:
+            atlas
+                packed coin animations
+        """
+
+        if "coin" not in self.atlases:
+            start = time.perf_counter()
+
+            # Directories named after the resolution of their frames
+            animation_dirs = {int(res): os.path.join(coin_dir, res) 
+                              for res in os.listdir(coin_dir) if res.isdigit()}
+
+            sprites = {}
+            for animation_dir in animation_dirs.values():
+                for i, frame in enumerate(self.get_animation(animation_dir)):
+                    sprites[(animation_dir, i)] = frame
+
+            atlas = Atlas(sprites)
+            for res, animation_dir in animation_dirs.items():
+                atlas.add_animation(animation_dir, 
+                                    len(self.animations[animation_dir]))
+                atlas.add_resolution("coin", res, animation_dir)
+                # The frames are only kept in the atlas
+                self.unload_animation(animation_dir)
+
+            self.atlases["coin"] = atlas
+            self.stats["coin atlas"] = {
+                "load_time": time.perf_counter() - start,
+                "bytes": atlas.get_bytes()}
+
+        return self.atlases["coin"]
+
+    def unload(self, path: str):
+        """Forget a loaded image so its memory can be freed.
+
+        Arguments:
+            path
+                path to the image file
+        """
+
+        self.images.pop(path, None)
+        self.unconverted.discard(path)
+        self.stats.pop(path, None)
+
+    def unload_animation(self, animation_dir: str):
+        """Forget all frames of a loaded animation so their memory can be 
+        freed.
+
+        Arguments:
+            animation_dir
+                directory containing all of the images of the animation
+        """
+
+        self.animations.pop(animation_dir, None)
+        for filename in os.listdir(animation_dir):
+            self.unload(os.path.join(animation_dir, filename))
+
+    def get_surface_bytes(self, surface: pg.Surface) -> int:
+        """Return the number of bytes held by a surface's pixels.
+
+        Arguments:
+            surface
+                pygame surface
+
+        Returns:
+            bytes
+                size of the surface's pixels in memory
+        """
+
+        return surface.get_pitch() * surface.get_height()
+
+    def preload(self, paths: list[str]):
+        """Load images before they are needed, e.g. at startup.
+
+        Arguments:
+            paths
+                paths to the image files
+        """
+
+        for path in paths:
+            self.get_image(path)
+
+    def get_report(self) -> list[tuple]:
+        """Return the load time and memory of every loaded asset, most
+        expensive first.
+
+        Returns:
+            report
+                (asset, load_time, bytes) for each loaded asset
+        """
+
+        report = [(key, stats["load_time"], stats["bytes"])
+                  for key, stats in self.stats.items()]
+        report.sort(key=lambda row: row[1], reverse=True)
+
+        return report
+
+    def format_report(self) -> str:
+        """Return the report as a table with totals.
+
+        Returns:
+            table
+                one line per asset with its load time in ms and memory in KB
+        """
+
+        report = self.get_report()
+
+        lines = [f"{'asset':<50} {'ms':>8} {'KB':>8}"]
+        for key, load_time, num_bytes in report:
+            lines.append(f"{str(key):<50} {load_time * 1000:>8.2f} \
+{num_bytes / 1024:>8.1f}")
+        lines.append(f"{'total':<50} \
+{sum(row[1] for row in report) * 1000:>8.2f} \
+{sum(row[2] for row in report) / 1024:>8.1f}")
+
+        return "\n".join(lines)
+
+# Assets shared by the whole game
+assets = Assets()
+
+if __name__ == "__main__":
+    pg.init()
+    pg.display.set_mode((1, 1))
+
+    # Load every asset to see what they all cost
+    for path in assets.list_assets():
+        if path.endswith((".png", ".jpeg")):
+            assets.get_image(path)
+        elif path.endswith(".ttf"):
+            assets.get_font(path, 30)
+    assets.get_coin_atlas()
+
+    print(assets.format_report())
@@ -0,0 +1,190 @@
+"""
+An Atlas class to pack many small sprites into a few large surfaces so they can
+all be drawn with a single screen.blits() call.
+"""
+
+# Import modules
+import pygame as pg
+
+class Atlas:
+    """Atlas class. Sprites are packed onto pages in rows (shelves) from the
+    tallest to the shortest, and each sprite is found by its name as a page and
+    the area of the page it was packed into."""
+
+    def __init__(self, sprites: dict, page_size=(2048, 2048), padding=1):
+        """Initialization method.
+
+        Arguments:
+            sprites
+                sprite surfaces keyed by their name
+            page_size : tuple[int]
+                maximum dimensions of each page; [width, height]
+            padding : int
+                number of empty pixels between sprites
+        """
+
+        self.page_size = page_size
+        self.padding = padding
+
+        # Packed surfaces
+        self.pages = []
+
+        # The page index and area of each sprite, keyed by the sprite's name
+        self.regions = {}
+
+        # Number of frames of each animation, keyed by the animation's name;
+        # frame i of an animation is the sprite named (name, i)
+        self.animations = {}
+
+        # Names of the animation at each resolution, keyed by the name of the
+        # sprite drawn at the different resolutions
+        self.resolutions = {}
+
+        self.pack(sprites)
+
+    def pack(self, sprites: dict):
+        """Pack sprites onto pages.
+
+        Arguments:
+            sprites
+                sprite surfaces keyed by their name
+        """
+
+        page_w, page_h = self.page_size
+
+        # Height used on each page
+        page_heights = [0]
+
+        # Top left of the next sprite and the height of the current shelf
+        x, y, shelf_h = 0, 0, 0
+
+        # Tallest sprites first so each shelf wastes as little space as
+        # possible
+        names = sorted(sprites, key=lambda name: sprites[name].get_height(),
+                       reverse=True)
+        for name in names:
+            w, h = sprites[name].get_size()
+            if w > page_w or h > page_h:
+                raise ValueError(f"{name} is larger than an atlas page")
+
+            # Start a new shelf if the sprite doesn't fit on the current one
+            if x + w > page_w:
+                x, y, shelf_h = 0, y + shelf_h + self.padding, 0
+            # Start a new page if the new shelf doesn't fit on the page
+            if y + h > page_h:
+                page_heights.append(0)
+                x, y, shelf_h = 0, 0, 0
+
+            self.regions[name] = (len(page_heights) - 1, pg.Rect(x, y, w, h))
+            page_heights[-1] = max(page_heights[-1], y + h)
+
+            x += w + self.padding
+            shelf_h = max(shelf_h, h)
+
+        # Each page is only as tall as what was packed on it
+        for page_height in page_heights:
+            page = pg.Surface((page_w, max(page_height, 1)), pg.SRCALPHA)
+            if pg.display.get_surface() is not None:
+                page = page.convert_alpha()
+            self.pages.append(page)
+
+        for name, (index, rect) in self.regions.items():
+            # Copy the pixels including their alpha values
+            self.pages[index].blit(sprites[name], rect,
+                                   special_flags=pg.BLEND_RGBA_MAX)
+
+    def get(self, name) -> tuple[pg.Surface, pg.Rect]:
+        """Return where a sprite was packed.
+
+        Arguments:
+            name : any
+                sprite name
+
+        Returns:
+            page
+                surface containing the sprite
+            area
+                area of the page containing the sprite
+        """
+
+        index, rect = self.regions[name]
+
+        return self.pages[index], rect
+
+    def add_animation(self, name, num_frames: int):
+        """Register sprites named (name, 0), (name, 1), ... as the frames of an
+        animation.
+
+        Arguments:
+            name : any
+                animation name
+            num_frames
+                number of frames in the animation
+        """
+
+        self.animations[name] = num_frames
+
+    def get_animation(self, name) -> list[tuple[pg.Surface, pg.Rect]]:
+        """Return where every frame of an animation was packed.
+
+        Arguments:
+            name : any
+                animation name
+
+        Returns:
+            frames
+                page and area of each frame
+        """
+
+        return [self.get((name, i)) for i in range(self.animations[name])]
+
+    def add_resolution(self, name, res: int, animation_name):
+        """Register an animation as name drawn at a resolution.
+
+        Arguments:
+            name : any
+                name of what is drawn at different resolutions
+            res
+                width in pixels of the animation's frames
+            animation_name : any
+                animation name
+        """
+
+        self.resolutions.setdefault(name, {})[res] = animation_name
+
+    def get_resolution(self, name, size: int) -> tuple[int, str]:
+        """Return the animation of name with the smallest resolution that is at
+        least size, or the largest resolution if none are.
+
+        Arguments:
+            name : any
+                name of what is drawn at different resolutions
+            size
+                width in pixels it is drawn at on the screen
+
+        Returns:
+            res
+                chosen resolution
+            animation_name
+                animation at the chosen resolution
+        """
+
+        resolutions = self.resolutions[name]
+
+        large_enough = [res for res in resolutions if res >= size]
+        if len(large_enough) > 0:
+            res = min(large_enough)
+        else:
+            res = max(resolutions)
+
+        return res, resolutions[res]
+
+    def get_bytes(self) -> int:
+        """Return the number of bytes held by the pages' pixels.
+
+        Returns:
+            bytes
+                size of all pages in memory
+        """
+
+        return sum(page.get_pitch() * page.get_height() for page in self.pages)
@@ -30,6 +30,16 @@ class Background:
         self.pos_1 = [0, 0]
         self.pos_2 = [0, -self.img_height]
 
+    def get_pos(self) -> list[float]:
+        """Return the position of the first image.
+
+        Returns:
+            pos
+                top left of the first image on the screen
+        """
+
+        return self.pos_1
+
     def move(self, boat_vel: list[float]):
         """Move the two images based on the boat's vertical velocity."""
 
@@ -46,8 +56,13 @@ class Background:
             self.pos_1 = self.pos_2
             self.pos_2 = [0, -self.img_height]
 
-    def draw(self):
-        """Draw the two images on the screen."""
+    def draw(self) -> list[pg.Rect]:
+        """Draw the two images on the screen.
+
+        Returns:
+            rects
+                areas of the screen drawn on
+        """
 
-        self.screen.blit(self.img, self.pos_1)
-        self.screen.blit(self.img, self.pos_2)
+        return [self.screen.blit(self.img, self.pos_1),
+                self.screen.blit(self.img, self.pos_2)]
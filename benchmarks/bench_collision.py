@@ -0,0 +1,168 @@
+"""
+Micro-benchmark of the boat vs obstacle collision test. Compares the cost of
+one check with the separating axis test in collision.py and with the segment
+intersection test it replaced, and counts the collisions each one finds.
+
+Run from the repository's root directory:
+    python -m benchmarks.bench_collision [num_checks]
+"""
+
+# Import modules
+from collision import collide_rect_polygon, collide_rects_polygon, \
+    project_polygon
+import math
+import numpy as np
+import pygame as pg
+import random
+import sys
+import time
+
+# Hull of the boat at position (0, 0) pointing straight up, as in Boat
+HULL = [(0, -75), (25, -37), (25, 53), (16, 75), (-16, 75), (-25, 53),
+        (-25, -37)]
+
+# Sizes of the rock and log images
+OBSTACLE_SIZES = [(70, 66), (85, 51)]
+
+def collide_line_line(l1_p1, l1_p2, l2_p1, l2_p2):
+    # normalized direction of the lines and start of the lines
+    point_P  = pg.math.Vector2(*l1_p1)
+    line1_vec = pg.math.Vector2(*l1_p2) - point_P
+    point_R = line1_vec.normalize()
+    point_Q  = pg.math.Vector2(*l2_p1)
+    line2_vec = pg.math.Vector2(*l2_p2) - point_Q
+    point_S = line2_vec.normalize()
+
+    # normal vectors to the lines
+    RNV = pg.math.Vector2(point_R[1], -point_R[0])
+    SNV = pg.math.Vector2(point_S[1], -point_S[0])
+    RdotSVN = point_R.dot(SNV)
+    if RdotSVN == 0:
+        return False
+
+    # distance to the intersection point
+    QP  = point_Q - point_P
+    t = QP.dot(SNV) / RdotSVN
+    u = QP.dot(RNV) / RdotSVN
+
+    return t > 0 and u > 0 and t*t < line1_vec.magnitude_squared() and \
+        u*u < line2_vec.magnitude_squared()
+
+def collide_rect_line(rect, p1, p2):
+    return (collide_line_line(p1, p2, rect.topleft, rect.bottomleft) or
+            collide_line_line(p1, p2, rect.bottomleft, rect.bottomright) or
+            collide_line_line(p1, p2, rect.bottomright, rect.topright) or
+            collide_line_line(p1, p2, rect.topright, rect.topleft))
+
+def collide_rect_polygon_segments(rect, polygon):
+    """The segment intersection test that was used before collision.py."""
+
+    for i in range(len(polygon)-1):
+        if collide_rect_line(rect, polygon[i], polygon[i+1]):
+            return True
+    return False
+
+def get_boat_poly(pos: tuple[float], boat_dir: float) -> list[list[float]]:
+    """Return the boat's polygon the same way Boat does.
+
+    Arguments:
+        pos
+            the boat's position
+        boat_dir
+            the boat's direction in degrees
+
+    Returns:
+        poly_coords
+            the boat's polygon coordinates
+    """
+
+    boat_dir_rad = boat_dir * math.pi/180
+
+    return [[x * math.cos(boat_dir_rad) + y * math.sin(boat_dir_rad) + pos[0],
+             y * math.cos(boat_dir_rad) - x * math.sin(boat_dir_rad) + pos[1]]
+            for x, y in HULL]
+
+def gen_cases(num_checks: int) -> list[tuple]:
+    """Generate random boats and obstacles near each other.
+
+    Arguments:
+        num_checks
+            number of cases to generate
+
+    Returns:
+        cases
+            each case is (polygon, projection, center, half_size, rect)
+    """
+
+    cases = []
+    for _ in range(num_checks):
+        poly = get_boat_poly((random.uniform(300, 600),
+                              random.uniform(600, 800)),
+                             random.uniform(-60, 60))
+        w, h = random.choice(OBSTACLE_SIZES)
+        center = (random.uniform(250, 650), random.uniform(500, 900))
+
+        cases.append((poly, project_polygon(poly), center, (w/2, h/2),
+                      pg.Rect(center[0] - w/2, center[1] - h/2, w, h)))
+
+    return cases
+
+def time_checks(name: str, check, cases: list[tuple]) -> list[bool]:
+    """Time a collision test over every case and print its cost per check.
+
+    Arguments:
+        name
+            name of the test
+        check
+            function testing one case
+        cases
+            cases from gen_cases()
+
+    Returns:
+        hits
+            whether or not each case was found colliding
+    """
+
+    start = time.perf_counter()
+    hits = [check(*case) for case in cases]
+    elapsed = time.perf_counter() - start
+
+    print(f"{name:<24}{elapsed / len(cases) * 1e6:8.2f} us/check"
+          f"{sum(hits):8} hits")
+
+    return hits
+
+if __name__ == "__main__":
+    num_checks = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    random.seed(0)
+    cases = gen_cases(num_checks)
+
+    print(f"{num_checks} boat vs obstacle checks")
+    segments = time_checks(
+        "segment intersection",
+        lambda poly, projection, center, half_size, rect:
+            collide_rect_polygon_segments(rect, poly),
+        cases)
+    sat = time_checks(
+        "separating axis",
+        lambda poly, projection, center, half_size, rect:
+            collide_rect_polygon(center, half_size, projection),
+        cases)
+
+    # Every obstacle on the screen is tested against the boat in one call
+    projection = cases[0][1]
+    centers = np.array([case[2] for case in cases])
+    half_sizes = np.array([case[3] for case in cases])
+    start = time.perf_counter()
+    collide_rects_polygon(centers, half_sizes, projection)
+    elapsed = time.perf_counter() - start
+    print(f"{'separating axis, batch':<24}{elapsed / num_checks * 1e6:8.2f} "
+          f"us/check")
+
+    # The segment test misses shapes fully inside one another and the edge
+    # closing the boat's polygon; it also rounds hit boxes down to whole
+    # pixels, so a few grazing collisions are only found by it
+    only_sat = sum(s and not g for s, g in zip(sat, segments))
+    only_segments = sum(g and not s for s, g in zip(sat, segments))
+    print(f"{only_sat} collisions only found by the separating axis test, "
+          f"{only_segments} only by the segment intersection test")
@@ -0,0 +1,336 @@
+"""
+Benchmark of each stage of a frame of the game, run under the SDL dummy video
+driver so no window is opened. Every stage Game.run does per frame is timed
+separately with a configurable number of obstacles and coins on the screen,
+and the title screens are timed on their own. Results can be saved as JSON and
+compared against a saved baseline.
+
+Run from the repository's root directory:
+    python -m benchmarks.bench_frame [--counts 4 64 512] [--frames 600]
+        [--output results.json] [--baseline baseline.json]
+"""
+
+# Import modules
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+# No window is opened; must be set before the display is initialized
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from assets import assets
+from boat import Boat
+from coins import Coins
+from hud import Hud
+from obstacles import Obstacles
+import pygame as pg
+from render import Renderer
+from river import RiverStream
+
+# Same values as Game
+SCREEN_W = 900
+SCREEN_H = 900
+INIT_BOAT_POS = (450, 700)
+BOAT_SPEED = 5
+RIVER_EDGES = [300, 600]
+RIVER_LANES = [350, 450, 550]
+RIVER_COURSE = [("Images/river.png", (0, 450, 900, 450)),
+                ("Images/river.png", (0, 0, 900, 450)),
+                ("Images/river.png", (0, 1350, 900, 450)),
+                ("Images/river.png", (0, 900, 900, 450))]
+
+class StageTimer:
+    """StageTimer class. Collects how long each stage took in every frame."""
+
+    def __init__(self):
+        """Initialization method."""
+
+        # Time in seconds each stage took in every frame, keyed by stage name
+        self.samples = {}
+
+    def time(self, stage: str, func, *args):
+        """Call a function and record how long it took.
+
+        Arguments:
+            stage
+                name of the stage
+            func
+                function to call
+            args
+                arguments to call func with
+
+        Returns:
+            what func returns
+        """
+
+        start = time.perf_counter()
+        result = func(*args)
+        self.samples.setdefault(stage, []).append(time.perf_counter() - start)
+
+        return result
+
+    def get_stats(self) -> dict[str, dict[str, float]]:
+        """Return statistics of every stage in microseconds.
+
+        Returns:
+            stats
+                mean, median and 95th percentile of each stage
+        """
+
+        stats = {}
+        for stage, samples in self.samples.items():
+            samples = sorted(samples)
+            stats[stage] = {
+                "mean_us": statistics.fmean(samples) * 1e6,
+                "median_us": statistics.median(samples) * 1e6,
+                "p95_us": samples[int(.95 * (len(samples) - 1))] * 1e6}
+
+        return stats
+
+def fill_entities(obstacles: Obstacles, coins: Coins, count: int):
+    """Top up the obstacles and coins on the screen to count of each, spread
+    over the lanes above the highest one so they stay in spawn order.
+
+    Arguments:
+        obstacles
+            the obstacles
+        coins
+            the coins
+        count
+            number of obstacles and of coins to keep on the screen
+    """
+
+    # Vertical pixels between each entity so count of them fit on the screen
+    spacing = (SCREEN_H + 200) / count
+
+    for store in [obstacles.store, coins.store]:
+        while len(store) < count:
+            pos = store.get_pos()
+            y = pos[-1, 1] - spacing if len(pos) > 0 else SCREEN_H
+            lane = RIVER_LANES[len(store) % len(RIVER_LANES)]
+
+            if store is obstacles.store:
+                obstacles.spawn([lane, y], len(store) % len(obstacles.imgs))
+            else:
+                coins.spawn([lane + 25, y])
+
+def bench_game(screen: pg.Surface, count: int, frames: int) -> dict:
+    """Time every stage of a frame of the game, like Game.tick and Game.draw.
+
+    Arguments:
+        screen
+            pygame screen to draw on
+        count
+            number of obstacles and of coins on the screen
+        frames
+            number of frames to time
+
+    Returns:
+        stats
+            statistics of every stage; see StageTimer.get_stats()
+    """
+
+    renderer = Renderer(screen)
+    background = RiverStream(screen, RIVER_COURSE)
+    boat = Boat(screen, assets.get_image('Images/boat.png'), INIT_BOAT_POS,
+                BOAT_SPEED)
+    obstacles = Obstacles(screen, [assets.get_image('Images/rock.png'),
+                                   assets.get_image('Images/log.png')])
+    coins = Coins(screen)
+
+    hud = Hud(screen, font_size=30)
+    hud.add_field("score", "Score: ", (20, 20))
+    hud.add_field("highest_score", "Highest Score: ", (20, 70))
+    hud.add_field("coin_count", "Coins: ", (20, 120))
+
+    timer = StageTimer()
+    score = 0
+    for frame in range(frames):
+        fill_entities(obstacles, coins, count)
+
+        # Steer back and forth so the boat's direction keeps changing
+        turn_dir = "cc" if frame // 60 % 2 == 0 else "c"
+
+        # Simulation tick
+        timer.time("background.move", background.move, boat.get_vel())
+        timer.time("background.loop_imgs", background.loop_imgs)
+        timer.time("boat.update", boat.update, turn_dir, RIVER_EDGES)
+        timer.time("obstacles.update", obstacles.update, boat.get_vel(),
+                   SCREEN_H)
+        timer.time("coins.update", coins.update, boat.get_vel(), SCREEN_H)
+        timer.time("obstacles.is_colliding_boat",
+                   obstacles.is_colliding_boat, boat)
+        timer.time("coins.is_colliding_boat", coins.is_colliding_boat,
+                   boat.get_pos())
+        score += boat.get_vel()[1]
+
+        # Drawing, marking everything with the renderer like Game.draw
+        renderer.mark(background, timer.time("background.draw",
+                                             background.draw))
+        renderer.mark(boat, timer.time("boat.draw", boat.draw),
+                      boat.transparency)
+        renderer.mark(obstacles, timer.time("obstacles.draw",
+                                            obstacles.draw))
+        renderer.mark(coins, timer.time("coins.draw", coins.draw),
+                      coins.get_frames())
+
+        # Same as Game.display_score, display_highest_score and
+        # display_coin_count
+        def display_hud():
+            for name, value in [("score", score), ("highest_score", score),
+                                ("coin_count", frame // 100)]:
+                hud.set(name, value)
+                renderer.mark(("hud", name), hud.draw_field(name),
+                              hud.get_value(name))
+        timer.time("hud.display", display_hud)
+
+        timer.time("renderer.present", renderer.present)
+
+    return timer.get_stats()
+
+def bench_title(screen: pg.Surface, frames: int) -> dict:
+    """Time TitleScreen.display() on every screen that doesn't use the
+    database while it is displayed.
+
+    Arguments:
+        screen
+            pygame screen to draw on
+        frames
+            number of frames to time each screen
+
+    Returns:
+        stats
+            statistics of each screen, or None if TitleScreen can't be
+            imported because mysql-connector isn't installed
+    """
+
+    try:
+        from title import TitleScreen
+    except ImportError as error:
+        print(f"Skipping TitleScreen: {error}")
+        return None
+
+    renderer = Renderer(screen)
+    title_screen = TitleScreen(screen,
+                               assets.get_image('Images/river_blur.png'),
+                               None, renderer)
+
+    # User data as if it had already been read from the database
+    title_screen.un = "player"
+    title_screen.got_data_from_db = True
+    title_screen.highest_score, title_screen.coin_count = 1234, 56
+    title_screen.lb = [(f"player{i}", 100 * (8 - i)) for i in range(8)]
+    title_screen.rank = 3
+
+    timer = StageTimer()
+    for name in ["login", "main", "leaderboard", "rules"]:
+        title_screen.displaying_screen = name
+        if name != "login":
+            getattr(title_screen, f"init_{name}_screen")()
+
+        for _ in range(frames):
+            timer.time(f"title.{name}", title_screen.display)
+            timer.time(f"title.{name}.present", renderer.present)
+
+    return timer.get_stats()
+
+def compare(results: dict, baseline: dict, threshold: float) -> bool:
+    """Print how much the median of every stage changed from a baseline.
+
+    Arguments:
+        results
+            results of this run
+        baseline
+            results of an earlier run
+        threshold
+            fraction a median can grow by before it is a regression
+
+    Returns:
+        whether or not no stage regressed
+    """
+
+    passed = True
+    for group, stats in results["results"].items():
+        for stage, stat in stats.items():
+            base = baseline["results"].get(group, {}).get(stage)
+            if base is None:
+                continue
+
+            change = stat["median_us"] / base["median_us"] - 1
+            regressed = change > threshold
+            passed = passed and not regressed
+
+            print(f"{group:>8} {stage:<32}{base['median_us']:10.1f}"
+                  f"{stat['median_us']:10.1f}{change:+9.1%}"
+                  f"{'  REGRESSION' if regressed else ''}")
+
+    return passed
+
+def print_results(results: dict):
+    """Print the results of a run.
+
+    Arguments:
+        results
+            results of a run
+    """
+
+    print(f"{'':>8} {'stage':<32}{'mean':>10}{'median':>10}{'p95':>10}  us")
+    for group, stats in results["results"].items():
+        for stage, stat in stats.items():
+            print(f"{group:>8} {stage:<32}{stat['mean_us']:10.1f}"
+                  f"{stat['median_us']:10.1f}{stat['p95_us']:10.1f}")
+
+def main() -> int:
+    """Run the benchmarks.
+
+    Returns:
+        exit code; 1 if a stage regressed from the baseline
+    """
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--counts", type=int, nargs="+", default=[4, 64, 512],
+                        help="numbers of obstacles and of coins on the "
+                             "screen to benchmark the game with")
+    parser.add_argument("--frames", type=int, default=600,
+                        help="number of frames to time for each count")
+    parser.add_argument("--output", metavar="PATH",
+                        help="save the results as JSON to PATH")
+    parser.add_argument("--baseline", metavar="PATH",
+                        help="compare the results with ones saved to PATH")
+    parser.add_argument("--threshold", type=float, default=.1,
+                        help="fraction a stage's median can grow by before "
+                             "it counts as a regression")
+    args = parser.parse_args()
+
+    pg.init()
+    screen = pg.display.set_mode([SCREEN_W, SCREEN_H])
+
+    results = {"frames": args.frames, "results": {}}
+    for count in args.counts:
+        results["results"][str(count)] = bench_game(screen, count,
+                                                    args.frames)
+    title_stats = bench_title(screen, args.frames)
+    if title_stats is not None:
+        results["results"]["title"] = title_stats
+
+    print_results(results)
+
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline is not None:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+        print(f"\n{'':>8} {'stage':<32}{'baseline':>10}{'median':>10}"
+              f"{'change':>9}")
+        if not compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
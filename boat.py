@@ -4,14 +4,24 @@ the game.
 """
 
 # Import modules
-import math
+from kinematics import Kinematics
 import pygame as pg
 
 class Boat:
     """Boat class."""
 
+    # Pre determined coordinates of the polygon when the boat is in the 
+    # position (0, 0)
+    HULL = [(0, -75), (25, -37), (25, 53), (16, 75), (-16, 75), (-25, 53), 
+            (-25, -37)]
+
+    # Rotated boat images shared by every boat, keyed by (img, angle_res, 
+    # rounded angle); each value is the rotated image and the offset from the 
+    # boat's position to the top left of the rotated image
+    rotation_cache = {}
+
     def __init__(self, screen: pg.surface, img: pg.image, 
-                 init_pos: tuple[int], speed: int):
+                 init_pos: tuple[int], speed: int, angle_res=1.0):
         """Initialization method.
         
         Arguments:
@@ -24,29 +34,39 @@ class Boat:
             speed
                 the boat's constant speed throughout the game
                 NOTE: speed is the magnitude of its velocity vector
+            angle_res : float
+                angular resolution in degrees of the rotated images used to 
+                draw the boat
         """
         
         self.screen = screen
         self.img = img
         self.pos = list(init_pos)
         self.speed = speed
+        self.angle_res = angle_res
 
         # Angle at which boat is pointing; 0 is straight up, 90 is to the left
         self.boat_dir = 0
 
+        # Places the boat's polygon at its position and direction, caching the
+        # trigonometry of every direction
+        self.kinematics = Kinematics(Boat.HULL)
+
         # Boat's velocity vector
         self.vel = []
         # Set the boat's initial velocity
         self.update_vel()
 
-        # Coordinates that represent the boat as a polygon by mapping out its
-        # vertices; represents its hit box
-        self.poly_coords = []
         # Set the boat's initial poly coords
         self.update_poly_coords()
 
         # THe boat image's alpha value or transparency
         self.transparency = 255 # 0 (fully) - 255 (opaque)
+
+        # Position and direction before the last update; the boat is drawn
+        # between them and the current ones
+        self.prev_pos = list(self.pos)
+        self.prev_boat_dir = self.boat_dir
     
     def get_vel(self) -> list[float]:
         """Return the boat's velocity vector.
@@ -68,6 +88,9 @@ class Boat:
                 x-coords of the left and right of the river
         """
 
+        self.prev_pos = list(self.pos)
+        self.prev_boat_dir = self.boat_dir
+
         self.update_vel()
         self.update_boat_dir(turn_dir)
         self.update_pos(river_edges)
@@ -77,9 +100,11 @@ class Boat:
         """Update the boat's velocity vector."""
 
         # Determine the components of the velocity vector based on the boat 
-        # direction and the speed (the magnitude of the vector)
-        vel_x = self.speed * math.cos((self.boat_dir + 90) * math.pi/180)
-        vel_y = self.speed * math.sin((self.boat_dir + 90)  * math.pi/180)
+        # direction and the speed (the magnitude of the vector); 
+        # cos(dir + 90) = -sin(dir) and sin(dir + 90) = cos(dir)
+        sin, cos = self.kinematics.get_trig(self.boat_dir)
+        vel_x = -self.speed * sin
+        vel_y = self.speed * cos
 
         self.vel = [vel_x, vel_y]
     
@@ -130,38 +155,46 @@ class Boat:
     def update_poly_coords(self):
         """Update the boat's polygon coordinates"""
 
-        # Convert the boat's direction from degrees to radians
-        boat_dir_rad = self.boat_dir * math.pi/180
+        # The polygon and its projection for collision tests are cached for 
+        # each direction, and only moved to the boat's position when they are 
+        # asked for
+        self.kinematics.place(self.boat_dir, self.pos)
 
-        # Pre determined coordinates of the polygon when the baot is in the 
-        # position (0, 0)
-        points = [(0, -75), (25, -37), (25, 53), (16, 75), (-16, 75), 
-                  (-25, 53), (-25, -37)]
-        
-        # Reset poly coords
-        self.poly_coords = []
-
-        # Calculate each vertix of the polygon and append it to poly_coords
-        for point in points:
-            x = (point[0]) * math.cos(boat_dir_rad) + \
-                (point[1]) * math.sin(boat_dir_rad) + \
-                self.pos[0]
-            y = (point[1]) * math.cos(boat_dir_rad) - \
-                (point[0]) * math.sin(boat_dir_rad) + \
-                self.pos[1]
-
-            self.poly_coords.append([x, y])
-
-    def get_poly_coords(self) -> list[list[float]]:
-        """Return poly_coords.
+    def get_poly_coords(self) -> list[tuple[float]]:
+        """Return the boat's polygon coordinates, which represent its hit box
+        by mapping out its vertices.
         
         Returns:
             poly_coords
-                the boat's polygon coordinates
+                the boat's polygon coordinates; [(x, y), ...]
         """
 
-        return self.poly_coords
+        return self.kinematics.get_poly()
     
+    def get_poly_bounds(self) -> tuple[tuple[float]]:
+        """Return the bounding box of the boat's polygon.
+
+        Returns:
+            min_pos
+                top left of the bounding box; (x, y)
+            max_pos
+                bottom right of the bounding box; (x, y)
+        """
+
+        return self.kinematics.get_bounds()
+
+    def get_poly_projection(self) -> tuple[list]:
+        """Return the boat's polygon projected onto the axes that can separate
+        it from an obstacle; see collision.project_polygon().
+
+        Returns:
+            poly_projection
+                axes, and the polygon's smallest and largest projection onto 
+                each
+        """
+
+        return self.kinematics.get_projection()
+
     def get_pos(self) -> list[float]:
         """Return the boat's position.
 
@@ -195,29 +228,74 @@ class Boat:
             return True
         return False
 
-    def draw(self):
-        """Draw the boat on the screen."""
+    def get_rotated_img(self, angle: float) -> tuple[pg.Surface, tuple]:
+        """Return the boat image rotated to angle, rounded to angle_res, and 
+        its offset, rotating the image only the first time the rounded angle is
+        requested.
+        
+        Arguments:
+            angle
+                angle in degrees to rotate the boat image by
+
+        Returns:
+            rotated_img
+                rotated boat image
+            offset
+                offset from the boat's position to the top left of rotated_img
+        """
+
+        # Round the angle to the nearest multiple of angle_res
+        step = round(angle / self.angle_res)
+        key = (self.img, self.angle_res, step)
+
+        if key not in Boat.rotation_cache:
+            rotated_img = pg.transform.rotozoom(self.img, 
+                                                step * self.angle_res, 1)
+
+            # Translate iamge to ensure the rotated image is positioned 
+            # correctly
+            offset = (-rotated_img.get_size()[0] / 2, 
+                      -rotated_img.get_size()[1] / 2)
 
-        # Retrieve x and y coords
-        x = self.pos[0]
-        y = self.pos[1]
+            Boat.rotation_cache[key] = (rotated_img, offset)
 
-        # Rotate image based on boat_dir
-        rotated_img = pg.transform.rotozoom(self.img, self.boat_dir, 1)
+        return Boat.rotation_cache[key]
 
-        # Translate iamge to ensure the rotated image is positioned correctly
-        x -= rotated_img.get_size()[0] / 2
-        y -= rotated_img.get_size()[1] / 2
+    def draw(self, alpha=1.0) -> pg.Rect:
+        """Draw the boat on the screen.
+        
+        Arguments:
+            alpha : float
+                fraction of the way from the previous update to the current one
+                to draw the boat at
+
+        Returns:
+            rect
+                area of the screen drawn on
+        """
+
+        # Interpolate between the previous and current position and direction
+        x = self.prev_pos[0] + (self.pos[0] - self.prev_pos[0]) * alpha
+        y = self.prev_pos[1] + (self.pos[1] - self.prev_pos[1]) * alpha
+        boat_dir = self.prev_boat_dir + \
+            (self.boat_dir - self.prev_boat_dir) * alpha
+
+        # Rotated image based on boat_dir
+        rotated_img, offset = self.get_rotated_img(boat_dir)
 
         # Set the boat's transparency (or alpha) value
+        # NOTE: the rotated image is shared, so the alpha is set on every draw;
+        # this only changes a flag and doesn't copy the image
         rotated_img.set_alpha(self.transparency)
 
-        self.screen.blit(rotated_img, (x, y)) 
+        rect = self.screen.blit(rotated_img, (x + offset[0], y + offset[1])) 
 
         # Draw the polygon coordinates
         # NOTE: used for debugging
         # self.draw_poly_points()
 
+        return rect
+
     def draw_poly_points(self):
-        for dot in self.poly_coords:
+        for dot in self.get_poly_coords():
             pg.draw.circle(self.screen, (255, 0, 0), dot, 5)
\ No newline at end of file
@@ -56,23 +56,30 @@ class Button:
         # Whether or not the button is pressed
         self.pressed = False
 
-    def draw(self):
-        """Draw the button and the text inside it."""
+    def draw(self) -> pg.Rect:
+        """Draw the button and the text inside it.
+        
+        Returns:
+            rect
+                area of the screen drawn on
+        """
+
+        rect = self.draw_bg()
+        text_rect = self.draw_text()
 
-        self.draw_bg()
-        self.draw_text()
+        return rect.union(text_rect)
 
-    def draw_bg(self):
+    def draw_bg(self) -> pg.Rect:
         """Draw the button background."""
 
         # pos_x, pos_y, width, height
         rect = [self.pos[0] - self.dims[0]/2, self.pos[1] - self.dims[1]/2,
                 self.dims[0], self.dims[1]]
 
-        pg.draw.rect(self.screen, self.bg_color, 
-                     rect, border_radius=self.border_radius)
+        return pg.draw.rect(self.screen, self.bg_color, 
+                            rect, border_radius=self.border_radius)
 
-    def draw_text(self):
+    def draw_text(self) -> pg.Rect:
         """Draw the button text."""
 
         # Render the text as a pygame surface
@@ -83,7 +90,7 @@ class Button:
         label_top_left_pos = (self.pos[0] - label_size[0]/2, 
                               self.pos[1] - label_size[1]/2)
         
-        self.screen.blit(label, label_top_left_pos)
+        return self.screen.blit(label, label_top_left_pos)
 
     def press(self):
         """Press the button."""
@@ -3,57 +3,54 @@ A Coins class to represent all of the coins displayed on the screen.
 """
 
 # Import modules
+from assets import assets
+from entities import EntityStore
+import numpy as np
 import pygame as pg
-import random
-from coin import Coin
 
 class Coins:
-    """Coins class."""
+    """Coins class. The coins are stored as arrays in an EntityStore so they
+    are moved, animated and culled all at once."""
 
-    def __init__(self, screen: pg.surface, animation_dir: str):
+    def __init__(self, screen: pg.surface, coin_size=64, 
+                 animation_speed=.1):
         """Initialization method.
         
         Arguments:
             screen
                 pygame screen to display contents
-            animation_dir
-                directory containing all of the images needed to animate coins
+            coin_size : int
+                width in pixels of the coins on the screen; the coin animation
+                with the closest resolution at least as large is used
+            animation_speed : float
+                animation frames advanced by every coin each update
         """
 
         self.screen = screen
-        self.animation_dir = animation_dir
 
-        # List to store all coins
-        self.coins = []
+        # Directory containing all of the images needed to animate coins at 
+        # the chosen resolution
+        _, self.animation_dir = \
+            assets.get_coin_atlas().get_resolution("coin", coin_size)
 
-    def gen_new_coin(self, 
-                     dist_btwn_coins: int, 
-                     river_lanes: list[int], 
-                     obstacles: list):
-        """Generate a new coin.
-        
-        Arguments:
-            dist_btwn_coins
-                the minimum number of vertical pixels between each coin
-            river_lanes
-                middle x-coords of the three lanes in the river
-            obstacles
-                contains all obstacles currently on the screen
-        """
+        self.animation_speed = animation_speed
 
-        # Check if enough distance between last coin
-        if len(self.coins) == 0 or self.coins[-1].pos[1] >= dist_btwn_coins:
-            # Generate random lane number
-            randLane = random.randint(0, 2)
+        # Where each animation frame is in the coin atlas
+        self.frames = assets.get_coin_atlas().get_animation(self.animation_dir)
 
-            # Place coin off of screen in the random lane
-            pos = [river_lanes[randLane], -100]
+        # Positions and animation counters of all coins, in the order they 
+        # were generated
+        self.store = EntityStore()
 
-            # Only generate a coin if there are no obstacles taking its spot
-            if abs(pos[1] - obstacles[-1].pos[1]) > 300 and \
-                pos[0] != obstacles[-1].pos[0]:
+    def spawn(self, pos: list[float]):
+        """Add a coin.
+
+        Arguments:
+            pos
+                coin position; [pos_x, pos_y]
+        """
 
-                self.coins.append(Coin(self.screen, pos, self.animation_dir))
+        self.store.spawn(pos)
 
     def update(self, boat_vel: list[float], SCREEN_H: int):
         """Update every coin's position.
@@ -65,20 +62,17 @@ class Coins:
                 screen height in pixels
         """
 
-        # NOTE: using a while loop instead of a for loop due to removing from
-        # array in the middle of loop
-        count = 0
-        while count < len(self.coins):
-            coin = self.coins[count]
-            # Move the coin based on the boat's velocity -> in sync with 
-            # background and obstacles
-            coin.move(boat_vel)
-
-            # If the coin is out of the screen, remove it from the list
-            if coin.pos[1] > SCREEN_H + 50:
-                self.coins.remove(coin)
-                count += 1
-            count += 1
+        # Move every coin based on the boat's velocity -> in sync with 
+        # background and obstacles
+        self.store.move(boat_vel[1])
+
+        # Go to the next animation frame at a constant rate
+        counters = self.store.get_counters()
+        counters += self.animation_speed
+        np.round(counters, 1, out=counters)
+
+        # Remove every coin that is out of the screen
+        self.store.cull(SCREEN_H + 50)
 
     def is_colliding_boat(self, boat_pos: list[float, float]) -> bool:
         """Check whether or not the boat has collided (picked up) a coin.
@@ -94,20 +88,53 @@ class Coins:
         # Distance between boat_pos and coin_pos for collision to occur
         r = 50
 
-        for coin in self.coins:
-            # Only collide if coin on screen and is close enough to boat
-            if coin.on_screen and \
-                abs(boat_pos[0] - coin.pos[0]) < r and \
-                    abs(boat_pos[1] - coin.pos[1]) < r:
-                
-                coin.on_screen = False
-                self.coins.remove(coin)
-                
+        # Only coins in the square around the boat need checking
+        boat_pos = np.asarray(boat_pos, dtype=float)
+        rows = self.store.query(boat_pos - r, boat_pos + r)
+
+        for row in rows:
+            # The square includes its edges but collisions don't
+            dist = np.abs(self.store.get_pos()[row] - boat_pos)
+            # Only the first coin close enough is picked up
+            if (dist < r).all():
+                self.store.kill(row)
                 return True
         return False
         
-    def draw(self):
-        """Draw each coin on the screen."""
+    def draw(self, offset=0.0) -> list[pg.Rect]:
+        """Draw each coin on the screen.
+        
+        Arguments:
+            offset : float
+                vertical offset from the coins' positions to draw them at
+
+        Returns:
+            rects
+                areas of the screen drawn on
+        """
+
+        blits = []
+        for pos, frame in zip(self.store.get_pos(), self.get_frames()):
+            # Current animation frame
+            page, area = self.frames[frame]
+
+            # Determine the top left coords
+            x = pos[0] - area.width/2
+            y = pos[1] - area.height/2 + offset
+
+            blits.append((page, (x, y), area))
+
+        # Every coin is drawn from the same few atlas pages in one call
+        return self.screen.blits(blits)
+
+    def get_frames(self) -> list[int]:
+        """Return the animation frame each coin is showing.
+        
+        Returns:
+            frames
+                animation frame numbers
+        """
+
+        frames = self.store.get_counters().astype(int) % len(self.frames)
 
-        for coin in self.coins:
-            coin.draw()
\ No newline at end of file
+        return frames.tolist()
\ No newline at end of file
@@ -0,0 +1,126 @@
+"""
+Collision tests between the boat, a convex polygon, and obstacles, axis-aligned
+rectangles, using the separating axis theorem.
+
+Two convex shapes don't overlap if and only if there is an axis their
+projections don't overlap on. For a polygon and rectangles, the only axes that
+need checking are the x and y axes and the normals of the polygon's edges.
+Unlike testing whether any edges cross, this also catches one shape being fully
+inside the other.
+"""
+
+# Import modules
+import numpy as np
+
+def get_edge_normals(polygon) -> np.ndarray:
+    """Return the normals of every edge of a polygon, including the edge from
+    its last vertex back to its first. They are not normalized since only the
+    order of projections onto them is compared.
+
+    Arguments:
+        polygon : list[list[float]] or np.ndarray
+            vertices of the polygon; [[x, y], ...]
+
+    Returns:
+        normals
+            one normal per edge; [[n_x, n_y], ...]
+    """
+
+    polygon = np.asarray(polygon, dtype=float)
+
+    # Edge vectors from each vertex to the next one
+    edges = np.roll(polygon, -1, axis=0) - polygon
+
+    # Rotate each edge by 90 degrees
+    return np.column_stack((edges[:, 1], -edges[:, 0]))
+
+def project_polygon(polygon, normals=None) -> tuple[np.ndarray]:
+    """Project a convex polygon onto every axis that can separate it from a
+    rectangle. This only depends on the polygon, so it is done once per
+    polygon rather than once per rectangle tested.
+
+    Arguments:
+        polygon : list[list[float]] or np.ndarray
+            vertices of the convex polygon in order; [[x, y], ...]
+        normals : np.ndarray
+            edge normals of the polygon from get_edge_normals(); computed if
+            None
+
+    Returns:
+        axes
+            the x and y axes followed by the polygon's edge normals
+        mins
+            smallest projection of the polygon onto each axis
+        maxs
+            largest projection of the polygon onto each axis
+    """
+
+    polygon = np.asarray(polygon, dtype=float)
+    if normals is None:
+        normals = get_edge_normals(polygon)
+
+    axes = np.vstack(([[1.0, 0.0], [0.0, 1.0]], normals))
+    projections = polygon @ axes.T
+
+    return axes, projections.min(axis=0), projections.max(axis=0)
+
+def collide_rects_polygon(centers: np.ndarray,
+                          half_sizes: np.ndarray,
+                          projection: tuple[np.ndarray]) -> np.ndarray:
+    """Determine which rectangles overlap a convex polygon, all at once.
+    Touching edges don't count as overlapping.
+
+    Arguments:
+        centers
+            center of each rectangle; [[x, y], ...]
+        half_sizes
+            half the width and height of each rectangle; [[w/2, h/2], ...]
+        projection
+            the polygon's axes and extents from project_polygon(), as arrays
+            or lists
+
+    Returns:
+        colliding
+            whether or not each rectangle overlaps the polygon
+    """
+
+    axes, mins, maxs = (np.asarray(part, dtype=float) for part in projection)
+
+    # A rectangle projects onto an axis as its center's projection plus or
+    # minus its projected half size
+    center_proj = centers @ axes.T
+    radius = half_sizes @ np.abs(axes).T
+
+    return ((center_proj - radius < maxs) &
+            (center_proj + radius > mins)).all(axis=1)
+
+def collide_rect_polygon(center, half_size, projection) -> bool:
+    """Determine whether or not one rectangle overlaps a convex polygon.
+    Touching edges don't count as overlapping.
+
+    Arguments:
+        center : list[float]
+            center of the rectangle; [x, y]
+        half_size : list[float]
+            half the width and height of the rectangle; [w/2, h/2]
+        projection : tuple[np.ndarray]
+            the polygon's axes and extents from project_polygon()
+
+    Returns:
+        whether or not the rectangle overlaps the polygon
+    """
+
+    x, y = center
+    w, h = half_size
+    axes, mins, maxs = projection
+
+    # Plain floats are faster than arrays for a single rectangle
+    for (a_x, a_y), lo, hi in zip(axes.tolist(), mins.tolist(),
+                                  maxs.tolist()):
+        center_proj = x * a_x + y * a_y
+        radius = w * abs(a_x) + h * abs(a_y)
+
+        # Stop at the first separating axis
+        if center_proj + radius <= lo or center_proj - radius >= hi:
+            return False
+    return True
@@ -4,15 +4,25 @@ stores all user data.
 """
 
 # Import modules
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 import mysql.connector
-import pandas as pd
-
-# Remove warning from pandas regarding mysql module
+from tracing import tracer
 import warnings
-warnings.simplefilter(action="ignore", category=UserWarning)
 
 class Database:
-    """Database class."""
+    """Database class. Every call is recorded as a span while tracing is
+    on.
+
+    Calls can be submitted to the worker thread instead of being made
+    directly, so the game keeps running while they wait on the network; their
+    results, or the errors they raised, are handed back on the main thread by
+    poll(). The connection is not thread-safe, so while any request is 
+    pending, every call must be submitted."""
+
+    # Worker thread shared by every database; it makes one call at a time in
+    # the order they were submitted
+    worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="database")
 
     def __init__(self, 
                  host: str, 
@@ -44,6 +54,60 @@ class Database:
         # Cursor to exucute SQL statements to manage database
         self.cursor = self.connection.cursor(named_tuple = True)
 
+        # Requests submitted to the worker thread whose results haven't been
+        # handed back yet, in the order they were submitted; each one is
+        # (future, on_result, on_error)
+        self.pending = deque()
+
+    def submit(self, func, *args, on_result=None, on_error=None) -> Future:
+        """Make a call on the worker thread without waiting for it.
+        
+        Arguments:
+            func : function
+                what to call, e.g. a Database method or a function making 
+                several calls
+            args
+                arguments to call func with
+            on_result : function
+                called with what func returns on the main thread by poll()
+            on_error : function
+                called with the exception instead if func raised one; it is
+                only warned about if None
+        
+        Returns:
+            future
+                resolves to what func returns
+        """
+
+        future = Database.worker.submit(func, *args)
+        self.pending.append((future, on_result, on_error))
+
+        return future
+
+    def poll(self):
+        """Hand back the results of the requests that have finished, in the
+        order they were submitted. Call on the main thread every frame; a
+        request that failed, e.g. because the connection dropped, never 
+        raises here."""
+
+        while len(self.pending) > 0 and self.pending[0][0].done():
+            future, on_result, on_error = self.pending.popleft()
+
+            # Raises here if the call raised on the worker thread
+            try:
+                result = future.result()
+            except Exception as error:
+                tracer.instant("request failed", "db", {"error": str(error)})
+                if on_error is not None:
+                    on_error(error)
+                else:
+                    warnings.warn(f"Database request failed: {error}")
+                continue
+
+            if on_result is not None:
+                on_result(result)
+
+    @tracer.traced("db")
     def get_column_names(self, table_name: str) -> list[str]:
         """Return all column names for a given table.
         
@@ -56,17 +120,14 @@ class Database:
                 column names
         """
 
-        # SQL query to pass to database
-        sql = f"SHOW COLUMNS FROM {table_name}"
+        self.cursor.execute(f"SHOW COLUMNS FROM {table_name}")
 
-        # Read sql query as a pandas dataframe
-        result = pd.read_sql_query(sql, self.connection)
-
-        # Parse the column names from the dataframe
-        column_names = list(result["Field"])
+        # Each row describes one column, in order
+        column_names = [column.Field for column in self.cursor.fetchall()]
 
         return column_names
 
+    @tracer.traced("db")
     def add_data(self, table_name: str, data: list):
         """Add a row of data to a table.
         
@@ -89,6 +150,7 @@ class Database:
         
         self.execute_sql(sql, data)
     
+    @tracer.traced("db")
     def update_cell(self, 
                     table_name: str, 
                     id: int, 
@@ -113,6 +175,7 @@ class Database:
         
         self.execute_sql(sql)
     
+    @tracer.traced("db")
     def update_cells(self, 
                      table_name: str, 
                      id: int, 
@@ -150,6 +213,7 @@ class Database:
 
         self.execute_sql(sql)
 
+    @tracer.traced("db")
     def execute_sql(self, sql: str, data=None):
         """Execute a SQL statement.
         
@@ -167,22 +231,169 @@ class Database:
             self.cursor.execute(sql)
             self.connection.commit()
     
-    def get_table(self, table_name: str) -> pd.DataFrame:
-        """Return contents of a table.
+    @tracer.traced("db")
+    def add_index(self, table_name: str, column_name: str, unique=False):
+        """Add an index named {column_name}_index on a column of a table if 
+        the column doesn't have one yet, so rows can be looked up by it 
+        without reading the whole table. Failing to add it only warns.
+
+        NOTE: changes the table's schema; only run by setup_database.py, not
+        by the game
+        
+        Arguments:
+            table_name
+                table name
+            column_name
+                column name
+            unique : bool
+                whether or not values in the column must be unique; if the
+                column already has duplicate values, a non-unique index is
+                added instead
+        """
+
+        index_name = f"{column_name}_index"
+
+        # Indexes starting with the column, and any index already added with
+        # the same name, e.g. a non-unique one added because of duplicate 
+        # values
+        self.cursor.execute(f"SHOW INDEX FROM {table_name}")
+        indexes = [index for index in self.cursor.fetchall()
+                   if index.Key_name == index_name or 
+                   (index.Column_name == column_name and 
+                    index.Seq_in_index == 1)]
+
+        if any(index.Key_name == index_name or not unique or 
+               index.Non_unique == 0 for index in indexes):
+            return
+
+        try:
+            self.execute_sql(f"CREATE {'UNIQUE ' if unique else ''}INDEX \
+                             {index_name} ON {table_name} ({column_name})")
+            return
+        except mysql.connector.IntegrityError:
+            warnings.warn(f"{table_name}.{column_name} has duplicate values; "
+                          f"adding a non-unique index")
+        except mysql.connector.Error as error:
+            warnings.warn(f"Couldn't add {index_name}: {error}")
+            return
+
+        # The column already has a non-unique index
+        if len(indexes) > 0:
+            return
+
+        try:
+            self.execute_sql(f"CREATE INDEX {index_name} ON {table_name} \
+                             ({column_name})")
+        except mysql.connector.Error as error:
+            warnings.warn(f"Couldn't add {index_name}: {error}")
+
+    @tracer.traced("db")
+    def get_row(self, 
+                table_name: str, 
+                key_column: str, 
+                key, 
+                column_names: list[str]):
+        """Return some columns of the row of a table with a key, e.g. a 
+        user's row by username. Only that row is read if key_column is
+        indexed.
+        
+        Arguments:
+            table_name
+                table name
+            key_column
+                column to look the row up by
+            key : any
+                value of key_column in the row
+            column_names
+                columns to return
+        
+        Returns:
+            row
+                named tuple of the columns, or None if no row has the key
+        """
+
+        sql = f"SELECT {', '.join(column_names)} FROM {table_name} WHERE \
+                {key_column} = %s LIMIT 1"
+
+        self.cursor.execute(sql, (key,))
+        rows = self.cursor.fetchall()
+
+        return rows[0] if len(rows) > 0 else None
+
+    @tracer.traced("db")
+    def get_max(self, table_name: str, column_name: str):
+        """Return the largest value in a column of a table, e.g. the last 
+        id; it is read straight from the index if the column is indexed.
         
         Arguments:
             table_name
                 table name
+            column_name
+                column name
         
         Returns:
-            result
-                table as a pandas dataframe
+            max : any
+                largest value, or None if the table is empty
         """
 
-        sql = f"SELECT * FROM {table_name}"
+        self.cursor.execute(f"SELECT MAX({column_name}) AS max_val FROM \
+                            {table_name}")
+
+        return self.cursor.fetchall()[0].max_val
 
-        result = pd.read_sql_query(sql, self.connection)
+    @tracer.traced("db")
+    def get_top_rows(self, 
+                     table_name: str, 
+                     order_column: str, 
+                     column_names: list[str], 
+                     n: int) -> list:
+        """Return some columns of the rows of a table with the largest values
+        in a column, e.g. the highest scores. Only those rows are read if 
+        order_column is indexed.
+        
+        Arguments:
+            table_name
+                table name
+            order_column
+                column to order the rows by
+            column_names
+                columns to return
+            n
+                number of rows to return
+        
+        Returns:
+            rows
+                named tuples of the columns, from the largest value of 
+                order_column down
+        """
+
+        sql = f"SELECT {', '.join(column_names)} FROM {table_name} ORDER BY \
+                {order_column} DESC LIMIT %s"
+
+        self.cursor.execute(sql, (n,))
+
+        return self.cursor.fetchall()
+
+    @tracer.traced("db")
+    def get_rank(self, table_name: str, column_name: str, value) -> int:
+        """Return the rank of a value among the values in a column of a 
+        table, e.g. of a user's score among all scores; only the rows with 
+        larger values are counted if the column is indexed.
+        
+        Arguments:
+            table_name
+                table name
+            column_name
+                column name
+            value : any
+                value to rank
+        
+        Returns:
+            rank
+                1 + the number of rows with a larger value
+        """
 
-        return result
+        self.cursor.execute(f"SELECT COUNT(*) AS num_larger FROM \
+                            {table_name} WHERE {column_name} > %s", (value,))
 
-        
\ No newline at end of file
+        return self.cursor.fetchall()[0].num_larger + 1
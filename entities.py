@@ -0,0 +1,208 @@
+"""
+An EntityStore class to store many game objects of the same kind as arrays so
+they can all be moved and culled at once.
+"""
+
+# Import modules
+import numpy as np
+
+class EntityStore:
+    """EntityStore class. Each entity is a row in every array; the entities in
+    the game are a window of consecutive rows kept in the order they were
+    spawned. Entities are spawned no lower than the ones before them and all
+    move by the same amount, so the rows are also in order of decreasing y,
+    which culling and queries rely on.
+
+    Rows outside the window are a pool of free rows. Culling only moves the
+    start of the window and spawning fills the row after its end; once the
+    window reaches the end of the arrays, it is moved back to the start to
+    reuse the culled rows instead of growing, so nothing is allocated once the
+    arrays are large enough."""
+
+    # Names of every array with one row per entity
+    ARRAYS = ("pos", "type_ids", "counters")
+
+    def __init__(self, capacity=16):
+        """Initialization method.
+
+        Arguments:
+            capacity : int
+                number of entities to make room for; doubles when full
+        """
+
+        # Position of each entity; [pos_x, pos_y]
+        self.pos = np.zeros((capacity, 2))
+
+        # Type of each entity, e.g. which obstacle image it uses
+        self.type_ids = np.zeros(capacity, dtype=np.int32)
+
+        # Animation counter of each entity
+        self.counters = np.zeros(capacity)
+
+        # First row of the window and number of rows in it
+        self.first = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        """Return the number of entities."""
+
+        return self.count
+
+    def get_arrays(self) -> list[np.ndarray]:
+        """Return every array with one row per entity."""
+
+        return [getattr(self, name) for name in self.ARRAYS]
+
+    def make_room(self):
+        """Make room for an entity after the end of the window, either by
+        moving the window back to the start of the arrays or, if more than
+        half of the rows are in use, by doubling the capacity."""
+
+        capacity = len(self.pos)
+        window = slice(self.first, self.first + self.count)
+
+        if 2 * self.count <= capacity:
+            # Culled rows are at the start; the window can't overlap where it
+            # is moved to since it takes at most half of the rows
+            for array in self.get_arrays():
+                array[:self.count] = array[window]
+        else:
+            for name, old in zip(self.ARRAYS, self.get_arrays()):
+                new = np.zeros((2 * capacity,) + old.shape[1:],
+                               dtype=old.dtype)
+                new[:self.count] = old[window]
+                setattr(self, name, new)
+
+        self.first = 0
+
+    def spawn(self, pos: list[float], type_id=0) -> int:
+        """Add an entity.
+
+        Arguments:
+            pos
+                entity position; [pos_x, pos_y]
+            type_id : int
+                entity type
+
+        Returns:
+            row
+                row of the new entity in the window
+        """
+
+        if self.first + self.count == len(self.pos):
+            self.make_room()
+
+        row = self.first + self.count
+        self.pos[row] = pos
+        self.type_ids[row] = type_id
+        self.counters[row] = 0
+        self.count += 1
+
+        return self.count - 1
+
+    def move(self, vel_y: float):
+        """Move every entity vertically.
+
+        Arguments:
+            vel_y
+                vertical distance to move by
+        """
+
+        self.pos[self.first:self.first + self.count, 1] += vel_y
+
+    def kill(self, row: int):
+        """Remove an entity.
+
+        Arguments:
+            row
+                row of the entity in the window
+        """
+
+        # Shift the entities spawned before it up by one row; entities are
+        # usually removed near the bottom of the screen where the oldest ones
+        # are, so this is fewer rows than the ones after it
+        start = self.first
+        for array in self.get_arrays():
+            array[start + 1:start + row + 1] = array[start:start + row]
+
+        self.first += 1
+        self.count -= 1
+
+    def cull(self, max_y: float):
+        """Remove every entity below a vertical position.
+
+        Arguments:
+            max_y
+                largest vertical position an entity can stay at
+        """
+
+        # Every entity moves by the same amount, so the first one spawned is
+        # always the lowest; nothing is culled while it is above max_y
+        if self.count == 0 or self.pos[self.first, 1] <= max_y:
+            return
+
+        # The entities to remove are at the start of the window
+        pos_y = self.get_pos()[::-1, 1]
+        num_culled = self.count - np.searchsorted(pos_y, max_y, "right")
+
+        self.first += num_culled
+        self.count -= num_culled
+
+    def query(self, min_pos: np.ndarray, max_pos: np.ndarray) -> np.ndarray:
+        """Find the entities whose positions are inside a box. The rows with
+        positions in the box's vertical range are found with a binary search,
+        so only those are checked horizontally.
+
+        Arguments:
+            min_pos
+                top left of the box; [pos_x, pos_y]
+            max_pos
+                bottom right of the box; [pos_x, pos_y]
+
+        Returns:
+            rows
+                rows of the entities inside the box in the window, in spawn
+                order
+        """
+
+        # Vertical positions in increasing order; index i is row count-1-i
+        pos_y = self.get_pos()[::-1, 1]
+        start = self.count - np.searchsorted(pos_y, max_pos[1], "right")
+        end = self.count - np.searchsorted(pos_y, min_pos[1], "left")
+        if start >= end:
+            return np.empty(0, dtype=np.intp)
+
+        pos_x = self.get_pos()[start:end, 0]
+        inside = (pos_x >= min_pos[0]) & (pos_x <= max_pos[0])
+
+        return start + np.flatnonzero(inside)
+
+    def get_pos(self) -> np.ndarray:
+        """Return the positions of every entity.
+
+        Returns:
+            pos
+                view of the positions in spawn order; [[pos_x, pos_y], ...]
+        """
+
+        return self.pos[self.first:self.first + self.count]
+
+    def get_type_ids(self) -> np.ndarray:
+        """Return the types of every entity.
+
+        Returns:
+            type_ids
+                view of the types in spawn order
+        """
+
+        return self.type_ids[self.first:self.first + self.count]
+
+    def get_counters(self) -> np.ndarray:
+        """Return the animation counters of every entity.
+
+        Returns:
+            counters
+                view of the animation counters in spawn order
+        """
+
+        return self.counters[self.first:self.first + self.count]
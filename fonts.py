@@ -0,0 +1,106 @@
+"""
+A FontCache class to share fonts and rendered text across the whole game.
+"""
+
+# Import modules
+from assets import assets
+from collections import OrderedDict
+import pygame as pg
+
+class FontCache:
+    """FontCache class. Each font size is only loaded from disk once and the
+    most recently rendered texts are kept so static labels are only rendered
+    once."""
+
+    def __init__(self, font_path: str, max_texts=256):
+        """Initialization method.
+
+        Arguments:
+            font_path
+                path to the font file
+            max_texts : int
+                maximum number of rendered texts to keep
+        """
+
+        self.font_path = font_path
+        self.max_texts = max_texts
+
+        # Fonts keyed by size
+        self.fonts = {}
+
+        # Rendered text surfaces keyed by (text, size, color), ordered from
+        # least to most recently used
+        self.texts = OrderedDict()
+
+        # Number of renders served from and missing from texts
+        self.hits = 0
+        self.misses = 0
+
+    def get_font(self, size: int) -> pg.font.Font:
+        """Retrieve a font of the inputted size.
+
+        Arguments:
+            size
+                font size
+
+        Returns:
+            font
+                requested font with correct size
+        """
+
+        if size not in self.fonts:
+            self.fonts[size] = assets.get_font(self.font_path, size)
+
+        return self.fonts[size]
+
+    def render(self, text: str, size: int, color=(0, 0, 0)) -> pg.Surface:
+        """Return text rendered at the inputted size and color, only rendering
+        it if it isn't already cached.
+
+        Arguments:
+            text
+                string to be rendered
+            size
+                font size
+            color : tuple[int]
+                text color in RGB
+
+        Returns:
+            surface
+                rendered text
+        """
+
+        key = (text, size, tuple(color))
+
+        if key in self.texts:
+            self.hits += 1
+            # Mark as most recently used
+            self.texts.move_to_end(key)
+            return self.texts[key]
+
+        self.misses += 1
+        surface = self.get_font(size).render(text, False, color)
+        self.texts[key] = surface
+
+        # Discard the least recently used text if over capacity
+        if len(self.texts) > self.max_texts:
+            self.texts.popitem(last=False)
+
+        return surface
+
+    def get_stats(self) -> dict:
+        """Return the number of cached fonts and texts and the text hits and
+        misses.
+
+        Returns:
+            stats
+                fonts, texts, hits, misses
+        """
+
+        return {"fonts": len(self.fonts),
+                "texts": len(self.texts),
+                "hits": self.hits,
+                "misses": self.misses}
+
+# Fonts and rendered text shared by the whole game
+font_cache = FontCache('Fonts/Pixel.ttf')
@@ -0,0 +1,152 @@
+"""
+A Hud class to represent the player's game data displayed on top of the game.
+"""
+
+# Import modules
+from fonts import font_cache
+import pygame as pg
+
+class Hud:
+    """Hud class. Each field is a label followed by an integer value and is
+    kept as one pre-rendered surface that is only re-rendered when its value
+    changes. Values are built from a strip of pre-rendered digits."""
+
+    # Characters in the strip of pre-rendered digits
+    DIGITS = "-0123456789"
+
+    def __init__(self, screen: pg.surface, font_size=30, color=(0, 0, 0)):
+        """Initialization method.
+
+        Arguments:
+            screen
+                pygame screen to display contents
+            font_size : int
+                font size of every field
+            color : tuple[int]
+                text color in RGB
+        """
+
+        self.screen = screen
+        self.font_size = font_size
+        self.color = color
+
+        # Fields keyed by name; each one is [label, pos, value, surface]
+        self.fields = {}
+
+        # Pre-rendered digit glyphs keyed by character
+        self.glyphs = self.build_glyph_strip()
+
+    def build_glyph_strip(self) -> dict[str, pg.Surface]:
+        """Render all digits once and cut the render into one glyph per digit.
+
+        Returns:
+            glyphs
+                glyph surfaces keyed by character
+        """
+
+        font = font_cache.get_font(self.font_size)
+        strip = font_cache.render(self.DIGITS, self.font_size, self.color)
+
+        glyphs = {}
+        for i, char in enumerate(self.DIGITS):
+            # Horizontal extent of the character in the strip
+            left = font.size(self.DIGITS[:i])[0]
+            right = font.size(self.DIGITS[:i+1])[0]
+            glyphs[char] = strip.subsurface((left, 0, right - left,
+                                             strip.get_height()))
+
+        return glyphs
+
+    def add_field(self, name: str, label: str, pos: tuple[int]):
+        """Add a field to the HUD.
+
+        Arguments:
+            name
+                field name
+            label
+                text displayed before the value
+            pos
+                top left of the field on the screen
+        """
+
+        self.fields[name] = [label, pos, None, None]
+
+    def set(self, name: str, value: float):
+        """Set the value of a field, re-rendering it only if the displayed
+        value changes.
+
+        Arguments:
+            name
+                field name
+            value
+                new value; only its integer part is displayed
+        """
+
+        field = self.fields[name]
+
+        value = int(value)
+        if value != field[2]:
+            field[2] = value
+            field[3] = self.render_field(field[0], value)
+
+    def render_field(self, label: str, value: int) -> pg.Surface:
+        """Render a field from its label and the digit glyphs.
+
+        Arguments:
+            label
+                text displayed before the value
+            value
+                displayed value
+
+        Returns:
+            surface
+                rendered field
+        """
+
+        label_surf = font_cache.render(label, self.font_size, self.color)
+        digits = [self.glyphs[char] for char in str(value)]
+
+        w = label_surf.get_width() + sum(glyph.get_width() for glyph in digits)
+        h = label_surf.get_height()
+
+        surface = pg.Surface((w, h), pg.SRCALPHA)
+        if pg.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+
+        surface.blit(label_surf, (0, 0))
+        x = label_surf.get_width()
+        for glyph in digits:
+            surface.blit(glyph, (x, 0))
+            x += glyph.get_width()
+
+        return surface
+
+    def get_value(self, name: str) -> int:
+        """Return the displayed value of a field.
+
+        Arguments:
+            name
+                field name
+
+        Returns:
+            value
+                displayed value
+        """
+
+        return self.fields[name][2]
+
+    def draw_field(self, name: str) -> pg.Rect:
+        """Draw a field on the screen.
+
+        Arguments:
+            name
+                field name
+
+        Returns:
+            rect
+                area of the screen drawn on
+        """
+
+        _, pos, _, surface = self.fields[name]
+
+        return self.screen.blit(surface, pos)
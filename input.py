@@ -47,20 +47,26 @@ class Input:
         # Whether or not the input box is selected to type in
         self.selected = False
 
-    def draw(self, text: str):
+    def draw(self, text: str) -> pg.Rect:
         """Draw the input box and the text in it.
         
         Arguments:
             text
                 input box text
+
+        Returns:
+            rect
+                area of the screen drawn on
         """
 
         self.text = text
 
-        self.draw_bg()
-        self.draw_text()
+        rect = self.draw_bg()
+        text_rect = self.draw_text()
+
+        return rect.union(text_rect)
 
-    def draw_bg(self):
+    def draw_bg(self) -> pg.Rect:
         """Draw the input box itself."""
 
         # Swap input box background colors based on selection
@@ -73,10 +79,10 @@ class Input:
         rect = [self.pos[0] - self.dims[0]/2, self.pos[1] - self.dims[1]/2,
                 self.dims[0], self.dims[1]]
         
-        pg.draw.rect(self.screen, bg_color, 
-                     rect, border_radius=self.border_radius)
+        return pg.draw.rect(self.screen, bg_color, 
+                            rect, border_radius=self.border_radius)
     
-    def draw_text(self):
+    def draw_text(self) -> pg.Rect:
         """Draw the input box text."""
 
         # Render the text as a pygame surface
@@ -89,7 +95,7 @@ class Input:
         label_top_left_pos = (self.pos[0] - self.dims[0]/2 + offset, 
                               self.pos[1] - label_size[1]/2)
         
-        self.screen.blit(label, label_top_left_pos)
+        return self.screen.blit(label, label_top_left_pos)
 
     def check_for_select(self, inputs: list):
         """Check if the input box has been selected"""
@@ -0,0 +1,188 @@
+"""
+A Kinematics class to place a rigid shape, like the boat's hull, at a position
+and heading without recomputing any trigonometry it has done before.
+"""
+
+# Import modules
+from collision import project_polygon
+import math
+
+class Kinematics:
+    """Kinematics class. Headings are rounded to angle_res degrees and
+    everything that only depends on the rounded heading is cached: its sine
+    and cosine, the rotated shape and the shape's projection for collision
+    tests. Placing the shape then only takes a translation of its
+    projection.
+
+    Placing is done with plain floats and lists: the shape only has a few
+    vertices, for which NumPy's overhead per call costs more than the math."""
+
+    # Sine and cosine of each rounded heading, shared by every shape; keyed by
+    # (angle_res, rounded heading)
+    trig_cache = {}
+
+    def __init__(self, shape: list[tuple[float]], angle_res=.1):
+        """Initialization method.
+
+        Arguments:
+            shape
+                vertices of the shape at position (0, 0) and heading 0;
+                [(x, y), ...]
+            angle_res : float
+                angular resolution in degrees of the cached headings
+        """
+
+        self.shape = [(float(x), float(y)) for x, y in shape]
+        self.angle_res = angle_res
+
+        # Rotated shape and its projection at the origin for each rounded
+        # heading, as lists
+        self.rotations = {}
+
+        # Heading, position and projection of the shape last placed
+        self.angle = 0
+        self.pos = (0.0, 0.0)
+        self.projection = None
+
+    def get_step(self, angle: float) -> int:
+        """Return a heading rounded to angle_res, as a multiple of angle_res.
+
+        Arguments:
+            angle
+                heading in degrees
+
+        Returns:
+            step
+                number of angle_res steps in the rounded heading
+        """
+
+        return round(angle / self.angle_res)
+
+    def get_trig(self, angle: float) -> tuple[float]:
+        """Return the sine and cosine of a heading rounded to angle_res.
+
+        Arguments:
+            angle
+                heading in degrees
+
+        Returns:
+            sin
+                sine of the rounded heading
+            cos
+                cosine of the rounded heading
+        """
+
+        key = (self.angle_res, self.get_step(angle))
+
+        if key not in Kinematics.trig_cache:
+            angle_rad = key[1] * self.angle_res * math.pi/180
+            Kinematics.trig_cache[key] = (math.sin(angle_rad),
+                                          math.cos(angle_rad))
+
+        return Kinematics.trig_cache[key]
+
+    def get_rotation(self, angle: float) -> tuple[list]:
+        """Return the shape rotated to a heading rounded to angle_res and its
+        projection for collision tests, rotating it only the first time the
+        rounded heading is requested.
+
+        Arguments:
+            angle
+                heading in degrees
+
+        Returns:
+            rotated
+                vertices of the rotated shape at position (0, 0); 
+                [(x, y), ...]
+            axes
+                axes the rotated shape is projected onto; [[a_x, a_y], ...]
+            mins
+                smallest projection of the rotated shape onto each axis
+            maxs
+                largest projection of the rotated shape onto each axis
+        """
+
+        step = self.get_step(angle)
+
+        if step not in self.rotations:
+            sin, cos = self.get_trig(angle)
+
+            # Rotate counter-clockwise on the screen
+            rotated = [(x * cos + y * sin, y * cos - x * sin) 
+                       for x, y in self.shape]
+
+            self.rotations[step] = (rotated,) + tuple(
+                array.tolist() for array in project_polygon(rotated))
+
+        return self.rotations[step]
+
+    def place(self, angle: float, pos: list[float]):
+        """Place the shape at a position and heading. Nothing is worked out
+        until the placed shape's bounds, projection or vertices are asked for.
+
+        Arguments:
+            angle
+                heading in degrees
+            pos
+                position of the shape's origin; [pos_x, pos_y]
+        """
+
+        self.angle = angle
+        self.pos = (pos[0], pos[1])
+        self.projection = None
+
+    def get_bounds(self) -> tuple[tuple[float]]:
+        """Return the bounding box of the shape last placed.
+
+        Returns:
+            min_pos
+                top left of the bounding box; (x, y)
+            max_pos
+                bottom right of the bounding box; (x, y)
+        """
+
+        # The first two axes are the x and y axes
+        _, _, mins, maxs = self.get_rotation(self.angle)
+        x, y = self.pos
+
+        return (mins[0] + x, mins[1] + y), (maxs[0] + x, maxs[1] + y)
+
+    def get_poly(self) -> list[tuple[float]]:
+        """Return the vertices of the shape last placed.
+
+        Returns:
+            poly
+                vertices of the placed shape; [(x, y), ...]
+        """
+
+        rotated = self.get_rotation(self.angle)[0]
+        x, y = self.pos
+
+        return [(v_x + x, v_y + y) for v_x, v_y in rotated]
+
+    def get_projection(self) -> tuple[list]:
+        """Return the projection of the shape last placed, for collision
+        tests; see collision.project_polygon(). It is made of lists rather
+        than arrays, and only worked out once per placement.
+
+        Returns:
+            axes
+                axes the shape is projected onto
+            mins
+                smallest projection of the shape onto each axis
+            maxs
+                largest projection of the shape onto each axis
+        """
+
+        if self.projection is None:
+            _, axes, mins, maxs = self.get_rotation(self.angle)
+            x, y = self.pos
+
+            # Moving the shape moves its projection onto each axis by the
+            # projection of the move
+            offsets = [a_x * x + a_y * y for a_x, a_y in axes]
+            self.projection = (axes, 
+                               [lo + off for lo, off in zip(mins, offsets)],
+                               [hi + off for hi, off in zip(maxs, offsets)])
+
+        return self.projection
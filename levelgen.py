@@ -0,0 +1,339 @@
+"""
+A LevelGenerator class to lay out where obstacles and coins appear in the river
+in chunks, ahead of the part of the river on the screen.
+"""
+
+# Import modules
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import random
+
+class LevelGenerator:
+    """LevelGenerator class. Positions along the river are distances in pixels
+    the river has to scroll before something appears at the top of the screen.
+    The river is laid out one chunk of chunk_h pixels at a time, keeping
+    num_chunks_ahead chunks ready ahead of the distance scrolled, either on a
+    background thread or when they are needed. Every chunk is checked to be
+    passable by a boat that can only drift sideways so fast.
+
+    Each placement is (distance, kind, x, type_id), where kind is "obstacle" or
+    "coin" and type_id is the type of obstacle."""
+
+    # Background thread shared by every generator to lay out chunks; it only
+    # runs one chunk at a time, so chunks are laid out in order
+    loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="levelgen")
+
+    def __init__(self,
+                 seed: int,
+                 obstacle_sizes: list[tuple[int]],
+                 river_edges=(300, 600),
+                 river_lanes=(350, 450, 550),
+                 dist_btwn_obs=450,
+                 dist_btwn_coins=200,
+                 spawn_y=-100,
+                 gen_chance=.8,
+                 gen_step=5,
+                 coin_clearance=300,
+                 boat_size=(50, 150),
+                 max_drift=.14,
+                 chunk_h=900,
+                 num_chunks_ahead=2,
+                 threaded=False):
+        """Initialization method.
+
+        Arguments:
+            seed
+                seed of the random number generator deciding the layout
+            obstacle_sizes
+                width and height of each type of obstacle
+            river_edges : tuple[int]
+                x-coords of the left and right of the river
+            river_lanes : tuple[int]
+                middle x-coords of the three lanes in the river
+            dist_btwn_obs : int
+                the minimum number of vertical pixels between each obstacle
+            dist_btwn_coins : int
+                the minimum number of vertical pixels between each coin
+            spawn_y : int
+                y-coord obstacles and coins appear at; the next one only
+                appears once the last one has scrolled from there down to
+                dist_btwn_obs or dist_btwn_coins, so they are dist_btwn_obs -
+                spawn_y or dist_btwn_coins - spawn_y pixels apart
+            gen_chance : float
+                chance to place an obstacle every gen_step pixels once it is
+                far enough from the last one; 0-1
+            gen_step : int
+                pixels between each chance to place an obstacle or coin
+            coin_clearance : int
+                the minimum number of vertical pixels between a coin and the
+                obstacle before it, or any obstacle after it in its lane
+            boat_size : tuple[int]
+                width and height of the boat's hit box
+            max_drift : float
+                horizontal pixels the boat can move for every pixel the river
+                scrolls; the boat moves sideways at .25 * tan(direction) of
+                that, so .14 is about a 30 degree turn
+            chunk_h : int
+                vertical pixels laid out in each chunk
+            num_chunks_ahead : int
+                number of chunks kept ready ahead of the distance scrolled
+            threaded : bool
+                whether to lay out chunks on the background thread
+        """
+
+        self.rng = random.Random(seed)
+        self.obstacle_sizes = list(obstacle_sizes)
+        self.river_lanes = list(river_lanes)
+        self.dist_btwn_obs = dist_btwn_obs
+        self.dist_btwn_coins = dist_btwn_coins
+        self.spawn_y = spawn_y
+        self.gen_chance = gen_chance
+        self.gen_step = gen_step
+        self.coin_clearance = coin_clearance
+        self.boat_size = boat_size
+        self.max_drift = max_drift
+        self.chunk_h = chunk_h
+        self.num_chunks_ahead = num_chunks_ahead
+        self.threaded = threaded
+
+        # Horizontal positions the boat's center can be at; Boat keeps it 35
+        # pixels from the edges of the river
+        self.min_x = river_edges[0] + 35
+        self.max_x = river_edges[1] - 35
+
+        # NOTE: the following are only used by gen_chunk(), which may run on
+        # the loader thread
+
+        # Index of the next chunk to lay out
+        self.next_index = 0
+
+        # Distances of the next obstacle and coin to try placing
+        self.next_obs_dist = 0
+        self.next_coin_dist = 0
+
+        # Obstacles placed but not yet handed out in a chunk, and the ones
+        # coins still have to keep clear of; each is (distance, x, type_id)
+        self.pending_obs = deque()
+        self.recent_obs = deque()
+
+        # Ranges of horizontal positions the boat can reach when it passes
+        # the last obstacle placed, and the distance of that obstacle
+        self.reachable = [(self.min_x, self.max_x)]
+        self.reachable_dist = 0
+
+        # NOTE: the following are only used by the thread popping placements
+
+        # Chunks being laid out, in order, and the index of the first one
+        self.chunks = deque()
+        self.first_index = 0
+
+        # Placements of the chunks laid out, in order of distance
+        self.placements = deque()
+
+        # Keep the first chunks ready before the river starts scrolling
+        self.fill(0)
+
+    def get_reachable(self, dist: float, x: float,
+                      type_id: int) -> list[tuple[float]]:
+        """Return the horizontal positions the boat could be at when passing an
+        obstacle, if it is placed.
+
+        Arguments:
+            dist
+                distance of the obstacle
+            x
+                middle x-coord of the obstacle
+            type_id
+                type of obstacle
+
+        Returns:
+            reachable
+                ranges of reachable horizontal positions; empty if the
+                obstacle blocks the river
+        """
+
+        # The boat can drift while the river scrolls from the last obstacle
+        # to this one, except while its hit box is still passing either one
+        w, h = self.obstacle_sizes[type_id]
+        drift = max(0, dist - self.reachable_dist - self.boat_size[1] - h)
+        drift *= self.max_drift
+
+        # Positions the boat can drift to, merged where they overlap
+        drifted = []
+        for lo, hi in self.reachable:
+            lo = max(self.min_x, lo - drift)
+            hi = min(self.max_x, hi + drift)
+            if len(drifted) > 0 and lo <= drifted[-1][1]:
+                drifted[-1] = (drifted[-1][0], max(drifted[-1][1], hi))
+            else:
+                drifted.append((lo, hi))
+
+        # Positions where the boat's hit box would overlap the obstacle
+        blocked_lo = x - w/2 - self.boat_size[0]/2
+        blocked_hi = x + w/2 + self.boat_size[0]/2
+
+        reachable = []
+        for lo, hi in drifted:
+            if lo < blocked_lo:
+                reachable.append((lo, min(hi, blocked_lo)))
+            if hi > blocked_hi:
+                reachable.append((max(lo, blocked_hi), hi))
+
+        return reachable
+
+    def place_obstacle(self):
+        """Place the next obstacle in a lane that keeps the river passable,
+        then decide where the one after it goes."""
+
+        dist = self.next_obs_dist
+
+        # Pick a random lane and type of obstacle until the boat can get past
+        # it; if it can't, the obstacle is left out
+        for _ in range(8):
+            rand_lane = self.rng.randint(0, len(self.river_lanes) - 1)
+            rand_obs_type = self.rng.randrange(len(self.obstacle_sizes))
+            x = self.river_lanes[rand_lane]
+
+            reachable = self.get_reachable(dist, x, rand_obs_type)
+            if len(reachable) > 0:
+                self.reachable = reachable
+                self.reachable_dist = dist
+                self.pending_obs.append((dist, x, rand_obs_type))
+                self.recent_obs.append((dist, x, rand_obs_type))
+                break
+
+        # Once this obstacle has scrolled down to dist_btwn_obs, there is a
+        # gen_chance chance to place the next one every gen_step pixels
+        self.next_obs_dist += self.dist_btwn_obs - self.spawn_y
+        while self.rng.random() >= self.gen_chance:
+            self.next_obs_dist += self.gen_step
+
+    def can_place_coin(self, dist: float, x: float) -> bool:
+        """Return whether or not a coin can be placed without an obstacle
+        taking its spot.
+
+        Arguments:
+            dist
+                distance of the coin
+            x
+                middle x-coord of the coin
+
+        Returns:
+            whether or not the coin can be placed
+        """
+
+        # Forget obstacles too far behind to matter anymore, except the last
+        # one before the coin
+        while len(self.recent_obs) > 1 and \
+            self.recent_obs[0][0] < dist - self.coin_clearance and \
+                self.recent_obs[1][0] <= dist:
+            self.recent_obs.popleft()
+
+        for obs_dist, obs_x, _ in self.recent_obs:
+            # Keep clear of any obstacle behind, and of any obstacle ahead in
+            # the same lane
+            if abs(obs_dist - dist) <= self.coin_clearance and \
+                (obs_dist <= dist or obs_x == x):
+                return False
+
+        # Don't follow the last obstacle down its lane
+        behind = [obs_x for obs_dist, obs_x, _ in self.recent_obs 
+                  if obs_dist <= dist]
+        return len(behind) == 0 or x != behind[-1]
+
+    def gen_chunk(self, index: int) -> list[tuple]:
+        """Lay out a chunk of the river.
+
+        NOTE: may run on the loader thread
+
+        Arguments:
+            index
+                index of the chunk; chunks must be laid out in order
+
+        Returns:
+            placements
+                placements in the chunk in order of distance
+        """
+
+        end = (index + 1) * self.chunk_h
+
+        # Coins keep clear of obstacles ahead of them, so obstacles are placed
+        # that far past the end of the chunk
+        while self.next_obs_dist < end + self.coin_clearance:
+            self.place_obstacle()
+
+        placements = []
+        while len(self.pending_obs) > 0 and self.pending_obs[0][0] < end:
+            dist, x, type_id = self.pending_obs.popleft()
+            placements.append((dist, "obstacle", x, type_id))
+
+        # Try placing a coin in a random lane every gen_step pixels once the
+        # last coin has scrolled down to dist_btwn_coins
+        while self.next_coin_dist < end:
+            dist = self.next_coin_dist
+            x = self.river_lanes[self.rng.randint(0, len(self.river_lanes) - 1)]
+
+            if self.can_place_coin(dist, x):
+                placements.append((dist, "coin", x, 0))
+                self.next_coin_dist += self.dist_btwn_coins - self.spawn_y
+            else:
+                self.next_coin_dist += self.gen_step
+
+        placements.sort()
+
+        return placements
+
+    def fill(self, distance: float):
+        """Start laying out chunks until num_chunks_ahead chunks past distance
+        are being laid out.
+
+        Arguments:
+            distance
+                distance the river has scrolled
+        """
+
+        last_index = int(distance // self.chunk_h) + self.num_chunks_ahead
+        while self.next_index <= last_index:
+            if self.threaded:
+                chunk = LevelGenerator.loader.submit(self.gen_chunk,
+                                                     self.next_index)
+            else:
+                chunk = Future()
+                chunk.set_result(self.gen_chunk(self.next_index))
+
+            self.chunks.append(chunk)
+            self.next_index += 1
+
+    def pop(self, distance: float) -> list[tuple]:
+        """Return the placements the river has scrolled past, in order.
+
+        Arguments:
+            distance
+                distance the river has scrolled
+
+        Returns:
+            placements
+                placements with distances up to distance
+        """
+
+        self.fill(distance)
+
+        popped = []
+        while True:
+            if len(self.placements) == 0:
+                # Nothing in the next chunk has been reached until the river
+                # scrolls to its start
+                if self.first_index * self.chunk_h > distance:
+                    break
+
+                # Take its placements; this only waits if the loader thread
+                # has fallen behind
+                self.placements.extend(self.chunks.popleft().result())
+                self.first_index += 1
+                continue
+
+            if self.placements[0][0] > distance:
+                break
+            popped.append(self.placements.popleft())
+
+        return popped
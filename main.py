@@ -9,13 +9,23 @@ __author__ = "Firdavs Nasriddinov"
 __version__ = 1.0
 
 # Import modules
-from background import Background
-from boat import Boat
-from coins import Coins
-from database import Database
-from obstacles import Obstacles
+import argparse
+from assets import assets
+import cProfile
+import functools
+from fonts import font_cache
+from hud import Hud
+from memory import get_arrays_bytes, get_surfaces_bytes, memory
+from profiler import profiler
 import pygame as pg
-from title import TitleScreen
+import random
+from render import Renderer
+import replay
+from river import RiverStream
+from sim import Simulation
+import sys
+import time
+import tracing
 
 class Game:
     """Class to run the game."""
@@ -24,25 +34,74 @@ class Game:
     SCREEN_W = 900
     SCREEN_H = 900
 
+    # Maximum number of frames rendered per second
     FPS = 120
 
+    # Number of simulation ticks per second; the game moves by a fixed amount
+    # each tick, so gameplay and scores don't depend on FPS
+    TICK_RATE = 120
+
+    # Maximum amount of time in seconds simulated in one frame, so a slow 
+    # frame doesn't make the game spend many frames catching up
+    MAX_FRAME_TIME = .25
+
+    # Whether to only update the changed parts of the display each frame 
+    # instead of flipping the whole display
+    DIRTY_RECTS = True
+
+    # Keys to show or hide the frame profiler's overlay and to save the times
+    # of the most recent frames as CSV
+    PROFILER_KEY = pg.K_F3
+    PROFILER_CSV_KEY = pg.K_F4
+
+    # Keys to show or hide the memory overlay and to save the memory report
+    MEMORY_KEY = pg.K_F6
+    MEMORY_DUMP_KEY = pg.K_F7
+
     # Initial boat posiion
     INIT_BOAT_POS = (450, 700)
 
+    # River segments chained, in order, into the endless river; each is an
+    # image and the area of it cut out as the segment, (x, y, w, h)
+    # NOTE: the other river images in Images (curved_river.png, 
+    # diverging_river.png, wide_river.png) can be added once river_edges and 
+    # river_lanes follow the river in each segment
+    # NOTE: river.png cut into quarters, in the order they appear in it, so 
+    # the next segment is decoded every time one scrolls off the screen
+    RIVER_COURSE = [("Images/river.png", (0, 450, 900, 450)),
+                    ("Images/river.png", (0, 0, 900, 450)),
+                    ("Images/river.png", (0, 1350, 900, 450)),
+                    ("Images/river.png", (0, 900, 900, 450))]
+
+    # Images needed as soon as the game starts, loaded at startup; the rest 
+    # are loaded the first time they are needed
+    STARTUP_IMAGES = ['Images/river_blur.png', 'Images/boat.png', 
+                      'Images/rock.png', 'Images/log.png']
+
     # Distance between obstacles and coins
     DIST_BTWN_OBS = 450         # larger -> easier
     DIST_BTWN_COINS = 200       # larger -> less coins
     
-    # Connects to web-hosted database that stores all user data
-    database = Database(host=
+    # Web-hosted database that stores all user data
+    DATABASE_CONFIG = dict(host=
             "through-the-wild-db.c2qg3xrknhut.ap-south-1.rds.amazonaws.com",
-                        port=3306,
-                        user="admin",
-                        password="master-password",
-                        database="through_the_wild")
+                           port=3306,
+                           user="admin",
+                           password="master-password",
+                           database="through_the_wild")
 
-    def __init__(self):
-        """Initialization method."""
+    def __init__(self, seed=None, record_path=None):
+        """Initialization method.
+        
+        Arguments:
+            seed : int
+                seed of the session; each run's simulation is seeded from it, 
+                so the same seed and inputs replay the same session. Random if
+                None
+            record_path : str
+                file to save the inputs of each run to when it ends; not saved
+                if None
+        """
 
         pg.init()
         pg.font.init()
@@ -54,6 +113,18 @@ class Game:
         # Pygame clock to run game at constant FPS
         self.clock = pg.time.Clock()
 
+        # Simulation ticks owed since the last tick; the fraction of a tick 
+        # left over is used to interpolate the game objects when drawing
+        self.accumulator = 0
+
+        # Presents the parts of the screen that changed each frame
+        self.renderer = Renderer(self.screen, self.DIRTY_RECTS)
+
+        # Seeds the simulation of every run
+        self.rng = random.Random(seed)
+
+        self.record_path = record_path
+
         # x-coordinates of the left and right of the river
         self.river_edges = [300, 600]
 
@@ -65,28 +136,53 @@ class Game:
         # WHich screen is currently displaying (title or game)
         self.displaying = "title"
 
-        # Loading in images required for the game
-        self.bg_img = pg.image.load('Images/river.png')
-        self.title_bg_img = pg.image.load('Images/river_blur.png')
-        self.boat_img = pg.image.load('Images/boat.png')
-        self.obstacle_imgs = [pg.image.load('Images/rock.png'), 
-                         pg.image.load('Images/log.png')]
+        # Loading in images required for the game, converted to the display's
+        # pixel format, along with the image of the first river segment
+        # NOTE: the river segments are streamed in by RiverStream
+        assets.preload(self.STARTUP_IMAGES + [self.RIVER_COURSE[0][0]])
+        self.title_bg_img = assets.get_image('Images/river_blur.png')
+        self.boat_img = assets.get_image('Images/boat.png')
+        self.obstacle_imgs = [assets.get_image('Images/rock.png'), 
+                              assets.get_image('Images/log.png')]
+
+        # The database and title screen are only imported by the game, so
+        # replays run without mysql-connector or a connection to the database
+        from database import Database
+        from title import TitleScreen
+
+        # Connects to web-hosted database that stores all user data
+        database = Database(**self.DATABASE_CONFIG)
 
         # Class to represent the title screen (everything that's not the game)
         self.title_screen = TitleScreen(self.screen, self.title_bg_img, 
-                                        self.database)
+                                        database, self.renderer)
 
         # Using the database initialized in TitleScreen
+        # NOTE: the indexes the game's queries rely on are added once by 
+        # setup_database.py
         self.database = self.title_screen.database
         
+        # Score, highest_score and coin_count displayed on top of the game
+        self.hud = Hud(self.screen, font_size=30)
+        self.hud.add_field("score", "Score: ", (20, 20))
+        self.hud.add_field("highest_score", "Highest Score: ", (20, 70))
+        self.hud.add_field("coin_count", "Coins: ", (20, 120))
+
         # Starting the objects in the game
-        self.background, self.boat, self.obstacles, self.coins = self.reset()
+        self.background, self.sim = self.reset()
+        # Records the inputs of the current run
+        self.recorder = replay.InputRecorder(self.sim.config)
         
         self.score = 0
 
-        # Whether or not highest_score and coin_count have been retrieved from
-        # the database
+        # Whether or not id, highest_score and coin_count have been retrieved 
+        # from the database, and whether or not they are being retrieved
         self.got_data_from_db = False
+        self.getting_data = False
+
+        # Report the memory held by the current run and the title screen
+        memory.add_source("entities", self.get_entity_memory)
+        memory.add_source("caches", self.get_cache_memory)
         
     def get_font(self, size: int) -> pg.font:
         """Retrieve a font of the inputted size.
@@ -100,36 +196,71 @@ class Game:
                 requested font with correct size
         """
 
-        return pg.font.Font('Fonts/Pixel.ttf', size)
+        return font_cache.get_font(size)
 
-    def reset(self) -> list[Background, Boat, Obstacles, Coins]:
+    def reset(self) -> list[RiverStream, Simulation]:
         """Reset the game objects.
         
         Returns:
             background
-                represents the background images of the river and trees
-            boat
-                represents the boat images and the boat's mechanics
-            obstacles
-                represents all of the individual obstacles in the river and
-                their interactions in the game
-            coins
-                represents all of the invidual coins in the river and their 
-                animations 
+                represents the background river segments and trees
+            sim
+                represents the game logic and its game objects: the boat, all
+                of the individual obstacles and all of the individual coins in 
+                the river
         """
 
-        background = Background(self.screen, self.bg_img)
-        boat = Boat(self.screen, 
-                    self.boat_img, 
-                    self.INIT_BOAT_POS, 
-                    self.boat_speed)
-        obstacles = Obstacles(self.screen, self.obstacle_imgs)
-        coins = Coins(self.screen, animation_dir="Animations/Coin/64")
-
-        return background, boat, obstacles, coins
+        background = RiverStream(self.screen, self.RIVER_COURSE)
+        sim = Simulation(self.boat_img, 
+                         self.obstacle_imgs, 
+                         screen=self.screen,
+                         init_boat_pos=self.INIT_BOAT_POS,
+                         boat_speed=self.boat_speed,
+                         river_edges=self.river_edges,
+                         river_lanes=self.river_lanes,
+                         dist_btwn_obs=self.DIST_BTWN_OBS,
+                         dist_btwn_coins=self.DIST_BTWN_COINS,
+                         screen_h=self.SCREEN_H,
+                         coin_size=64,
+                         seed=self.rng.randrange(2**32),
+                         threaded=True)
+
+        return background, sim
     
+    def get_entity_memory(self) -> list[tuple]:
+        """Return the number of obstacles and coins and the memory held by
+        their arrays, including the free rows.
+
+        Returns:
+            usage
+                (entities, count, bytes) for the obstacles and the coins
+        """
+
+        return [(name, len(store), get_arrays_bytes(store.get_arrays()))
+                for name, store in [("obstacles", self.sim.obstacles.store),
+                                    ("coins", self.sim.coins.store)]]
+
+    def get_cache_memory(self) -> list[tuple]:
+        """Return the size of the caches of the current run and the title 
+        screen.
+
+        Returns:
+            usage
+                (cache, entries, bytes) for each cache
+        """
+
+        rotations = self.sim.boat.kinematics.rotations
+        static_layers = self.title_screen.static_layers
+
+        return [("river segments", len(self.background.loaded),
+                 get_surfaces_bytes(self.background.loaded.values())),
+                ("hull rotations", len(rotations), 0),
+                ("title static layers", len(static_layers),
+                 get_surfaces_bytes(layer for _, layer in 
+                                    static_layers.values()))]
+
     def display_text(self, text: str, font_size: int, pos: tuple, 
-                     mode="CENTER"):
+                     mode="CENTER") -> pg.Rect:
         """Display text at a requested font_size at a requested position.
         
         Arguments:
@@ -144,21 +275,32 @@ class Game:
                     CENTER: pos is in the center of the text render
                     CORNER: pos is in the top-left of the text render
 
+        Returns:
+            rect
+                area of the screen drawn on
         """
-        # Rendering the text with the requested font size
-        text = self.get_font(font_size).render(text, False, (0, 0, 0))
+        # Rendering the text with the requested font size; static labels are 
+        # only rendered once
+        label = font_cache.render(text, font_size)
 
         # Displaying the text with pos in the center of the render
         if mode == 'CENTER':
-            self.screen.blit(text, (pos[0] - text.get_size()[0]/2, 
-                                    pos[1] - text.get_size()[1]/2))
+            rect = self.screen.blit(label, (pos[0] - label.get_size()[0]/2, 
+                                            pos[1] - label.get_size()[1]/2))
         # Displaying the text with pos in the top-left corner of the render
         elif mode == 'CORNER':
-            self.screen.blit(text, pos)
+            rect = self.screen.blit(label, pos)
+
+        # Text is only redrawn on the display when it changes
+        self.renderer.mark(("text", pos, mode), rect, (text, font_size))
+
+        return rect
 
     def get_data(self) -> list[int, int, int]:
         """Retrieve the id, highest_score, and coin_count of the user form the
         database
+
+        NOTE: runs on the database's worker thread
         
         Returns:
             id
@@ -168,39 +310,51 @@ class Game:
             coin_count
                 the user's total number of coins in their inventory
         """
-        # Table of all of the user data
-        user_data = self.database.get_table("USER_DATA")
+        # Only the user's row is read
+        user = self.database.get_row("USER_DATA", 
+                                     "username", 
+                                     self.title_screen.get_username(),
+                                     ["id", "highest_score", "coin_count"])
 
-        # Parsing the usernames in user_data
-        usernames = list(user_data["username"])
+        return user.id, user.highest_score, user.coin_count
 
-        id = usernames.index(self.title_screen.get_username())
-        highest_score = list(user_data["highest_score"])[id]
-        coin_count = list(user_data["coin_count"])[id]
+    def set_data(self, data: list[int, int, int]):
+        """Set the id, highest_score, and coin_count retrieved by get_data().
+        
+        Arguments:
+            data
+                what get_data() returned
+        """
 
-        return id, highest_score, coin_count
-    
-    def store_data(self):
-        """Store highest_score and coin_count in database."""
+        self.id, self.highest_score, self.coin_count = data
+        self.got_data_from_db = True
+        self.getting_data = False
 
-        # Update the respective cells for the data
-        self.database.update_cells(table_name="USER_DATA", 
-                                    id=self.id, 
-                                    column_names=["highest_score",
-                                                    "coin_count"], 
-                                    new_vals=[int(self.highest_score),
-                                              self.coin_count])
-    
-    def update_score(self, boat_vel: list[float]):
-        """Update the user's score based on the boat's velocity.
+    def fail_get_data(self, error: Exception):
+        """Go back to the login screen since the game can't be played without
+        the data get_data() failed to retrieve; it is retrieved again once the
+        user logs in.
         
         Arguments:
-            boat_vel
-                contains the velocity vector  components; [vel_x, vel_y]
+            error
+                what get_data() raised
         """
 
-        # Increment score by the y component of the boat's velocity
-        self.score += boat_vel[1]
+        self.getting_data = False
+        self.title_screen.fail_get_data(error)
+        self.title_screen.show_request_error(error)
+    
+    def store_data(self):
+        """Store highest_score and coin_count in database without waiting
+        for it."""
+
+        # Update the respective cells for the data
+        self.database.submit(self.database.update_cells, 
+                             "USER_DATA", 
+                             self.id, 
+                             ["highest_score", "coin_count"], 
+                             [int(self.highest_score), self.coin_count],
+                             on_error=self.title_screen.show_request_error)
     
     def update_highest_score(self):
         """Update the highest_score if needed."""
@@ -208,51 +362,141 @@ class Game:
         if self.score > self.highest_score:
             self.highest_score = self.score
 
+    def display_hud_field(self, name: str, value: float):
+        """Display a HUD field on the screen; it is only re-rendered when its
+        displayed value changes.
+        
+        Arguments:
+            name
+                HUD field name
+            value
+                value to display
+        """
+
+        self.hud.set(name, value)
+        self.renderer.mark(("hud", name), self.hud.draw_field(name), 
+                           self.hud.get_value(name))
+
     def display_score(self):
         """Display the player's score on the screen."""
 
-        self.display_text(text=f"Score: {int(self.score)}", 
-                          font_size=30,
-                          pos=(20, 20),
-                          mode="CORNER")
+        self.display_hud_field("score", self.score)
     
     def display_highest_score(self):
         """Display the player's highest_score on the screen."""
-        self.display_text(text=f"Highest Score: {int(self.highest_score)}", 
-                          font_size=30,
-                          pos=(20, 70),
-                          mode="CORNER")
+
+        self.display_hud_field("highest_score", self.highest_score)
 
     def display_coin_count(self):
         """Display the player's coin_count on the screen."""
 
-        self.display_text(text=f"Coins: {self.coin_count}", 
-                          font_size=30,
-                          pos=(20, 120),
-                          mode="CORNER")
+        self.display_hud_field("coin_count", self.coin_count)
+
+    def get_num_ticks(self, frame_time: float) -> int:
+        """Return the number of simulation ticks to run for a frame.
+        
+        Arguments:
+            frame_time
+                time in seconds since the last frame
+
+        Returns:
+            ticks
+                number of whole ticks owed
+        """
+
+        self.accumulator += min(frame_time, self.MAX_FRAME_TIME) * \
+            self.TICK_RATE
+        
+        ticks = int(self.accumulator)
+        self.accumulator -= ticks
+
+        return ticks
+
+    def tick(self, turn_dir: str):
+        """Advance the game by one simulation tick.
+        
+        Arguments:
+            turn_dir
+                whether to turn the boat counter-clockwise or clockwise
+        """
+
+        # Move the background images based on the boat's velocity
+        self.background.move(self.sim.boat.get_vel())
+        # Chain the next river segment and forget the ones that scrolled off 
+        # the screen
+        self.background.loop_imgs()
+
+        # Record the input so the run can be replayed
+        self.recorder.record(turn_dir)
 
-    def sink_boat(self):
-        """Sink the boat in the river."""
+        # Update the boat, obstacles and coins and check if the player collects
+        # any coins
+        if self.sim.step(turn_dir):
+            self.coin_count += 1
 
-        # Continue to draw the game objects
-        self.background.draw()
-        self.boat.draw()
-        self.obstacles.draw()
-        self.coins.draw()
+        # Update the score count
+        self.score = self.sim.score
+        # Update the highest_score count if needed
+        self.update_highest_score()
 
-        # Continue to display the user's game data to the screen
-        self.display_score()
-        self.display_highest_score()
-        self.display_coin_count()
+    def draw(self, alpha=1.0):
+        """Draw the game objects and the user's game data on the screen.
+        
+        Arguments:
+            alpha : float
+                fraction of the way from the previous tick to the current tick
+                to draw the game objects at
+        """
+
+        # Everything that scrolls is drawn where it was part way through the 
+        # last tick's scroll
+        offset = (alpha - 1) * self.sim.boat.get_vel()[1]
+
+        with profiler.stage("draw"):
+            # Draw background on screen; scrolling it changes the whole screen
+            self.renderer.mark(self.background, 
+                               self.background.draw(offset), 
+                               self.background.get_pos()[1] + offset)
+            # Draw the boat on screen
+            boat = self.sim.boat
+            self.renderer.mark(boat, boat.draw(alpha), 
+                               (boat.boat_dir, boat.transparency))
+            # Draw each obstacle on the screen
+            self.renderer.mark(self.sim.obstacles, 
+                               self.sim.obstacles.draw(offset))
+            # Draw each coin on the screen
+            self.renderer.mark(self.sim.coins, self.sim.coins.draw(offset), 
+                               self.sim.coins.get_frames())
+
+        with profiler.stage("hud"):
+            # Display score, highest_score, coin_count on the screen
+            self.display_score()
+            self.display_highest_score()
+            self.display_coin_count()
+
+    def sink_boat(self, ticks: int):
+        """Sink the boat in the river.
+        
+        Arguments:
+            ticks
+                number of simulation ticks to sink the boat for
+        """
+
+        # Continue to draw the game objects and display the user's game data
+        self.draw()
 
         # Sink the boat by changing it's images alpha value
-        self.boat.sink(2)
+        self.sim.boat.sink(2 * ticks)
 
     def run(self):
         """Run the main while loop for the game."""
 
         running = True
         while running:
+            # Run game on at most FPS and determine how many simulation ticks 
+            # to run for the time since the last frame
+            ticks = self.get_num_ticks(self.clock.tick(self.FPS) / 1000)
+
             # Which key is currently being pressed
             key_pressed = None
 
@@ -260,8 +504,22 @@ class Game:
                 if event.type == pg.QUIT:
                     running = False
                 if event.type == pg.KEYDOWN:
+                    # Show or hide the profiler's overlay
+                    if event.key == self.PROFILER_KEY:
+                        profiler.toggle()
+                    # Save the profiler's most recent frame times
+                    elif event.key == self.PROFILER_CSV_KEY:
+                        profiler.save_csv(
+                            time.strftime("profile-%Y%m%d-%H%M%S.csv"))
+                    # Show or hide the memory overlay
+                    elif event.key == self.MEMORY_KEY:
+                        memory.toggle()
+                    # Save the memory report
+                    elif event.key == self.MEMORY_DUMP_KEY:
+                        memory.save(
+                            time.strftime("memory-%Y%m%d-%H%M%S.txt"))
                     # Assign a keyword based on the special keys pressed
-                    if event.key == pg.K_BACKSPACE:
+                    elif event.key == pg.K_BACKSPACE:
                         key_pressed = "DEL"
                     elif event.key == pg.K_TAB:
                         key_pressed = "TAB"
@@ -290,100 +548,149 @@ class Game:
             else:
                 turn_dir = ''
 
+            # Hand back the results of the database requests that finished
+            with profiler.stage("db"):
+                self.database.poll()
+
             # Check if any of the obstacles are colliding with the boat
-            if self.obstacles.is_colliding_boat(self.boat.get_poly_coords()):
+            with profiler.stage("collision"):
+                colliding = self.sim.is_colliding_boat()
+            if colliding:
                 # Sink the boat
-                self.sink_boat()
+                self.sink_boat(ticks)
 
                 # Display title screen
                 self.displaying = "title"
 
                 # Once the boat is finished sinking
-                if self.boat.has_sunk():
+                if self.sim.boat.has_sunk():
                     # Store highest_score and coin_count in database
-                    self.store_data()
+                    with profiler.stage("db"):
+                        self.store_data()
+                    # Save the inputs of the run
+                    self.save_recording()
                     # Reset the title_screen variables
                     self.title_screen.reset()
                     # Reset game objects
-                    self.background, self.boat, self.obstacles, self.coins = \
-                        self.reset()
+                    self.background, self.sim = self.reset()
+                    self.recorder = replay.InputRecorder(self.sim.config)
                     self.score = 0
+                    # Compare the memory allocated with the last run's
+                    memory.take_snapshot()
 
             if self.displaying == 'title':
-                self.title_screen.display()
+                with profiler.stage("draw"):
+                    self.title_screen.display()
                 # Pass any key pressed to title_screen
                 self.title_screen.input(key_pressed)
 
-                # Display the game once the play button is pressed
-                if self.title_screen.check_for_game() is True:
+                # Display the game once the play button is pressed and the
+                # user's data has been retrieved
+                if self.title_screen.check_for_game() is True and \
+                    self.got_data_from_db is True:
                     self.displaying = "game"
                 
                 # Retrieve id, highest_score, coin_count the first time the 
-                # main menu is displayed whether after login or boat collision
+                # main menu is displayed after login
                 if self.title_screen.displaying_screen == "main":
-                    if self.got_data_from_db is not True:
-                        self.got_data_from_db = True
-                        self.id, self.highest_score, self.coin_count = \
-                            self.get_data()
+                    if self.got_data_from_db is not True and \
+                        self.getting_data is not True:
+                        self.getting_data = True
+                        with profiler.stage("db"):
+                            self.database.submit(
+                                self.get_data, on_result=self.set_data,
+                                on_error=self.fail_get_data)
             
             elif self.displaying == 'game':
-                # Move the background images based on the boat's velocity
-                self.background.move(self.boat.get_vel())
-                # Loop background images with 2 identical images
-                self.background.loop_imgs()
-                # Draw background on screen
-                self.background.draw()
-
-                # Update the velocity, direction, position, and polygon coords
-                # of the boat
-                self.boat.update(turn_dir, self.river_edges)
-                # Draw the boat on screen
-                self.boat.draw()
-
-                # Generate new obstacles
-                self.obstacles.gen_new_obs(gen_chance=.8, 
-                                           dist_btwn_obs=self.DIST_BTWN_OBS, 
-                                           river_lanes=self.river_lanes)
-                # Update the position of each obstacle and check if any are out
-                # of the screen
-                self.obstacles.update(self.boat.get_vel(), self.SCREEN_H)
-                # Draw each obstacle on the screen
-                self.obstacles.draw()
-
-                # Generate new coins
-                self.coins.gen_new_coin(self.DIST_BTWN_COINS, 
-                                        self.river_lanes, 
-                                        self.obstacles.get_obstacles())
-                # Update the position of each coins and check if any are out of
-                # the screen
-                self.coins.update(self.boat.get_vel(), self.SCREEN_H)
-                # Draw each coin on the screen
-                self.coins.draw()
-                # Check if the player collects any coins
-                if self.coins.is_colliding_boat(self.boat.get_pos()):
-                    self.coin_count += 1
-
-                # Update the score count
-                self.update_score(self.boat.get_vel())
-                # Update the highest_score count if needed
-                self.update_highest_score()
-
-                # Display score, highest_score, coin_count on the screen
-                self.display_score()
-                self.display_highest_score()
-                self.display_coin_count()
-
-            # Run game on constant fps
-            self.clock.tick(self.FPS)
-
-            # Change screen contents
-            pg.display.flip()
+                for _ in range(ticks):
+                    # Stop at a collision; the boat sinks from the next frame
+                    with profiler.stage("collision"):
+                        colliding = self.sim.is_colliding_boat()
+                    if colliding:
+                        break
+                    
+                    with profiler.stage("sim"):
+                        self.tick(turn_dir)
+
+                # Draw the game objects, interpolated between the last two 
+                # ticks, and display score, highest_score, coin_count on the 
+                # screen
+                self.draw(self.accumulator)
+
+            # Draw the profiler's overlay on top of everything
+            if profiler.shown:
+                self.renderer.mark("profiler", 
+                                   profiler.draw(self.screen, 1000/self.FPS), 
+                                   profiler.overlay)
+            # Draw the memory overlay on top of everything
+            if memory.shown:
+                self.renderer.mark("memory", memory.draw(self.screen), 
+                                   memory.overlay)
+
+            # Change the parts of the screen contents that changed
+            with profiler.stage("present"):
+                self.renderer.present()
+
+            profiler.end_frame()
+
+        # Save the inputs of a run quit part way through
+        if self.recorder.get_num_ticks() > 0:
+            self.save_recording()
 
         pg.quit()
 
+    def save_recording(self):
+        """Save the inputs of the current run if recording is on."""
+
+        if self.record_path is not None:
+            self.recorder.save(self.record_path, self.sim)
+
 def main():
-    game = Game()
-    game.run()
+    parser = argparse.ArgumentParser(description="Through the Wild")
+    parser.add_argument("--seed", type=int, 
+                        help="seed of the session; random if not given")
+    parser.add_argument("--record", metavar="PATH", 
+                        help="save the inputs of each run to PATH when it "
+                             "ends")
+    parser.add_argument("--replay", metavar="PATH", 
+                        help="replay a recorded run without a window as fast "
+                             "as possible, then exit")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="trace the session and save the most recent "
+                             "spans to PATH as Chrome trace JSON on exit")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="trace the memory allocated by Python, which "
+                             "slows the game down, and compare a snapshot "
+                             "of it after every run")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="profile the session with cProfile and save it "
+                             "to PATH as collapsed stacks for flame graphs "
+                             "on exit")
+    args = parser.parse_args()
+
+    tracing.tracer.enabled = args.trace is not None
+    if args.trace_memory:
+        memory.start_tracing()
+        memory.take_snapshot()
+
+    if args.replay is not None:
+        session = functools.partial(replay.main, args.replay)
+    else:
+        session = Game(args.seed, args.record).run
+
+    if args.profile is not None:
+        profile = cProfile.Profile()
+        result = profile.runcall(session)
+        tracing.save_collapsed_stacks(profile, args.profile)
+    else:
+        result = session()
+
+    if args.trace is not None:
+        tracing.tracer.save(args.trace)
+
+    # A replay that doesn't match the recorded run fails
+    if args.replay is not None:
+        sys.exit(0 if result else 1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,292 @@
+"""
+A MemoryMonitor class to report how much memory the game holds in surfaces,
+entities and caches, and how the memory allocated by Python changes over time,
+to find what grows across runs of the game.
+"""
+
+# Import modules
+from assets import assets
+from boat import Boat
+from fonts import font_cache
+from kinematics import Kinematics
+import pygame as pg
+import tracemalloc
+
+def get_surfaces_bytes(surfaces) -> int:
+    """Return the number of bytes held by the pixels of some surfaces.
+
+    Arguments:
+        surfaces : iterable of pg.Surface
+            the surfaces
+
+    Returns:
+        bytes
+            total size of their pixels in memory
+    """
+
+    return sum(assets.get_surface_bytes(surface) for surface in surfaces)
+
+def get_arrays_bytes(arrays) -> int:
+    """Return the number of bytes held by some arrays.
+
+    Arguments:
+        arrays : iterable of np.ndarray
+            the arrays
+
+    Returns:
+        bytes
+            total size of their elements in memory
+    """
+
+    return sum(array.nbytes for array in arrays)
+
+def get_asset_usage() -> list[tuple]:
+    """Return the memory held by each loaded asset.
+
+    Returns:
+        usage
+            (asset, 1, bytes) for each loaded asset
+    """
+
+    return [(str(key), 1, stats["bytes"])
+            for key, stats in assets.stats.items()]
+
+def get_cache_usage() -> list[tuple]:
+    """Return the size of the caches shared by the whole game.
+
+    Returns:
+        usage
+            (cache, entries, bytes) for each cache
+    """
+
+    return [("fonts", len(font_cache.fonts), 0),
+            ("rendered texts", len(font_cache.texts),
+             get_surfaces_bytes(font_cache.texts.values())),
+            ("boat rotations", len(Boat.rotation_cache),
+             get_surfaces_bytes(img for img, _ in
+                                Boat.rotation_cache.values())),
+            ("trig", len(Kinematics.trig_cache), 0)]
+
+class MemoryMonitor:
+    """MemoryMonitor class. Memory is reported in sections, e.g. surfaces or
+    caches, each filled by the sources added to it; a source returns a row of
+    (name, count, bytes) for each thing it holds.
+
+    Memory allocated by Python is only traced once tracing is started, since
+    it slows the whole game down. A snapshot of it is then taken whenever
+    asked, e.g. every time a run ends, and compared with the one before and
+    with the first one, so whatever keeps growing shows up at the top."""
+
+    def __init__(self, top=10, refresh=60, font_size=16):
+        """Initialization method.
+
+        Arguments:
+            top : int
+                number of lines of code to report that grew the most
+            refresh : int
+                number of frames between each rebuild of the overlay
+            font_size : int
+                font size of the overlay's text
+        """
+
+        self.top = top
+        self.refresh = refresh
+        self.font_size = font_size
+
+        # Sources of each section, in the order they were added; each one is
+        # (section, source)
+        self.sources = []
+
+        # First and last tracemalloc snapshots, and the lines of code whose
+        # allocations grew the most between the last two snapshots and since
+        # the first
+        self.first_snapshot = None
+        self.last_snapshot = None
+        self.last_diff = []
+        self.total_diff = []
+
+        # Whether or not the overlay is shown
+        self.shown = False
+
+        # Overlay surface and the number of frames left until it is rebuilt
+        self.overlay = None
+        self.frames_to_refresh = 0
+
+        self.add_source("surfaces", get_asset_usage)
+        self.add_source("caches", get_cache_usage)
+
+    def add_source(self, section: str, source):
+        """Add a source of memory to report.
+
+        Arguments:
+            section
+                section to report it in
+            source : function
+                returns [(name, count, bytes), ...]
+        """
+
+        self.sources.append((section, source))
+
+    def start_tracing(self, num_frames=1):
+        """Start tracing the memory allocated by Python.
+
+        Arguments:
+            num_frames : int
+                number of frames of the stack kept for each allocation
+        """
+
+        tracemalloc.start(num_frames)
+
+    def take_snapshot(self):
+        """Take a snapshot of the memory allocated by Python and compare it
+        with the last and first ones; does nothing unless tracing."""
+
+        if not tracemalloc.is_tracing():
+            return
+
+        # Leave out tracemalloc's own allocations
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)])
+
+        if self.last_snapshot is not None:
+            self.last_diff = snapshot.compare_to(self.last_snapshot,
+                                                 "lineno")[:self.top]
+            self.total_diff = snapshot.compare_to(self.first_snapshot,
+                                                  "lineno")[:self.top]
+        else:
+            self.first_snapshot = snapshot
+
+        self.last_snapshot = snapshot
+
+    def get_report(self) -> dict[str, list[tuple]]:
+        """Return the memory held by every source.
+
+        Returns:
+            report
+                [(name, count, bytes), ...] of each source, keyed by section
+        """
+
+        report = {}
+        for section, source in self.sources:
+            report.setdefault(section, []).extend(source())
+
+        return report
+
+    def format_report(self) -> str:
+        """Return the report as tables with totals, followed by how the
+        memory allocated by Python changed if it is being traced.
+
+        Returns:
+            text
+                one line per thing held with its count and memory in KB
+        """
+
+        lines = []
+        for section, rows in self.get_report().items():
+            lines.append(f"{section:<50} {'count':>8} {'KB':>10}")
+            for name, count, num_bytes in rows:
+                lines.append(f"  {name:<48} {count:>8} "
+                             f"{num_bytes / 1024:>10.1f}")
+            lines.append(f"  {'total':<48} {sum(row[1] for row in rows):>8} "
+                         f"{sum(row[2] for row in rows) / 1024:>10.1f}")
+            lines.append("")
+
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            lines.append(f"traced: {current / 1024:.1f} KB, "
+                         f"peak {peak / 1024:.1f} KB")
+
+            for title, diff in [("since the last snapshot", self.last_diff),
+                                ("since the first snapshot",
+                                 self.total_diff)]:
+                lines.append(f"largest changes {title}:")
+                lines.extend(f"  {stat}" for stat in diff)
+        else:
+            lines.append("tracemalloc is off")
+
+        return "\n".join(lines)
+
+    def save(self, path: str):
+        """Take a snapshot and save the report to a text file.
+
+        Arguments:
+            path
+                file to save to
+        """
+
+        self.take_snapshot()
+
+        with open(path, "w") as file:
+            file.write(self.format_report() + "\n")
+
+    def toggle(self):
+        """Show the overlay if it is hidden, otherwise hide it."""
+
+        self.shown = not self.shown
+        self.frames_to_refresh = 0
+
+    def build_overlay(self) -> pg.Surface:
+        """Draw the overlay: the total of each section and its rows, and the
+        traced memory if it is being traced.
+
+        Returns:
+            overlay
+                the drawn overlay
+        """
+
+        font = font_cache.get_font(self.font_size)
+        line_h = font.get_linesize()
+        name_w = 260
+        col_w = 90
+
+        rows = []
+        for section, section_rows in self.get_report().items():
+            total = sum(row[2] for row in section_rows)
+            rows.append([section, "", f"{total / 1024:.0f} KB"])
+            rows.extend([f"  {name[-30:]}", str(count),
+                         f"{num_bytes / 1024:.0f} KB"]
+                        for name, count, num_bytes in section_rows)
+
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            rows.append(["traced / peak", f"{current / 2**20:.1f} MB",
+                         f"{peak / 2**20:.1f} MB"])
+
+        width = name_w + 2 * col_w + 10
+        overlay = pg.Surface((width, line_h * len(rows) + 10), pg.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))
+
+        # Text is rendered straight from the font instead of cached, so the
+        # overlay doesn't grow the cache it reports
+        for i, row in enumerate(rows):
+            for j, text in enumerate(row):
+                label = font.render(text, False, (255, 255, 255))
+                x = 5 + (name_w + col_w * (j - 1) if j > 0 else 0)
+                overlay.blit(label, (x, 5 + line_h * i))
+
+        return overlay
+
+    def draw(self, screen: pg.Surface) -> pg.Rect:
+        """Draw the overlay in the bottom right of the screen, rebuilding it
+        every refresh frames.
+
+        Arguments:
+            screen
+                pygame screen to draw on
+
+        Returns:
+            rect
+                area of the screen drawn on
+        """
+
+        if self.frames_to_refresh == 0:
+            self.overlay = self.build_overlay()
+            self.frames_to_refresh = self.refresh
+        self.frames_to_refresh -= 1
+
+        return screen.blit(self.overlay,
+                           (screen.get_width() - self.overlay.get_width(),
+                            screen.get_height() - self.overlay.get_height()))
+
+# Reports the memory held by the whole game
+memory = MemoryMonitor()
@@ -3,12 +3,15 @@ An Obstacles class to represent all of the obstacles displayed on the screen.
 """
 
 # Import modules
-from obstacle import Obstacle
+from boat import Boat
+from collision import collide_rects_polygon
+from entities import EntityStore
+import numpy as np
 import pygame as pg
-import random
 
 class Obstacles:
-    """Obstacles class."""
+    """Obstacles class. The obstacles are stored as arrays in an EntityStore so
+    they are moved and culled all at once."""
     
     def __init__(self, screen: pg.surface, imgs: list):
         """Initialization method.
@@ -23,41 +26,30 @@ class Obstacles:
         self.screen = screen
         self.imgs = imgs
 
-        # List to store all obstacles
-        self.obstacles = []
+        # Size of each type of obstacle; [[width, height], ...]
+        self.sizes = np.array([img.get_size() for img in imgs], dtype=float)
+        # Half of each size; how far each type's hit box extends from its
+        # position
+        self.half_sizes = self.sizes / 2
+        # Largest half width and half height of any type; an obstacle can only
+        # collide with something if its position is this close to it
+        self.max_half_size = self.half_sizes.max(axis=0)
+
+        # Positions and types of all obstacles, in the order they were
+        # generated
+        self.store = EntityStore()
     
-    def gen_new_obs(self, 
-                    gen_chance: float, 
-                    dist_btwn_obs: int, 
-                    river_lanes: list[int]):
-        """Generate a new obstacles.
-        
+    def spawn(self, pos: list[float], type_id: int):
+        """Add an obstacle.
+
         Arguments:
-            gen_chance
-                chance to generate new obstacles; 0-1
-            dist_btwn_obs
-                the minimum number of vertical pixels between each coin
-            river_lanes
-                middle x-coords of the three lanes in the river
+            pos
+                obstacle position; [pos_x, pos_y]
+            type_id
+                type of obstacle; index of its image in imgs
         """
 
-        # Check if enough distance between last obstacle and randomly generate
-        if len(self.obstacles) == 0 or \
-            self.obstacles[-1].pos[1] >= dist_btwn_obs and \
-                random.random() < gen_chance:
-
-            # Generate random lane number and random type of obstacle 
-            # (log or rock)
-            rand_lane = random.randint(0, 2)
-            rand_obs_type = random.randint(0, 1)
-
-            # Place obstacle off of screen in the random lane
-            pos = [river_lanes[rand_lane], -100]
-
-            # Index random obstacle image
-            img = self.imgs[rand_obs_type]
-
-            self.obstacles.append(Obstacle(self.screen, img, pos))
+        self.store.spawn(pos, type_id)
 
     def update(self, boat_vel: list[float], SCREEN_H: int):
         """Update every obstacle's position.
@@ -69,50 +61,72 @@ class Obstacles:
                 screen height in pixels
         """
 
-        # NOTE: using a while loop instead of a for loop due to removing from
-        # array in the middle of loop
-        count = 0
-        while count < len(self.obstacles):
-            obs = self.obstacles[count]
-            # Move the obstacle based on the boat's velocity -> in sync with 
-            # background and coins
-            obs.move(boat_vel)
-
-            # If the obstacle is out of the screen, remove it from the list
-            if obs.pos[1] > SCREEN_H + 50:
-                self.obstacles.remove(obs)
-                count += 1
-            count += 1
+        # Move every obstacle based on the boat's velocity -> in sync with 
+        # background and coins
+        self.store.move(boat_vel[1])
+
+        # Remove every obstacle that is out of the screen
+        self.store.cull(SCREEN_H + 50)
         
-    def is_colliding_boat(self, boat_poly_coords: list[list[float]]) -> bool:
+    def is_colliding_boat(self, boat: Boat) -> bool:
         """Check whether or not the boat has collided with any obstacles.
         
         Arguments:
-            boat_poly_coords
-                boat polygon coordinates
+            boat
+                the boat to test against the obstacles
         
         Returns:
             whether or not any collision occured
         """
 
-        for obs in self.obstacles:
-            # Update the rectangle representing the obstacle's hit box
-            obs.update_obs_rect()
-            if obs.is_colliding_boat(boat_poly_coords):
-                return True
-        return False
+        if len(self.store) == 0:
+            return False
+
+        # Only obstacles close enough to overlap the boat's bounding box need 
+        # the exact test, so the boat's projection is only worked out for them
+        min_pos, max_pos = boat.get_poly_bounds()
+        rows = self.store.query(np.subtract(min_pos, self.max_half_size), 
+                                np.add(max_pos, self.max_half_size))
+        if len(rows) == 0:
+            return False
+
+        # The remaining obstacles' hit boxes are tested at once
+        colliding = collide_rects_polygon(
+            self.store.get_pos()[rows], 
+            self.half_sizes[self.store.get_type_ids()[rows]],
+            boat.get_poly_projection())
 
-    def get_obstacles(self) -> list[Obstacle]:
-        """Return the list of all obstacles.
+        return bool(colliding.any())
+
+    def get_positions(self) -> np.ndarray:
+        """Return the positions of all obstacles.
+
+        Returns:
+            positions
+                positions in the order they were generated; 
+                [[pos_x, pos_y], ...]
+        """
+
+        return self.store.get_pos()
+
+    def draw(self, offset=0.0) -> list[pg.Rect]:
+        """Draw all obstacles on the screen.
         
+        Arguments:
+            offset : float
+                vertical offset from the obstacles' positions to draw them at
+
         Returns:
-            obstacles
+            rects
+                areas of the screen drawn on
         """
 
-        return self.obstacles
+        type_ids = self.store.get_type_ids()
 
-    def draw(self):
-        """Draw all obstacles on the screen."""
+        # Top left coords of every obstacle
+        top_left = self.store.get_pos() - self.sizes[type_ids] / 2
+        top_left[:, 1] += offset
 
-        for obs in self.obstacles:
-            obs.draw()
\ No newline at end of file
+        return self.screen.blits([(self.imgs[type_id], tuple(dest)) 
+                                  for type_id, dest in zip(type_ids, 
+                                                           top_left)])
\ No newline at end of file
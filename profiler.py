@@ -0,0 +1,246 @@
+"""
+A FrameProfiler class to time the stages of every frame of the game and show
+them in an overlay on top of it.
+"""
+
+# Import modules
+from collections import deque
+from contextlib import contextmanager
+import csv
+from fonts import font_cache
+import numpy as np
+import pygame as pg
+import time
+from tracing import tracer
+
+class FrameProfiler:
+    """FrameProfiler class. Code run in a frame is timed in named stages, and
+    the time of each stage and of the whole frame is kept for the most recent
+    frames. A stage's time doesn't include stages timed inside it, e.g. a
+    database call made while drawing the title screen only counts as db.
+    Every stage and frame is also recorded as a span while tracing is on.
+
+    The overlay shows the mean and percentiles of each stage, how often
+    rendered text was found in the font cache, and a graph of the frame
+    times; it is only rebuilt every few frames so it barely adds to
+    the frames it measures."""
+
+    # Stages every frame is split into
+    STAGES = ("sim", "collision", "draw", "hud", "db", "present")
+
+    # Percentiles of each stage shown in the overlay
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, max_frames=600, refresh=15, font_size=16):
+        """Initialization method.
+
+        Arguments:
+            max_frames : int
+                number of most recent frames to keep
+            refresh : int
+                number of frames between each rebuild of the overlay
+            font_size : int
+                font size of the overlay's text
+        """
+
+        self.refresh = refresh
+        self.font_size = font_size
+
+        # Whether or not the overlay is shown
+        self.shown = False
+
+        # Time in seconds of each of the most recent frames and of each of
+        # their stages; [(frame_time, {stage: time, ...}), ...]
+        self.frames = deque(maxlen=max_frames)
+
+        # Time of each stage so far in the current frame
+        self.current = dict.fromkeys(self.STAGES, 0.0)
+
+        # Time spent in the stages timed inside each stage being timed, from
+        # the outermost to the innermost
+        self.stack = []
+
+        # When the last frame ended
+        self.frame_end = time.perf_counter()
+
+        # Overlay surface and the number of frames left until it is rebuilt
+        self.overlay = None
+        self.frames_to_refresh = 0
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the code run inside a with statement as a stage of the current
+        frame.
+
+        Arguments:
+            name
+                name of the stage; one of STAGES
+        """
+
+        start = time.perf_counter()
+        self.stack.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            inner = self.stack.pop()
+            self.current[name] += elapsed - inner
+            if tracer.enabled:
+                tracer.add_event("X", name, "frame", start, elapsed)
+
+            # Don't count this stage's time again in the stage around it
+            if len(self.stack) > 0:
+                self.stack[-1] += elapsed
+
+    def end_frame(self):
+        """Keep the times of the current frame and start a new one."""
+
+        now = time.perf_counter()
+        self.frames.append((now - self.frame_end, self.current))
+        if tracer.enabled:
+            tracer.add_event("X", "frame", "frame", self.frame_end,
+                             now - self.frame_end)
+        self.frame_end = now
+
+        self.current = dict.fromkeys(self.STAGES, 0.0)
+
+    def toggle(self):
+        """Show the overlay if it is hidden, otherwise hide it."""
+
+        self.shown = not self.shown
+        self.frames_to_refresh = 0
+
+    def get_times(self) -> np.ndarray:
+        """Return the times of the most recent frames.
+
+        Returns:
+            times
+                time in seconds of each frame and each of its stages, one row
+                per frame; [[frame_time, *stage_times], ...]
+        """
+
+        return np.array([[frame_time] + [stages[name]
+                                         for name in self.STAGES]
+                         for frame_time, stages in self.frames])
+
+    def get_stats(self) -> dict[str, list[float]]:
+        """Return the mean and percentiles of the frame time and each stage's
+        time in milliseconds over the most recent frames.
+
+        Returns:
+            stats
+                mean followed by each of PERCENTILES, keyed by "frame" and
+                each stage
+        """
+
+        times = self.get_times() * 1000
+        if len(times) == 0:
+            return {}
+
+        means = times.mean(axis=0)
+        percentiles = np.percentile(times, self.PERCENTILES, axis=0)
+
+        return {name: [means[i]] + list(percentiles[:, i])
+                for i, name in enumerate(("frame",) + self.STAGES)}
+
+    def save_csv(self, path: str):
+        """Save the times of the most recent frames as CSV.
+
+        Arguments:
+            path
+                file to save to
+        """
+
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["frame_ms"] + [f"{name}_ms"
+                                            for name in self.STAGES])
+            writer.writerows(np.round(self.get_times() * 1000, 4))
+
+    def build_overlay(self, target_ms: float) -> pg.Surface:
+        """Draw the overlay: a table of the stats of each stage and the font
+        cache's text hits and misses above a graph of the most recent frame
+        times.
+
+        Arguments:
+            target_ms
+                frame time in milliseconds the game aims for; drawn as a line
+                across the graph, which goes up to twice it
+
+        Returns:
+            overlay
+                the drawn overlay
+        """
+
+        font = font_cache.get_font(self.font_size)
+        line_h = font.get_linesize()
+        name_w = 90
+        col_w = 60
+        graph_h = 80
+
+        columns = ["ms", "mean"] + [f"p{p}" for p in self.PERCENTILES]
+        rows = [[name] + [f"{value:.2f}" for value in values]
+                for name, values in self.get_stats().items()]
+
+        # Hits and misses of rendered text since the game started, as a 
+        # second table under the first
+        text_stats = font_cache.get_stats()
+        lookups = text_stats["hits"] + text_stats["misses"]
+        hit_rate = text_stats["hits"] / lookups if lookups > 0 else 0
+        rows += [["cache", "hits", "miss", "rate"],
+                 ["texts", str(text_stats["hits"]), str(text_stats["misses"]),
+                  f"{hit_rate:.0%}"]]
+
+        width = name_w + col_w * (len(columns) - 1) + 10
+        height = line_h * (len(rows) + 1) + graph_h + 15
+        overlay = pg.Surface((width, height), pg.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))
+
+        # Text is rendered straight from the font instead of cached, since
+        # the numbers are rarely the same twice
+        for i, row in enumerate([columns] + rows):
+            for j, text in enumerate(row):
+                label = font.render(text, False, (255, 255, 255))
+                x = 5 + (name_w + col_w * (j - 1) if j > 0 else 0)
+                overlay.blit(label, (x, 5 + line_h * i))
+
+        # One bar per frame, red if it took longer than target_ms
+        graph_top = height - graph_h - 5
+        frame_times = [frame_time * 1000 for frame_time, _ in self.frames]
+        for x, frame_ms in enumerate(frame_times[-(width - 10):]):
+            bar_h = min(graph_h, round(frame_ms / (2 * target_ms) * graph_h))
+            color = (255, 80, 80) if frame_ms > target_ms else (80, 255, 80)
+            pg.draw.line(overlay, color, (5 + x, graph_top + graph_h),
+                         (5 + x, graph_top + graph_h - bar_h))
+
+        target_y = graph_top + graph_h // 2
+        pg.draw.line(overlay, (255, 255, 255), (5, target_y),
+                     (width - 5, target_y))
+
+        return overlay
+
+    def draw(self, screen: pg.Surface, target_ms: float) -> pg.Rect:
+        """Draw the overlay in the top right of the screen, rebuilding it
+        every refresh frames.
+
+        Arguments:
+            screen
+                pygame screen to draw on
+            target_ms
+                frame time in milliseconds the game aims for
+
+        Returns:
+            rect
+                area of the screen drawn on
+        """
+
+        if self.frames_to_refresh == 0:
+            self.overlay = self.build_overlay(target_ms)
+            self.frames_to_refresh = self.refresh
+        self.frames_to_refresh -= 1
+
+        return screen.blit(self.overlay,
+                           (screen.get_width() - self.overlay.get_width(), 0))
+
+# Times the frames of the whole game
+profiler = FrameProfiler()
@@ -0,0 +1,149 @@
+"""
+A Renderer class to present only the parts of the screen that changed since
+the last frame.
+"""
+
+# Import modules
+import pygame as pg
+
+class Renderer:
+    """Renderer class. Everything drawn on the screen is marked with a key, the
+    rectangles it touched, and optionally a state. Only the rectangles whose
+    contents changed since the last frame are updated on the display; if they
+    cover the whole screen, the display is flipped instead."""
+
+    def __init__(self, screen: pg.surface, dirty_rects=True):
+        """Initialization method.
+
+        Arguments:
+            screen
+                pygame screen to display contents
+            dirty_rects : bool
+                whether to only update the changed rectangles or always flip
+                the whole display
+        """
+
+        self.screen = screen
+        self.dirty_rects = dirty_rects
+
+        # Rectangles and state of everything drawn in the last frame and in the
+        # current frame, keyed by what was drawn
+        self.drawn = {}
+        self.drawing = {}
+
+        # Rectangles that changed in the current frame
+        self.rects = []
+
+        # Whether or not the whole display must be flipped; the first frame
+        # always flips
+        self.full_redraw = True
+
+    def invalidate(self):
+        """Flip the whole display at the end of the current frame."""
+
+        self.full_redraw = True
+
+    def mark(self, key, rects, state=None):
+        """Mark what was drawn under key in the current frame. Its rectangles
+        are dirty if they or state differ from the last frame.
+
+        Arguments:
+            key : any
+                what was drawn, e.g. the object that drew itself
+            rects : pg.Rect or list[pg.Rect]
+                rectangles touched on the screen
+            state : any
+                anything besides position that changes what was drawn, e.g.
+                the text of a label
+        """
+
+        if rects is None:
+            rects = []
+        elif isinstance(rects, pg.Rect):
+            rects = [rects]
+
+        # Rectangles and states drawn under key so far in the current frame
+        drawing = self.drawing.setdefault(key, ([], []))
+        drawing[0].extend(pg.Rect(rect) for rect in rects)
+        drawing[1].append(state)
+
+    def mark_screen(self, key, state=None):
+        """Mark the whole screen as drawn under key in the current frame. 
+        Everything marked before it in the frame has been drawn over, so it is
+        forgotten.
+
+        Arguments:
+            key : any
+                what was drawn over the whole screen
+            state : any
+                anything that changes what was drawn
+        """
+
+        self.drawing = {}
+        self.mark(key, self.screen.get_rect(), state)
+
+    def find_changes(self):
+        """Collect the rectangles of everything that changed since the last
+        frame, including where things used to be."""
+
+        for key, drawing in self.drawing.items():
+            drawn = self.drawn.get(key)
+            if drawn != drawing:
+                self.rects.extend(drawing[0])
+                if drawn is not None:
+                    self.rects.extend(drawn[0])
+
+        # Anything drawn in the last frame but not in this one must be erased
+        for key, drawn in self.drawn.items():
+            if key not in self.drawing:
+                self.rects.extend(drawn[0])
+
+    def merge_rects(self, rects: list[pg.Rect]) -> list[pg.Rect]:
+        """Merge overlapping rectangles and clip them to the screen.
+
+        Arguments:
+            rects
+                rectangles to merge
+
+        Returns:
+            merged
+                non-overlapping rectangles on the screen
+        """
+
+        screen_rect = self.screen.get_rect()
+
+        merged = []
+        for rect in rects:
+            rect = rect.clip(screen_rect)
+            if rect.width == 0 or rect.height == 0:
+                continue
+
+            # Keep absorbing rectangles until it overlaps none of them
+            i = rect.collidelist(merged)
+            while i != -1:
+                rect.union_ip(merged.pop(i))
+                i = rect.collidelist(merged)
+
+            merged.append(rect)
+
+        return merged
+
+    def present(self):
+        """Update the changed parts of the display and start a new frame."""
+
+        self.find_changes()
+        rects = self.merge_rects(self.rects)
+
+        # Fall back to a full flip when everything has changed anyway
+        full_redraw = self.full_redraw or not self.dirty_rects or \
+            any(rect == self.screen.get_rect() for rect in rects)
+
+        if full_redraw:
+            pg.display.flip()
+        elif len(rects) > 0:
+            pg.display.update(rects)
+
+        self.drawn = self.drawing
+        self.drawing = {}
+        self.rects = []
+        self.full_redraw = False
@@ -0,0 +1,190 @@
+"""
+An InputRecorder class to record the inputs of a run of the game, and a replay
+function to play a recorded run again without a window as fast as possible.
+The simulation is seeded and runs on a fixed timestep, so a replay plays out
+exactly like the recorded run, which makes recordings a reproducible workload
+for benchmarks and regression checks.
+
+Run this module to replay a recording:
+    python replay.py recording.json
+"""
+
+# Import modules
+from assets import assets
+import json
+import pygame as pg
+from sim import Simulation
+import sys
+import time
+
+class InputRecorder:
+    """InputRecorder class."""
+
+    # Character each turn_dir is stored as
+    CODES = {"cc": "l", "c": "r", "": "-"}
+
+    def __init__(self, config: dict):
+        """Initialization method.
+
+        Arguments:
+            config
+                everything needed to make the simulation being recorded,
+                including its seed; see Simulation.config
+        """
+
+        self.config = dict(config)
+
+        # turn_dir of every tick, as a character from CODES
+        self.codes = []
+
+        # Ticks, score and coins collected at the end of the run; None until
+        # it is saved or loaded
+        self.results = None
+
+    def record(self, turn_dir: str):
+        """Record the input of one tick.
+
+        Arguments:
+            turn_dir
+                whether the boat was turned counter-clockwise or clockwise
+        """
+
+        self.codes.append(self.CODES[turn_dir])
+
+    def get_turn_dirs(self) -> list[str]:
+        """Return the recorded inputs.
+
+        Returns:
+            turn_dirs
+                turn_dir of every tick
+        """
+
+        turn_dirs = {code: turn_dir for turn_dir, code in self.CODES.items()}
+
+        return [turn_dirs[code] for code in self.codes]
+
+    def get_num_ticks(self) -> int:
+        """Return the number of ticks recorded."""
+
+        return len(self.codes)
+
+    def save(self, path: str, sim: Simulation):
+        """Save the recording as JSON.
+
+        Arguments:
+            path
+                file to save the recording to
+            sim
+                the simulation that was recorded; its results are saved so a
+                replay can be checked against them
+        """
+
+        self.results = get_results(sim)
+
+        with open(path, "w") as file:
+            json.dump({"config": self.config,
+                       "inputs": "".join(self.codes),
+                       "results": self.results}, file)
+
+    @classmethod
+    def load(cls, path: str):
+        """Load a recording saved as JSON.
+
+        Arguments:
+            path
+                file the recording was saved to
+
+        Returns:
+            recorder
+                the loaded recording
+        """
+
+        with open(path) as file:
+            data = json.load(file)
+
+        recorder = cls(data["config"])
+        recorder.codes = list(data["inputs"])
+        recorder.results = data["results"]
+
+        return recorder
+
+def get_results(sim: Simulation) -> dict:
+    """Return the results of a simulation.
+
+    Arguments:
+        sim
+            the simulation
+
+    Returns:
+        results
+            ticks, score and coins collected
+    """
+
+    return {"ticks": sim.ticks,
+            "score": sim.score,
+            "coins_collected": sim.coins_collected}
+
+def replay(recorder: InputRecorder,
+           boat_img: pg.Surface,
+           obstacle_imgs: list[pg.Surface]) -> Simulation:
+    """Play a recording again, ticking the simulation the same way Game.run
+    does but without waiting between ticks.
+
+    Arguments:
+        recorder
+            the recording
+        boat_img
+            boat image
+        obstacle_imgs
+            images for all types of obstacles
+
+    Returns:
+        sim
+            the simulation after the last recorded tick
+    """
+
+    sim = Simulation(boat_img, obstacle_imgs, **recorder.config)
+
+    for turn_dir in recorder.get_turn_dirs():
+        # Game.run stops ticking once the boat collides
+        if sim.is_colliding_boat():
+            break
+
+        sim.step(turn_dir)
+
+    return sim
+
+def main(path: str) -> bool:
+    """Replay a recording and check it matches the recorded run.
+
+    Arguments:
+        path
+            file the recording was saved to
+
+    Returns:
+        whether or not the replay matched the recorded run
+    """
+
+    recorder = InputRecorder.load(path)
+
+    # Images are only needed for their sizes, so no display is opened
+    boat_img = assets.get_image('Images/boat.png')
+    obstacle_imgs = [assets.get_image('Images/rock.png'),
+                     assets.get_image('Images/log.png')]
+
+    start = time.perf_counter()
+    sim = replay(recorder, boat_img, obstacle_imgs)
+    elapsed = time.perf_counter() - start
+
+    results = get_results(sim)
+    print(f"{sim.ticks} ticks in {elapsed:.2f} s "
+          f"({sim.ticks / elapsed:.0f} ticks/s), score {sim.score:.0f}, "
+          f"{sim.coins_collected} coins")
+
+    if results != recorder.results:
+        print(f"Replay doesn't match the recorded run: {recorder.results}")
+        return False
+    return True
+
+if __name__ == "__main__":
+    sys.exit(0 if main(sys.argv[1]) else 1)
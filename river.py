@@ -0,0 +1,196 @@
+"""
+A RiverStream class to represent the background of the game as an endless river
+made of a chain of river segments that are loaded as they are needed.
+"""
+
+# Import modules
+from assets import assets
+from background import Background
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import pygame as pg
+
+class RiverStream(Background):
+    """RiverStream class. The segments of the course are chained one after the
+    other on repeat. Each segment is an area cut out of an image, or a whole
+    image, so one image can be cut into several segments. The next segment is
+    decoded on a background thread while the current ones scroll, and
+    segments are forgotten once they scroll off the bottom of the screen.
+
+    Images are loaded through the asset manager, so they show up in its
+    report, and are unloaded once no segment on the screen or about to be
+    placed is cut out of them."""
+
+    # Background thread shared by every river to decode the next segment
+    loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="river")
+
+    def __init__(self, screen: pg.surface, course: list[str]):
+        """Initialization method.
+
+        Arguments:
+            screen
+                pygame screen to display contents
+            course
+                river segments in the order they are chained; each is the path
+                to an image and the area of it cut out as the segment, 
+                (x, y, w, h) in the image's pixels, or None for the whole image
+        """
+
+        self.screen = screen
+        self.course = course
+
+        self.screen_w, self.screen_h = screen.get_size()
+
+        # Index in course of the next segment to be chained, and the path to
+        # the image of the segment being decoded
+        self.next_index = 0
+        self.next_path = None
+
+        # Placed segments from the bottom to the top of the river; each one is
+        # [segment, image, pos] where segment is (path, area) from course
+        self.segments = deque()
+
+        # Images of the placed segments keyed by (path, area) so a segment 
+        # repeated in a row is only loaded once
+        self.loaded = {}
+
+        # Image of the next segment, being decoded on the loader thread
+        self.next_segment = self.load_next_segment()
+
+        # Place the first segment with its top at the top of the screen, or
+        # with its bottom at the bottom of the screen if it is shorter than
+        # the screen, then chain segments above it up to the top
+        segment, img = self.next_segment.result()
+        self.place_segment(segment, img, 
+                           [0, max(0, self.screen_h - img.get_size()[1])])
+        self.loop_imgs()
+
+    def load_segment(self, segment: tuple) -> tuple[tuple, pg.Surface]:
+        """Load a segment's image, converted to the display's pixel format, 
+        cut the segment out of it and scale it to the width of the screen.
+
+        NOTE: runs on the loader thread
+
+        Arguments:
+            segment
+                path to the image of the segment and the area cut out of it
+
+        Returns:
+            segment
+                path to the image of the segment and the area cut out of it
+            img
+                segment image
+        """
+
+        path, area = segment
+        img = assets.get_image(path)
+
+        # Copy the segment out of the image so the image can be unloaded
+        if area is not None:
+            img = img.subsurface(area).copy()
+
+        # Scale to the width of the screen, keeping the aspect ratio
+        w, h = img.get_size()
+        if w != self.screen_w:
+            img = pg.transform.scale(img, (self.screen_w,
+                                           round(h * self.screen_w / w)))
+
+        return segment, img
+
+    def load_next_segment(self) -> Future:
+        """Start decoding the next segment of the course.
+
+        Returns:
+            future
+                resolves to the next segment and its image
+        """
+
+        segment = tuple(self.course[self.next_index])
+        self.next_path = segment[0]
+        self.next_index = (self.next_index + 1) % len(self.course)
+
+        # Reuse the image if the segment is already placed
+        if segment in self.loaded:
+            future = Future()
+            future.set_result((segment, self.loaded[segment]))
+            return future
+
+        return self.loader.submit(self.load_segment, segment)
+
+    def place_segment(self, segment: tuple, img: pg.Surface, 
+                      pos: list[float]):
+        """Place a segment at the top of the river and start decoding the next
+        one.
+
+        Arguments:
+            segment
+                path to the image of the segment and the area cut out of it
+            img
+                segment image
+            pos
+                top left of the segment on the screen
+        """
+
+        self.loaded[segment] = img
+        self.segments.append([segment, img, pos])
+        self.next_segment = self.load_next_segment()
+
+    def get_pos(self) -> list[float]:
+        """Return the position of the bottom segment.
+
+        Returns:
+            pos
+                top left of the bottom segment on the screen
+        """
+
+        return self.segments[0][2]
+
+    def move(self, boat_vel: list[float]):
+        """Move the segments based on the boat's vertical velocity."""
+
+        for segment in self.segments:
+            segment[2][1] += boat_vel[1]
+
+    def loop_imgs(self):
+        """Forget the segments that scrolled off the screen and chain the next
+        segment once the top of the river scrolls into the screen."""
+
+        # Forget the segments that are fully below the screen first, so the 
+        # segment after the one placed next is decoded again instead of 
+        # reusing the image of one that is about to be forgotten
+        while self.segments[0][2][1] >= self.screen_h:
+            segment = self.segments.popleft()[0]
+            if all(placed[0] != segment for placed in self.segments):
+                del self.loaded[segment]
+
+            # Unload the image once no other segment is cut out of it
+            path = segment[0]
+            if path != self.next_path and \
+                all(placed[0][0] != path for placed in self.segments):
+                assets.unload(path)
+
+        # Place the next segment above the top one before a gap can show
+        while self.segments[-1][2][1] > 0:
+            segment, img = self.next_segment.result()
+            top = self.segments[-1][2][1] - img.get_size()[1]
+            self.place_segment(segment, img, [0, top])
+
+    def draw(self, offset=0.0) -> list[pg.Rect]:
+        """Draw the segments visible on the screen.
+
+        Arguments:
+            offset : float
+                vertical offset from the segments' positions to draw them at
+
+        Returns:
+            rects
+                areas of the screen drawn on
+        """
+
+        rects = []
+        for _, img, pos in self.segments:
+            y = pos[1] + offset
+            if y < self.screen_h and y + img.get_size()[1] > 0:
+                rects.append(self.screen.blit(img, (pos[0], y)))
+
+        return rects
@@ -0,0 +1,20 @@
+"""
+Set up the web-hosted database once: add the indexes the game relies on to
+look users up by username and read the leaderboard in order of highest_score.
+Adding an index that already exists does nothing, so it is safe to run again.
+
+Run by whoever manages the database, not by the game, since it changes the
+schema shared by every player.
+"""
+
+# Import modules
+from database import Database
+from main import Game
+
+database = Database(**Game.DATABASE_CONFIG)
+
+# Users are looked up by username, which must be unique
+database.add_index("USER_DATA", "username", unique=True)
+
+# The leaderboard is read in order of highest_score
+database.add_index("USER_DATA", "highest_score")
@@ -0,0 +1,205 @@
+"""
+A Simulation class to represent the game logic: the boat's physics, spawning
+obstacles and coins, collisions and scoring. It doesn't draw anything, so it can
+be stepped without a window.
+
+Run this module to measure how many ticks per second it can simulate.
+"""
+
+# Import modules
+from assets import assets
+from boat import Boat
+from coins import Coins
+from levelgen import LevelGenerator
+from obstacles import Obstacles
+import pygame as pg
+import random
+import time
+
+class Simulation:
+    """Simulation class."""
+
+    # y-coord obstacles and coins appear at, just above the top of the screen
+    SPAWN_Y = -100
+
+    def __init__(self,
+                 boat_img: pg.Surface,
+                 obstacle_imgs: list[pg.Surface],
+                 screen=None,
+                 init_boat_pos=(450, 700),
+                 boat_speed=5,
+                 river_edges=(300, 600),
+                 river_lanes=(350, 450, 550),
+                 dist_btwn_obs=450,
+                 dist_btwn_coins=200,
+                 screen_h=900,
+                 coin_size=64,
+                 seed=None,
+                 threaded=False):
+        """Initialization method.
+
+        Arguments:
+            boat_img
+                boat image; its size is the size of the boat
+            obstacle_imgs
+                images for all types of obstacles; their sizes are the sizes of
+                the obstacles
+            screen : pg.Surface
+                pygame screen the game objects are drawn on; None if they are
+                never drawn
+            init_boat_pos : tuple[int]
+                the boat's initial position
+            boat_speed : int
+                the boat's constant speed
+            river_edges : tuple[int]
+                x-coords of the left and right of the river
+            river_lanes : tuple[int]
+                middle x-coords of the three lanes in the river
+            dist_btwn_obs : int
+                the minimum number of vertical pixels between each obstacle
+            dist_btwn_coins : int
+                the minimum number of vertical pixels between each coin
+            screen_h : int
+                screen height in pixels
+            coin_size : int
+                width in pixels of the coins on the screen
+            seed : int
+                seed of the random number generator deciding where obstacles
+                and coins are generated; a random seed if None
+            threaded : bool
+                whether to lay out the river ahead on a background thread; 
+                the layout is the same either way
+        """
+
+        self.river_edges = list(river_edges)
+        self.river_lanes = list(river_lanes)
+        self.dist_btwn_obs = dist_btwn_obs
+        self.dist_btwn_coins = dist_btwn_coins
+        self.screen_h = screen_h
+
+        # Every random decision in the simulation comes from rng, so the same
+        # seed and the same inputs always play out the same way
+        if seed is None:
+            seed = random.randrange(2**32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        # Everything besides the images and screen needed to make an 
+        # identical simulation, e.g. to replay a recorded run
+        self.config = {"init_boat_pos": list(init_boat_pos),
+                       "boat_speed": boat_speed,
+                       "river_edges": list(river_edges),
+                       "river_lanes": list(river_lanes),
+                       "dist_btwn_obs": dist_btwn_obs,
+                       "dist_btwn_coins": dist_btwn_coins,
+                       "screen_h": screen_h,
+                       "coin_size": coin_size,
+                       "seed": seed}
+
+        self.boat = Boat(screen, boat_img, init_boat_pos, boat_speed)
+        self.obstacles = Obstacles(screen, obstacle_imgs)
+        self.coins = Coins(screen, coin_size)
+
+        # Lays out where obstacles and coins appear ahead of the screen
+        self.level = LevelGenerator(self.rng.randrange(2**32),
+                                    [img.get_size() for img in obstacle_imgs],
+                                    river_edges=river_edges,
+                                    river_lanes=river_lanes,
+                                    dist_btwn_obs=dist_btwn_obs,
+                                    dist_btwn_coins=dist_btwn_coins,
+                                    spawn_y=self.SPAWN_Y,
+                                    chunk_h=screen_h,
+                                    threaded=threaded)
+
+        # Distance in pixels the river has scrolled
+        self.distance = 0
+
+        # Score and number of coins collected in this run
+        self.score = 0
+        self.coins_collected = 0
+
+        # Number of ticks simulated
+        self.ticks = 0
+
+    def is_colliding_boat(self) -> bool:
+        """Return whether or not the boat has collided with any obstacles.
+
+        Returns:
+            whether or not any collision occured
+        """
+
+        return self.obstacles.is_colliding_boat(self.boat)
+
+    def step(self, turn_dir: str) -> bool:
+        """Advance the simulation by one tick.
+
+        Arguments:
+            turn_dir
+                whether to turn the boat counter-clockwise or clockwise
+
+        Returns:
+            whether or not a coin was collected
+        """
+
+        # Update the velocity, direction, position, and polygon coords of the
+        # boat
+        self.boat.update(turn_dir, self.river_edges)
+
+        # Add the obstacles and coins the river has scrolled to, as far past 
+        # SPAWN_Y as the river has scrolled since
+        self.distance += self.boat.get_vel()[1]
+        for dist, kind, x, type_id in self.level.pop(self.distance):
+            pos = [x, self.SPAWN_Y + self.distance - dist]
+            if kind == "obstacle":
+                self.obstacles.spawn(pos, type_id)
+            else:
+                self.coins.spawn(pos)
+
+        # Update the position of each obstacle and check if any are out of the
+        # screen
+        self.obstacles.update(self.boat.get_vel(), self.screen_h)
+
+        # Update the position and animation of each coins and check if any are
+        # out of the screen
+        self.coins.update(self.boat.get_vel(), self.screen_h)
+        # Check if the player collects any coins
+        collected = self.coins.is_colliding_boat(self.boat.get_pos())
+        if collected:
+            self.coins_collected += 1
+
+        # Update the score count
+        self.update_score(self.boat.get_vel())
+
+        self.ticks += 1
+
+        return collected
+
+    def update_score(self, boat_vel: list[float]):
+        """Update the score based on the boat's velocity.
+
+        Arguments:
+            boat_vel
+                contains the velocity vector  components; [vel_x, vel_y]
+        """
+
+        # Increment score by the y component of the boat's velocity
+        self.score += boat_vel[1]
+
+if __name__ == "__main__":
+    # Images are only needed for their sizes, so no display is opened
+    sim = Simulation(assets.get_image('Images/boat.png'),
+                     [assets.get_image('Images/rock.png'),
+                      assets.get_image('Images/log.png')])
+
+    # Steer randomly until the boat collides, then start a new run
+    runs = 1
+    start = time.perf_counter()
+    for tick in range(100000):
+        if sim.is_colliding_boat():
+            sim = Simulation(sim.boat.img, sim.obstacles.imgs)
+            runs += 1
+        sim.step(random.choice(["cc", "c", ""]))
+    elapsed = time.perf_counter() - start
+
+    print(f"{tick + 1} ticks in {elapsed:.2f} s \
+({(tick + 1) / elapsed:.0f} ticks/s) over {runs} runs")
@@ -0,0 +1,11 @@
+"""
+Shared setup for the tests: the game's modules are imported from the
+repository's root directory, and pygame never opens a window.
+"""
+
+# Import modules
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,111 @@
+"""
+Tests for the separating axis collision tests between a convex polygon and
+rectangles: touching doesn't count as overlapping, either shape can be fully
+inside the other, and every way of projecting the polygon agrees.
+"""
+
+# Import modules
+from boat import Boat
+from collision import collide_rect_polygon, collide_rects_polygon, \
+    project_polygon
+from kinematics import Kinematics
+import numpy as np
+import pytest
+import random
+
+SQUARE = [(0, 0), (10, 0), (10, 10), (0, 10)]
+DIAMOND = [(0, -10), (10, 0), (0, 10), (-10, 0)]
+
+def collides(polygon: list[tuple], center: tuple, half_size: tuple) -> bool:
+    """Return whether or not one rectangle overlaps a polygon, checking that
+    testing it alone and in a batch agree."""
+
+    projection = project_polygon(polygon)
+    alone = collide_rect_polygon(center, half_size, projection)
+    batch = collide_rects_polygon(np.array([center], dtype=float),
+                                  np.array([half_size], dtype=float),
+                                  projection)
+    assert batch.tolist() == [alone]
+
+    return alone
+
+@pytest.mark.parametrize("center", [(15, 5), (-5, 5), (5, 15), (5, -5),
+                                    (15, 15)])
+def test_touching_square_edges_and_corners(center: tuple):
+    """Rectangles touching the square's edges or corners don't collide."""
+
+    assert not collides(SQUARE, center, (5, 5))
+
+@pytest.mark.parametrize("center", [(14.9, 5), (-4.9, 5), (5, 14.9),
+                                    (5, -4.9), (14.9, 14.9)])
+def test_overlapping_square_edges_and_corners(center: tuple):
+    """Rectangles overlapping the square by a fraction of a pixel collide."""
+
+    assert collides(SQUARE, center, (5, 5))
+
+def test_touching_diagonal_edge():
+    """A rectangle whose corner touches a slanted edge doesn't collide, and
+    one whose corner crosses it does; only an edge normal separates them."""
+
+    assert not collides(DIAMOND, (7, 7), (2, 2))
+    assert collides(DIAMOND, (6.9, 6.9), (2, 2))
+
+def test_separated_only_by_edge_normal():
+    """Overlapping bounding boxes aren't enough to collide."""
+
+    assert not collides(DIAMOND, (9, 9), (2, 2))
+
+def test_shape_fully_inside_the_other():
+    """A rectangle inside the polygon and a polygon inside the rectangle
+    collide, though none of their edges cross."""
+
+    assert collides(DIAMOND, (0, 0), (1, 1))
+    assert collides(SQUARE, (5, 5), (100, 100))
+
+def test_winding_order_does_not_matter():
+    """A polygon collides the same whichever way its vertices go around."""
+
+    rng = random.Random(0)
+    for _ in range(200):
+        center = (rng.uniform(-15, 15), rng.uniform(-15, 15))
+        half_size = (rng.uniform(1, 5), rng.uniform(1, 5))
+
+        assert collides(DIAMOND, center, half_size) == \
+            collides(DIAMOND[::-1], center, half_size)
+
+@pytest.mark.parametrize("angle", [0, 17, -45, 90, -90])
+def test_placed_hull_matches_projected_hull(angle: float):
+    """The boat's hull placed by Kinematics, whose projection is made of
+    lists, collides with the same rectangles as the placed vertices projected
+    directly."""
+
+    kinematics = Kinematics(Boat.HULL)
+    kinematics.place(angle, (450, 700))
+    placed = kinematics.get_projection()
+    projected = project_polygon(kinematics.get_poly())
+
+    rng = random.Random(angle)
+    centers = np.array([(rng.uniform(350, 550), rng.uniform(580, 820))
+                        for _ in range(2000)])
+    half_sizes = np.array([(rng.uniform(10, 40), rng.uniform(10, 40))
+                           for _ in range(2000)])
+
+    colliding = collide_rects_polygon(centers, half_sizes, placed)
+
+    assert colliding.tolist() == \
+        collide_rects_polygon(centers, half_sizes, projected).tolist()
+    assert 0 < colliding.sum() < len(colliding)
+
+def test_placed_hull_bounds_contain_hull():
+    """The bounding box Kinematics gives for a placement is the placed
+    vertices' bounding box."""
+
+    kinematics = Kinematics(Boat.HULL)
+    for angle in range(-90, 91, 7):
+        kinematics.place(angle, (450.5, 700))
+        poly = np.array(kinematics.get_poly())
+
+        min_pos, max_pos = kinematics.get_bounds()
+
+        assert np.allclose(min_pos, poly.min(axis=0))
+        assert np.allclose(max_pos, poly.max(axis=0))
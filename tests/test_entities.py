@@ -0,0 +1,212 @@
+"""
+Tests for EntityStore: entities keep their spawn order, with their positions,
+types and counters, while the window of rows wraps back to the start of the
+arrays or grows.
+"""
+
+# Import modules
+from entities import EntityStore
+import numpy as np
+import random
+
+def get_rows(store: EntityStore) -> list[tuple]:
+    """Return every entity in the store as (pos_x, pos_y, type_id, counter),
+    in spawn order."""
+
+    return [tuple(pos) + (int(type_id), counter) for pos, type_id, counter in
+            zip(store.get_pos().tolist(), store.get_type_ids(),
+                store.get_counters().tolist())]
+
+def fill(store: EntityStore, ys: list[float]) -> list[tuple]:
+    """Spawn an entity at each y-coord, numbering their types and counters in
+    spawn order, and return them as get_rows() would."""
+
+    rows = []
+    for y in ys:
+        num = len(rows)
+        row = store.spawn([num, y], num)
+        store.get_counters()[row] = num
+        rows.append((num, y, num, num))
+    return rows
+
+def test_spawn_keeps_spawn_order():
+    """Entities are returned in the order they were spawned."""
+
+    store = EntityStore()
+    expected = fill(store, [0, -100, -200])
+
+    assert len(store) == 3
+    assert get_rows(store) == expected
+
+def test_cull_keeps_entities_at_max_y():
+    """Culling removes entities below max_y, not those exactly at it."""
+
+    store = EntityStore()
+    fill(store, [300, 200, 100, 0])
+    store.move(100)
+
+    store.cull(300)
+
+    assert get_rows(store) == [(1, 300, 1, 1), (2, 200, 2, 2),
+                               (3, 100, 3, 3)]
+
+def test_cull_everything():
+    """Culling every entity leaves an empty store that can still spawn."""
+
+    store = EntityStore(capacity=4)
+    fill(store, [0, -100, -200, -300])
+
+    store.cull(-1000)
+    assert len(store) == 0
+    store.cull(-1000)
+    assert len(store) == 0
+
+    store.spawn([5, 0], 1)
+    assert get_rows(store) == [(5, 0, 1, 0)]
+
+def test_spawn_at_wrap_point_reuses_culled_rows():
+    """Once the window reaches the end of the arrays, the entities are moved
+    back to the start instead of growing the arrays."""
+
+    store = EntityStore(capacity=4)
+    expected = fill(store, [0, -100, -200, -300])
+    store.cull(-150)
+    assert store.first == 2
+
+    arrays = store.get_arrays()
+    row = store.spawn([9, -400], 3)
+
+    assert row == 2
+    assert store.first == 0
+    assert len(store.pos) == 4
+    assert all(new is old for new, old in zip(store.get_arrays(), arrays))
+    assert get_rows(store) == expected[2:] + [(9, -400, 3, 0)]
+
+def test_spawn_at_wrap_point_grows_when_more_than_half_full():
+    """The arrays double when the window would take more than half of them
+    after moving back to the start."""
+
+    store = EntityStore(capacity=4)
+    expected = fill(store, [0, -100, -200, -300])
+    store.cull(-50)
+
+    row = store.spawn([9, -400], 3)
+
+    assert row == 3
+    assert len(store.pos) == 8
+    assert all(len(array) == 8 for array in store.get_arrays())
+    assert get_rows(store) == expected[1:] + [(9, -400, 3, 0)]
+
+def test_kill_around_wrap_point():
+    """Killing entities before and after the window wraps keeps the rest in
+    spawn order."""
+
+    store = EntityStore(capacity=4)
+    expected = fill(store, [0, -100, -200, -300])
+
+    # Kill the newest entity, right at the end of the arrays, and the oldest
+    store.kill(3)
+    del expected[3]
+    store.kill(0)
+    del expected[0]
+    assert get_rows(store) == expected
+
+    # The kills freed the first rows, so the window wraps on the next spawn
+    store.spawn([9, -400], 3)
+    expected.append((9, -400, 3, 0))
+    assert store.first == 0
+    assert len(store.pos) == 4
+    assert get_rows(store) == expected
+
+    # Kill the newest entity, which was spawned after the wrap
+    store.kill(2)
+    del expected[2]
+    assert get_rows(store) == expected
+
+def test_matches_list_over_random_operations():
+    """A small store stays equal to a list of the same entities while it
+    wraps and grows many times."""
+
+    rng = random.Random(0)
+    store = EntityStore(capacity=2)
+    expected = []
+    next_y = 0
+
+    for num in range(5000):
+        op = rng.random()
+        if op < .4:
+            next_y -= rng.choice([0, 10, 50])
+            store.spawn([num, next_y], num % 7)
+            expected.append((num, next_y, num % 7, 0))
+        elif op < .6 and len(expected) > 0:
+            row = rng.randrange(len(expected))
+            store.kill(row)
+            del expected[row]
+        elif op < .8:
+            store.move(10)
+            next_y += 10
+            expected = [(x, y + 10, t, c) for x, y, t, c in expected]
+        else:
+            max_y = next_y + rng.choice([0, 20, 100])
+            store.cull(max_y)
+            expected = [row for row in expected if row[1] <= max_y]
+
+        assert get_rows(store) == expected
+
+    # Rows were reused rather than always growing
+    assert len(store.pos) < 5000
+
+def test_views_are_empty_when_empty():
+    """An empty store has empty views."""
+
+    store = EntityStore()
+
+    assert len(store.get_pos()) == 0
+    assert len(store.get_type_ids()) == 0
+    assert len(store.get_counters()) == 0
+    assert isinstance(store.get_pos(), np.ndarray)
+
+def test_query_includes_band_edges():
+    """Entities exactly on the edges of the box are inside it, and entities
+    just outside are not."""
+
+    store = EntityStore()
+    for y in [301, 300, 300, 250, 200, 200, 199]:
+        for x in [99, 100, 150, 200, 201]:
+            store.spawn([x, y])
+
+    rows = store.query(np.array([100, 200]), np.array([200, 300]))
+    pos = store.get_pos()[rows].tolist()
+
+    assert pos == [[x, y] for y in [300, 300, 250, 200, 200]
+                   for x in [100, 150, 200]]
+
+def test_query_band_at_ends_of_window():
+    """A band covering the first or last entities, or none of them, finds
+    the right rows after the window has wrapped."""
+
+    store = EntityStore(capacity=8)
+    for y in range(0, -800, -100):
+        store.spawn([0, y])
+    store.cull(-450)
+    for y in range(-800, -1200, -100):
+        store.spawn([0, y])
+    assert store.first == 0
+
+    def query(min_y, max_y):
+        rows = store.query(np.array([0, min_y]), np.array([0, max_y]))
+        return store.get_pos()[rows, 1].tolist()
+
+    assert query(-500, 1000) == [-500]
+    assert query(-1100, -1100) == [-1100]
+    assert query(-2000, -1100) == [-1100]
+    assert query(-1000, -500) == [-500, -600, -700, -800, -900, -1000]
+    assert query(-450, -400) == []
+    assert query(-1150, -1101) == []
+
+def test_query_empty_store():
+    """Querying an empty store finds nothing."""
+
+    rows = EntityStore().query(np.array([0, 0]), np.array([900, 900]))
+
+    assert len(rows) == 0
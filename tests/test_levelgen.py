@@ -0,0 +1,127 @@
+"""
+Tests for LevelGenerator: obstacles and coins keep their spacing, the river
+stays passable for a boat that can only drift sideways so fast, and laying
+chunks out on the loader thread doesn't change the layout.
+"""
+
+# Import modules
+from levelgen import LevelGenerator
+import numpy as np
+import pytest
+
+# Sizes of the rock and log obstacles
+OBSTACLE_SIZES = [(70, 66), (85, 51)]
+
+# Obstacles far wider and closer together than in the game, so many of the
+# lanes tried would block the river
+TIGHT = dict(obstacle_sizes=[(150, 40), (110, 60)], dist_btwn_obs=60,
+             spawn_y=0)
+
+# Distance the river scrolls in each test
+DISTANCE = 30000
+
+def get_layout(seed: int, threaded=False, step=5, **settings) -> list[tuple]:
+    """Return every placement up to DISTANCE, popped step pixels at a time as
+    the river scrolls."""
+
+    settings.setdefault("obstacle_sizes", OBSTACLE_SIZES)
+    level = LevelGenerator(seed, threaded=threaded, **settings)
+
+    placements = []
+    for distance in range(0, DISTANCE + 1, step):
+        popped = level.pop(distance)
+        assert all(placement[0] <= distance for placement in popped)
+        placements.extend(popped)
+
+    return placements
+
+def get_kind(placements: list[tuple], kind: str) -> list[tuple]:
+    """Return the placements of one kind."""
+
+    return [placement for placement in placements if placement[1] == kind]
+
+@pytest.mark.parametrize("seed", range(10))
+def test_placements_in_order_and_in_lanes(seed: int):
+    """Placements are popped once each, in order of distance, in a lane."""
+
+    level = LevelGenerator(seed, OBSTACLE_SIZES)
+    placements = get_layout(seed)
+
+    assert placements == sorted(placements)
+    assert len(get_kind(placements, "obstacle")) > 0
+    assert len(get_kind(placements, "coin")) > 0
+    assert all(x in level.river_lanes for _, _, x, _ in placements)
+
+@pytest.mark.parametrize("seed", range(10))
+def test_spacing(seed: int):
+    """Obstacles and coins are at least as far apart as when each appeared
+    once the last one had scrolled from spawn_y to its minimum distance."""
+
+    level = LevelGenerator(seed, OBSTACLE_SIZES)
+    placements = get_layout(seed)
+
+    obs_dists = [dist for dist, *_ in get_kind(placements, "obstacle")]
+    coin_dists = [dist for dist, *_ in get_kind(placements, "coin")]
+
+    assert min(np.diff(obs_dists)) >= level.dist_btwn_obs - level.spawn_y
+    assert min(np.diff(coin_dists)) >= level.dist_btwn_coins - level.spawn_y
+
+def test_coins_keep_clear_of_obstacles():
+    """No coin is within coin_clearance after an obstacle, or before one in
+    its lane."""
+
+    level = LevelGenerator(0, OBSTACLE_SIZES)
+    placements = get_layout(0)
+
+    for dist, _, x, _ in get_kind(placements, "coin"):
+        for obs_dist, _, obs_x, _ in get_kind(placements, "obstacle"):
+            if abs(obs_dist - dist) <= level.coin_clearance:
+                assert obs_dist > dist and obs_x != x
+
+@pytest.mark.parametrize("settings", [dict(obstacle_sizes=OBSTACLE_SIZES),
+                                      TIGHT], ids=["game", "tight"])
+def test_reachable_over_many_seeds(settings: dict):
+    """A boat drifting at most max_drift sideways per pixel scrolled can get
+    past every obstacle, for every seed.
+
+    The positions the boat's center can be at are tracked on a grid of half
+    pixels, independently of how LevelGenerator tracks them."""
+
+    for seed in range(200):
+        level = LevelGenerator(seed, **settings)
+        boat_w, boat_h = level.boat_size
+
+        xs = np.arange(level.min_x, level.max_x + .25, .5)
+        reachable = np.ones(len(xs), dtype=bool)
+        last_dist = 0
+
+        for dist, kind, x, type_id in level.pop(DISTANCE):
+            if kind != "obstacle":
+                continue
+            w, h = level.obstacle_sizes[type_id]
+
+            # Spread every reachable position by how far the boat can drift
+            drift = max(0, dist - last_dist - boat_h - h) * level.max_drift
+            reach = int(drift / .5)
+            spread = np.zeros(len(xs), dtype=bool)
+            for i in np.flatnonzero(reachable):
+                spread[max(0, i - reach):i + reach + 1] = True
+
+            # The boat's hit box can't overlap the obstacle's
+            reachable = spread & (np.abs(xs - x) >= w/2 + boat_w/2)
+            last_dist = dist
+
+            assert reachable.any(), f"seed {seed} blocked at {dist}"
+
+@pytest.mark.parametrize("seed", range(5))
+def test_threaded_layout_matches_unthreaded(seed: int):
+    """Laying chunks out on the loader thread gives the same placements."""
+
+    assert get_layout(seed, threaded=True) == get_layout(seed)
+    assert get_layout(seed, threaded=True, **TIGHT) == \
+        get_layout(seed, **TIGHT)
+
+def test_pop_step_does_not_change_layout():
+    """Popping in large or small steps gives the same placements."""
+
+    assert get_layout(0, step=1000) == get_layout(0, step=1)
@@ -0,0 +1,53 @@
+"""
+Tests for Obstacles.is_colliding_boat(): only obstacles in a band around the
+boat are tested exactly, and the band must reach every obstacle that can touch
+the boat, whatever its type.
+"""
+
+# Import modules
+from boat import Boat
+from obstacles import Obstacles
+import pygame as pg
+import pytest
+
+# A small obstacle type and one much taller than it, which sets how far the
+# band reaches vertically
+SIZES = [(70, 66), (20, 200)]
+
+# The boat points straight up, so its hit box spans 425-475 and 625-775
+BOAT_POS = (450, 700)
+
+def is_colliding(pos: tuple[float], type_id: int) -> bool:
+    """Return whether or not a boat at BOAT_POS collides with one obstacle."""
+
+    obstacles = Obstacles(None, [pg.Surface(size) for size in SIZES])
+    obstacles.spawn(pos, type_id)
+    boat = Boat(None, pg.Surface((54, 150)), BOAT_POS, 5)
+
+    return obstacles.is_colliding_boat(boat)
+
+@pytest.mark.parametrize("type_id", [0, 1])
+@pytest.mark.parametrize("side", ["top", "bottom", "left", "right"])
+def test_obstacle_at_band_edge(side: str, type_id: int):
+    """An obstacle overlapping the boat's hit box by half a pixel collides,
+    and one touching it doesn't."""
+
+    half_w, half_h = SIZES[type_id][0] / 2, SIZES[type_id][1] / 2
+    touching = {"top": (450, 625 - half_h), "bottom": (450, 775 + half_h),
+                "left": (425 - half_w, 700), "right": (475 + half_w, 700)}
+    inward = {"top": (0, .5), "bottom": (0, -.5), "left": (.5, 0),
+              "right": (-.5, 0)}
+
+    x, y = touching[side]
+    step_x, step_y = inward[side]
+
+    assert not is_colliding((x, y), type_id)
+    assert is_colliding((x + step_x, y + step_y), type_id)
+
+def test_no_obstacles():
+    """A boat can't collide with no obstacles."""
+
+    obstacles = Obstacles(None, [pg.Surface(size) for size in SIZES])
+    boat = Boat(None, pg.Surface((54, 150)), BOAT_POS, 5)
+
+    assert not obstacles.is_colliding_boat(boat)
@@ -0,0 +1,172 @@
+"""
+Tests for Renderer: dirty rectangles are merged where they overlap and clipped
+to the screen, and only what changed since the last frame is dirty.
+"""
+
+# Import modules
+from render import Renderer
+import pygame as pg
+import pytest
+
+def make_renderer() -> Renderer:
+    """Return a renderer for a 900x900 screen that is never displayed."""
+
+    return Renderer(pg.Surface((900, 900)))
+
+@pytest.fixture
+def next_frame(monkeypatch):
+    """Return a function that presents a renderer's frame and returns what it
+    updated on the display: "flip", or the rectangles updated."""
+
+    presented = []
+    monkeypatch.setattr(pg.display, "flip", lambda: presented.append("flip"))
+    monkeypatch.setattr(pg.display, "update",
+                        lambda rects: presented.append(list(rects)))
+
+    def next_frame(renderer: Renderer):
+        presented.append([])
+        renderer.present()
+        return presented[-1]
+
+    return next_frame
+
+def test_merge_overlapping():
+    """Overlapping rectangles become their union."""
+
+    merged = make_renderer().merge_rects([pg.Rect(0, 0, 10, 10),
+                                          pg.Rect(5, 5, 10, 10)])
+
+    assert merged == [pg.Rect(0, 0, 15, 15)]
+
+def test_merge_keeps_separate_and_touching():
+    """Rectangles that don't overlap, including ones sharing an edge, stay
+    separate."""
+
+    rects = [pg.Rect(0, 0, 10, 10), pg.Rect(10, 0, 10, 10),
+             pg.Rect(100, 100, 5, 5)]
+
+    assert make_renderer().merge_rects(rects) == rects
+
+def test_merge_chain():
+    """A union that grows into other rectangles absorbs them too, even ones
+    the new rectangle didn't overlap."""
+
+    rects = [pg.Rect(0, 0, 10, 30), pg.Rect(30, 0, 10, 10),
+             pg.Rect(15, 25, 10, 10), pg.Rect(5, 5, 30, 3)]
+
+    assert make_renderer().merge_rects(rects) == [pg.Rect(0, 0, 40, 35)]
+
+def test_merge_result_never_overlaps():
+    """Merging many rectangles leaves none overlapping each other."""
+
+    rects = [pg.Rect((i * 37) % 850, (i * 53) % 850, 20 + i % 40, 20 + i % 30)
+             for i in range(200)]
+
+    merged = make_renderer().merge_rects(rects)
+
+    for i, rect in enumerate(merged):
+        assert rect.collidelist(merged[i + 1:]) == -1
+    for rect in rects:
+        assert any(m.contains(rect.clip(pg.Rect(0, 0, 900, 900)))
+                   for m in merged)
+
+def test_merge_clips_to_screen():
+    """Rectangles are clipped to the screen, and ones off it are dropped."""
+
+    merged = make_renderer().merge_rects([pg.Rect(-5, 890, 20, 20),
+                                          pg.Rect(900, 0, 10, 10),
+                                          pg.Rect(0, -10, 10, 10)])
+
+    assert merged == [pg.Rect(0, 890, 15, 10)]
+
+def test_unchanged_frame_has_no_changes(next_frame):
+    """Drawing the same things in the same places again changes nothing."""
+
+    renderer = make_renderer()
+    renderer.mark("boat", pg.Rect(100, 100, 50, 50))
+    renderer.mark("score", pg.Rect(0, 0, 80, 20), "10")
+    assert next_frame(renderer) == "flip"
+
+    renderer.mark("boat", pg.Rect(100, 100, 50, 50))
+    renderer.mark("score", pg.Rect(0, 0, 80, 20), "10")
+    assert next_frame(renderer) == []
+
+def test_moved_is_dirty_where_it_was_and_is(next_frame):
+    """Something that moved is redrawn at its old and new rectangles."""
+
+    renderer = make_renderer()
+    renderer.mark("boat", pg.Rect(100, 100, 50, 50))
+    next_frame(renderer)
+
+    renderer.mark("boat", pg.Rect(300, 100, 50, 50))
+
+    assert sorted(next_frame(renderer)) == [pg.Rect(100, 100, 50, 50),
+                                            pg.Rect(300, 100, 50, 50)]
+
+def test_changed_state_is_dirty(next_frame):
+    """Something drawn in the same place but with a different state is
+    dirty."""
+
+    renderer = make_renderer()
+    renderer.mark("score", pg.Rect(0, 0, 80, 20), "10")
+    next_frame(renderer)
+
+    renderer.mark("score", pg.Rect(0, 0, 80, 20), "11")
+
+    assert next_frame(renderer) == [pg.Rect(0, 0, 80, 20)]
+
+def test_no_longer_drawn_is_erased(next_frame):
+    """Something drawn last frame but not this one is dirty where it was."""
+
+    renderer = make_renderer()
+    renderer.mark("coin", [pg.Rect(10, 10, 20, 20), pg.Rect(60, 10, 20, 20)])
+    renderer.mark("boat", pg.Rect(100, 100, 50, 50))
+    next_frame(renderer)
+
+    renderer.mark("boat", pg.Rect(100, 100, 50, 50))
+
+    assert next_frame(renderer) == [pg.Rect(10, 10, 20, 20),
+                                    pg.Rect(60, 10, 20, 20)]
+
+def test_mark_screen_forgets_earlier_marks(next_frame):
+    """Marking the whole screen forgets what was marked before it in the
+    frame, so only what is drawn over it is tracked on its own."""
+
+    renderer = make_renderer()
+    renderer.mark("boat", pg.Rect(100, 100, 50, 50))
+    renderer.mark_screen("background")
+    renderer.mark("score", pg.Rect(0, 0, 80, 20), "10")
+
+    assert set(renderer.drawing) == {"background", "score"}
+    next_frame(renderer)
+
+    # Only the score changes, so only it is updated
+    renderer.mark_screen("background")
+    renderer.mark("score", pg.Rect(0, 0, 80, 20), "11")
+    assert next_frame(renderer) == [pg.Rect(0, 0, 80, 20)]
+
+def test_first_frame_and_full_screen_changes_flip(next_frame):
+    """The first frame, frames after invalidate(), and frames where the whole
+    screen changed flip the display instead of updating rectangles."""
+
+    renderer = make_renderer()
+    renderer.mark_screen("background", 0)
+    assert next_frame(renderer) == "flip"
+
+    renderer.mark_screen("background", 0)
+    assert next_frame(renderer) == []
+
+    renderer.mark_screen("background", 0)
+    renderer.invalidate()
+    assert next_frame(renderer) == "flip"
+
+    renderer.mark_screen("background", 1)
+    assert next_frame(renderer) == "flip"
+
+def test_flip_without_dirty_rects(next_frame):
+    """With dirty rectangles turned off, every frame flips."""
+
+    renderer = Renderer(pg.Surface((900, 900)), dirty_rects=False)
+    for _ in range(2):
+        renderer.mark("boat", pg.Rect(100, 100, 50, 50))
+        assert next_frame(renderer) == "flip"
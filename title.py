@@ -7,15 +7,21 @@ leaderboard, rules.
 from background import Background
 from button import Button
 from database import Database
+from fonts import font_cache
 from input import Input
-import numpy as np
+from profiler import profiler
 import pygame as pg
+from render import Renderer
+from tracing import tracer
 
 class TitleScreen:
     """Title screen class"""
+
+    # Number of highest scores shown on the leaderboard
+    LEADERBOARD_SIZE = 8
         
     def __init__(self, screen: pg.surface, bg_img: pg.image, 
-                 database: Database):
+                 database: Database, renderer: Renderer):
         """Initialization method.
         
         Arguments:
@@ -25,11 +31,14 @@ class TitleScreen:
                 background image for title_screen
             database
                 Database object that can access all user data
+            renderer
+                presents the parts of the screen that changed each frame
         """
 
         self.screen = screen
         self.background = Background(screen, bg_img)
         self.database = database
+        self.renderer = renderer
 
         # Game title
         self.title = "Through the Wild"
@@ -44,6 +53,9 @@ class TitleScreen:
         self.invalid_login = ""
         self.invalid_signup = ""
 
+        # Error message displayed when a request to the database failed
+        self.request_error = ""
+
         # Whether or not game has started
         self.enter_game = False
 
@@ -54,6 +66,18 @@ class TitleScreen:
         # Which part of title_screen is displaying
         self.displaying_screen = "login"
 
+        # Which part was displaying the last time the title screen was
+        # displayed, to trace when it changes
+        self.last_screen = None
+
+        # Number of requests to the database that haven't finished; the title 
+        # screen shows it is loading until they have
+        self.num_requests = 0
+
+        # Cached static layer of each screen keyed by the screen's name; each 
+        # one is (data, layer) where data is what the layer was built with
+        self.static_layers = {}
+
         # Initialize the contents of the login screen
         self.init_login_screen()
 
@@ -76,10 +100,10 @@ class TitleScreen:
                 requested font with correct size
         """
 
-        return pg.font.Font('Fonts/Pixel.ttf', size)
+        return font_cache.get_font(size)
 
     def display_text(self, text: str, font_size: int, pos: tuple, 
-                     mode="CENTER"):
+                     mode="CENTER") -> pg.Rect:
         """Display text at a requested font_size at a requested position.
         
         Arguments:
@@ -94,21 +118,111 @@ class TitleScreen:
                     CENTER: pos is in the center of the text render
                     CORNER: pos is in the top-left of the text render
 
+        Returns:
+            rect
+                area of the screen drawn on
         """
-        # Rendering the text with the requested font size
-        text = self.get_font(font_size).render(text, False, (0, 0, 0))
+        # Rendering the text with the requested font size; static labels are 
+        # only rendered once
+        label = font_cache.render(text, font_size)
 
         # Displaying the text with pos in the center of the render
         if mode == 'CENTER':
-            self.screen.blit(text, (pos[0] - text.get_size()[0]/2, 
-                                    pos[1] - text.get_size()[1]/2))
+            rect = self.screen.blit(label, (pos[0] - label.get_size()[0]/2, 
+                                            pos[1] - label.get_size()[1]/2))
         # Displaying the text with pos in the top-left corner of the render
         elif mode == 'CORNER':
-            self.screen.blit(text, pos)
+            rect = self.screen.blit(label, pos)
+
+        # Text is only redrawn on the display when it changes
+        self.renderer.mark(("text", pos, mode), rect, (text, font_size))
+
+        return rect
+
+    def draw_background(self):
+        """Draw the title screen background; it only needs to be redrawn on the
+        display the first time."""
+
+        self.renderer.mark(self.background, self.background.draw())
+
+    def draw_loading_indicator(self):
+        """Draw an animated loading indicator at the bottom of the screen."""
+
+        num_dots = pg.time.get_ticks() // 250 % 4
+        self.display_text("Loading" + "." * num_dots, 30, (450, 780))
+
+    def draw_input(self, input: Input, text: str):
+        """Draw an input box; it is only redrawn on the display when its text or
+        selection changes.
+        
+        Arguments:
+            input
+                input box to draw
+            text
+                input box text
+        """
+
+        self.renderer.mark(input, input.draw(text), 
+                           (text, input.is_selected()))
+
+    def draw_button(self, button: Button):
+        """Draw a button; it is only redrawn on the display when its text 
+        changes.
+        
+        Arguments:
+            button
+                button to draw
+        """
+
+        self.renderer.mark(button, button.draw(), button.text)
+
+    def draw_static_layer(self, name: str, data) -> bool:
+        """Draw the cached static layer of a screen if it was built with the
+        same data.
+        
+        Arguments:
+            name
+                screen name
+            data : any
+                what the static parts of the screen are drawn with
+
+        Returns:
+            whether or not the static layer was drawn
+        """
+
+        if name not in self.static_layers or \
+            self.static_layers[name][0] != data:
+            return False
+        
+        self.screen.blit(self.static_layers[name][1], (0, 0))
+        self.renderer.mark_screen("static layer", (name, data))
+
+        return True
+
+    def save_static_layer(self, name: str, data):
+        """Cache what has been drawn so far on the screen as the static layer 
+        of a screen.
+        
+        Arguments:
+            name
+                screen name
+            data : any
+                what the static parts of the screen were drawn with
+        """
+
+        self.static_layers[name] = (data, self.screen.copy())
+        # The static parts drawn so far are all covered by the layer
+        self.renderer.mark_screen("static layer", (name, data))
 
     def display(self):
         """Display the title screen on the screen."""
 
+        if self.displaying_screen != self.last_screen:
+            tracer.instant(f"{self.last_screen} -> {self.displaying_screen}",
+                           "title", {"from": self.last_screen,
+                                     "to": self.displaying_screen})
+            self.last_screen = self.displaying_screen
+
         if self.displaying_screen == "login":
             self.display_login_screen()
         elif self.displaying_screen == "signup":
@@ -119,9 +233,16 @@ class TitleScreen:
             # collision
             if self.got_data_from_db is not True:
                 self.got_data_from_db = True
-                self.highest_score, self.coin_count, self.lb = self.get_data()
+                with profiler.stage("db"):
+                    self.request(self.get_data, self.set_data, 
+                                 on_error=self.fail_get_data)
             
-            self.display_main_screen()
+            # Only the background and title are shown until the data arrives
+            if self.is_loading():
+                self.draw_background()
+                self.display_text(self.title, 60, (450, 100))
+            else:
+                self.display_main_screen()
         elif self.displaying_screen == "game":
             # Game has started
             self.enter_game = True
@@ -131,6 +252,56 @@ class TitleScreen:
             self.display_leaderboard_screen()
         elif self.displaying_screen == "rules":
             self.display_rules_screen()
+
+        if self.is_loading():
+            self.draw_loading_indicator()
+        elif self.request_error != "":
+            self.display_text(self.request_error, 30, (450, 780))
+
+    def request(self, func, on_result, *args, on_error=None):
+        """Make a call to the database without waiting for it.
+
+        Arguments:
+            func : function
+                what to call on the database's worker thread
+            on_result : function
+                called with what func returns once it has finished
+            args
+                arguments to call func with
+            on_error : function
+                called with the exception if func raised one, after the error
+                is displayed
+        """
+
+        self.num_requests += 1
+        self.request_error = ""
+
+        def finish(result):
+            self.num_requests -= 1
+            on_result(result)
+
+        def fail(error):
+            self.num_requests -= 1
+            self.show_request_error(error)
+            if on_error is not None:
+                on_error(error)
+
+        self.database.submit(func, *args, on_result=finish, on_error=fail)
+
+    def show_request_error(self, error: Exception):
+        """Display that a request to the database failed.
+
+        Arguments:
+            error
+                what the request raised
+        """
+
+        self.request_error = "Couldn't reach the server, try again"
+
+    def is_loading(self) -> bool:
+        """Return whether or not any request to the database is pending."""
+
+        return self.num_requests > 0
     
     def check_for_game(self) -> bool:
         """Return whether or not game has started.
@@ -144,7 +315,8 @@ class TitleScreen:
     def input(self, key_pressed: str):
         """Input key_pressed into input fields or as keys for actions."""
 
-        if key_pressed is not None:
+        # Inputs can't change while they are being checked by the database
+        if key_pressed is not None and not self.is_loading():
             # Change input field with TAB
             if key_pressed == "TAB":
                 if self.un_input.is_selected():
@@ -318,47 +490,53 @@ class TitleScreen:
     def display_login_screen(self):
         """Display the contents of the the login screen."""
 
-        if self.submit_button.is_pressed():
+        if self.submit_button.is_pressed() and not self.is_loading():
             # Attempt to login through user data in database
-            self.login()
+            with profiler.stage("db"):
+                self.login()
         elif self.create_new_button.is_pressed():
             # Initialize signup screen and switch screens
             self.init_signup_screen()
             self.displaying_screen = "signup"
         
-        self.background.draw()
+        # Draw everything but the input boxes from the cached static layer, 
+        # only drawing it again when invalid_login changes
+        if not self.draw_static_layer("login", self.invalid_login):
+            self.draw_background()
 
-        # Display title of game
-        self.display_text(self.title, 60, (450, 100))
+            # Display title of game
+            self.display_text(self.title, 60, (450, 100))
+
+            # Display title of screen
+            self.display_text("Login", 50, (450, 210))
+
+            # Display invalid_login text if any
+            self.display_text(self.invalid_login, 30, (450, 300))
 
-        # Display title of screen
-        self.display_text("Login", 50, (450, 210))
+            # Display Username and Password labels
+            self.display_text("Username: ", 
+                              20, 
+                              (self.un_input.pos[0] - 160,
+                               self.un_input.pos[1]))
 
-        # Display invalid_login text if any
-        self.display_text(self.invalid_login, 30, (450, 300))
+            self.display_text("Password: ", 
+                              20, 
+                              (self.pw_input.pos[0] - 160,
+                               self.pw_input.pos[1]))
 
-        # Display Username and Password labels
-        self.display_text("Username: ", 
-                          20, 
-                          (self.un_input.pos[0] - 160,
-                           self.un_input.pos[1]))
+            # Draw the buttons for the screen
+            self.draw_button(self.submit_button)
+            self.draw_button(self.create_new_button)
 
-        self.display_text("Password: ", 
-                          20, 
-                          (self.pw_input.pos[0] - 160,
-                           self.pw_input.pos[1]))
+            self.save_static_layer("login", self.invalid_login)
 
         # Check if username and password input boxes have bee selected
         self.un_input.check_for_select([self.pw_input])
         self.pw_input.check_for_select([self.un_input])
 
         # Draw username and password input boxes with their respective strings
-        self.un_input.draw(self.un)
-        self.pw_input.draw('*' * len(self.pw))
-
-        # Draw the buttons for the screen
-        self.submit_button.draw()
-        self.create_new_button.draw()
+        self.draw_input(self.un_input, self.un)
+        self.draw_input(self.pw_input, '*' * len(self.pw))
 
         # Continuely unpress the submit button to ensure the press from the 
         # display method is not active
@@ -370,44 +548,49 @@ class TitleScreen:
         NOTE: Logic very similar to display_login_screen.
         """
 
-        if self.submit_button.is_pressed():
-            self.signup()
+        if self.submit_button.is_pressed() and not self.is_loading():
+            # Attempt to signup through user data in database
+            with profiler.stage("db"):
+                self.signup()
         elif self.back_button.is_pressed():
             self.init_login_screen()
             self.displaying_screen = "login"
 
-        self.background.draw()
+        if not self.draw_static_layer("signup", self.invalid_signup):
+            self.draw_background()
 
-        self.display_text(self.title, 60, (450, 100))
+            self.display_text(self.title, 60, (450, 100))
+
+            self.display_text("Create New Account", 50, (450, 210))
 
-        self.display_text("Create New Account", 50, (450, 210))
+            self.display_text(self.invalid_signup, 30, (450, 300))
 
-        self.display_text(self.invalid_signup, 30, (450, 300))
+            self.display_text("Username: ", 
+                              20, 
+                              (self.un_input.pos[0] - 160,
+                               self.un_input.pos[1]))
 
-        self.display_text("Username: ", 
-                          20, 
-                          (self.un_input.pos[0] - 160,
-                           self.un_input.pos[1]))
+            self.display_text("Password: ", 
+                              20, 
+                              (self.pw_input.pos[0] - 160,
+                               self.pw_input.pos[1]))
+            self.display_text("Confirm Password: ", 
+                              20, 
+                              (self.pw_confirm_input.pos[0] - 204,
+                               self.pw_confirm_input.pos[1]))
 
-        self.display_text("Password: ", 
-                          20, 
-                          (self.pw_input.pos[0] - 160,
-                           self.pw_input.pos[1]))
-        self.display_text("Confirm Password: ", 
-                          20, 
-                          (self.pw_confirm_input.pos[0] - 204,
-                           self.pw_confirm_input.pos[1]))
+            self.draw_button(self.submit_button)
+            self.draw_button(self.back_button)
+
+            self.save_static_layer("signup", self.invalid_signup)
 
         self.un_input.check_for_select([self.pw_input, self.pw_confirm_input])
         self.pw_input.check_for_select([self.un_input, self.pw_confirm_input])
         self.pw_confirm_input.check_for_select([self.un_input, self.pw_input])
 
-        self.un_input.draw(self.un)
-        self.pw_input.draw('*' * len(self.pw))
-        self.pw_confirm_input.draw('*' * len(self.pw_confirm))
-
-        self.submit_button.draw()
-        self.back_button.draw()
+        self.draw_input(self.un_input, self.un)
+        self.draw_input(self.pw_input, '*' * len(self.pw))
+        self.draw_input(self.pw_confirm_input, '*' * len(self.pw_confirm))
 
         self.submit_button.unpress()
 
@@ -423,28 +606,34 @@ class TitleScreen:
         elif self.rules_button.is_pressed():
             self.displaying_screen = "rules"
             self.init_rules_screen()
+
+        # The user's data shown on the main menu
+        data = (self.un, int(self.highest_score), self.coin_count)
             
-        self.background.draw()
+        if not self.draw_static_layer("main", data):
+            self.draw_background()
 
-        self.display_text(self.title, 60, (450, 100))
+            self.display_text(self.title, 60, (450, 100))
 
-        self.display_text("Main Menu", 50, (450, 200))
+            self.display_text("Main Menu", 50, (450, 200))
 
-        self.display_text(text=f"Username: {self.un}", 
-                          font_size=30,
-                          pos=(450, 280))
+            self.display_text(text=f"Username: {self.un}", 
+                              font_size=30,
+                              pos=(450, 280))
+
+            self.display_text(text=f"Highest Score: {int(self.highest_score)}", 
+                              font_size=30,
+                              pos=(450, 320))
 
-        self.display_text(text=f"Highest Score: {int(self.highest_score)}", 
-                          font_size=30,
-                          pos=(450, 320))
+            self.display_text(text=f"Coins: {self.coin_count}", 
+                              font_size=30,
+                              pos=(450, 360))
 
-        self.display_text(text=f"Coins: {self.coin_count}", 
-                          font_size=30,
-                          pos=(450, 360))
+            self.draw_button(self.play_button)
+            self.draw_button(self.leaderboard_button)
+            self.draw_button(self.rules_button)
 
-        self.play_button.draw()
-        self.leaderboard_button.draw()
-        self.rules_button.draw()
+            self.save_static_layer("main", data)
 
         self.play_button.unpress()
 
@@ -456,13 +645,16 @@ class TitleScreen:
             self.displaying_screen = "main"
             self.init_main_screen()
             
-        self.background.draw()
+        if not self.draw_static_layer("shop", None):
+            self.draw_background()
 
-        self.display_text(self.title, 60, (450, 100))
+            self.display_text(self.title, 60, (450, 100))
+
+            self.display_text("Shop", 50, (450, 210))
 
-        self.display_text("Shop", 50, (450, 210))
+            self.draw_button(self.back_button)
 
-        self.back_button.draw()
+            self.save_static_layer("shop", None)
 
     def display_leaderboard_screen(self):
         """Display the contents of the the leaderboard screen."""
@@ -470,31 +662,30 @@ class TitleScreen:
         if self.back_button.is_pressed():
             self.displaying_screen = "main"
             self.init_main_screen()
-            
-        self.background.draw()
 
-        self.display_text(self.title, 60, (450, 100))
+        # Leaderboard entries from highest to lowest score
+        entries = [f"{username}: {int(score)}" for username, score in self.lb]
+        data = (entries, self.rank)
 
-        self.display_text("Highest Scores", 50, (450, 210))
+        # Only drawn again when the leaderboard or the user's rank changes
+        if not self.draw_static_layer("leaderboard", data):
+            self.draw_background()
 
-        # Retrieve leaderboard information fromm lb
-        self.lb_usernames, self.lb_scores, self.lb_scores_order = \
-            self.lb[0], self.lb[1], self.lb[2]
-        
-        # Only display the top 8 highest scores
-        n = len(self.lb_usernames)
-        if len(self.lb_usernames) > 8:
-            n = 8
-        
-        # Display as centered 
-        for i in range(n):
-            index = self.lb_scores_order[-1-i]
-            self.display_text(text=f"{self.lb_usernames[index]}: \
-{int(self.lb_scores[index])}",
-                              font_size=30,
-                              pos=(450, 300+i*40))
+            self.display_text(self.title, 60, (450, 100))
 
-        self.back_button.draw()
+            self.display_text("Highest Scores", 50, (450, 210))
+
+            self.display_text(f"Your rank: #{self.rank}", 25, (450, 255))
+            
+            # Display as centered 
+            for i, entry in enumerate(entries):
+                self.display_text(text=entry,
+                                  font_size=30,
+                                  pos=(450, 300+i*40))
+
+            self.draw_button(self.back_button)
+
+            self.save_static_layer("leaderboard", data)
     
     def display_rules_screen(self):
         """Display the contents of the the rules screen."""
@@ -502,8 +693,12 @@ class TitleScreen:
         if self.back_button.is_pressed():
             self.displaying_screen = "main"
             self.init_main_screen()
+
+        # The whole screen is static
+        if self.draw_static_layer("rules", None):
+            return
             
-        self.background.draw()
+        self.draw_background()
 
         self.display_text(self.title, 60, (450, 100))
 
@@ -519,26 +714,34 @@ dodging obstacles and\ncollecting coins."""
         # screen
         lines = rules.splitlines()
         for i, l in enumerate(lines):
-            t = self.get_font(30).render(l, 0, (0, 0, 0))
-            self.screen.blit(t, (rules_pos[0] - t.get_size()[0]/2, 
-                                 rules_pos[1] - t.get_size()[1]/2 + 50*i))
+            t = font_cache.render(l, 30)
+            rect = self.screen.blit(t, (rules_pos[0] - t.get_size()[0]/2, 
+                                rules_pos[1] - t.get_size()[1]/2 + 50*i))
+            self.renderer.mark(("rules", i), rect, l)
+
+        self.draw_button(self.back_button)
 
-        self.back_button.draw()
+        self.save_static_layer("rules", None)
 
     def login(self):
-        """Attempt to login user."""
+        """Attempt to login user; finished by finish_login() once the user's
+        password is retrieved."""
 
-        # Retrieve a table of all user data
-        user_data = self.database.get_table("USER_DATA")
+        # Retrieve the user's password
+        self.request(self.database.get_row, self.finish_login, "USER_DATA", 
+                     "username", self.un, ["password"])
 
-        # Parse the usernames and passwords from the user data
-        usernames = list(user_data["username"])
-        passwords = list(user_data["password"])
+    def finish_login(self, user):
+        """Login user if their password matches.
+        
+        Arguments:
+            user : named tuple
+                the user's password, or None if there is no such user
+        """
 
         # Check that the user's username is in the database and that the user's
         # password matches that in the database
-        if self.un in usernames and \
-           self.pw == passwords[usernames.index(self.un)]:
+        if user is not None and self.pw == user.password:
             
             self.invalid_login = ""
             # Switch to main menu screen
@@ -549,39 +752,62 @@ dodging obstacles and\ncollecting coins."""
             self.invalid_login = "Invalid username or password"
         
     def signup(self):
-        """Attempt to signup a new user."""
-
-        # Retrieve a table of all user data
-        user_data = self.database.get_table("USER_DATA")
-        
-        # Parse all user ids and usernames
-        ids = list(user_data["id"])
-        usernames = list(user_data["username"])
+        """Attempt to signup a new user; finished by finish_signup() once the
+        database has added them."""
 
-        # Check if a user with the saem username exists
-        if self.un in usernames:
-            self.invalid_signup = "Username taken"
-        # CHeck if a new user but if the passwords don't match
-        elif self.un not in usernames and (self.pw != self.pw_confirm):
+        # CHeck if the passwords don't match
+        if self.pw != self.pw_confirm:
             self.invalid_signup = "Passwords do not match up"
         # Check if username or password fields are empty
         elif len(self.un.split()) == 0 or len(self.pw.split()) == 0:
             self.invalid_signup = "Username and/or password cannot be empty"
         # If no errors, then signup
         else:
-            self.invalid_signup = ""
+            self.request(self.add_user, self.finish_signup, self.un, self.pw)
+
+    def add_user(self, un: str, pw: str) -> bool:
+        """Add a new user to the database unless the username is taken.
 
-            # Attempt to sign up with the expectation of already having users
-            try:
-                self.database.add_data("USER_DATA", 
-                                       [ids[-1]+1, self.un, self.pw, 0, 0])
-            # If signing up the first ever user
-            except IndexError:
-                self.database.add_data("USER_DATA", 
-                                       [0, self.un, self.pw, 0, 0])
+        NOTE: runs on the database's worker thread
+
+        Arguments:
+            un
+                username
+            pw
+                password
+
+        Returns:
+            whether or not the user was added
+        """
+
+        # Check if a user with the saem username exists
+        if self.database.get_row("USER_DATA", "username", un, 
+                                 ["id"]) is not None:
+            return False
+
+        # The new user's id follows the last one; the first ever user's id is 0
+        last_id = self.database.get_max("USER_DATA", "id")
+        id = 0 if last_id is None else last_id + 1
+
+        self.database.add_data("USER_DATA", [id, un, pw, 0, 0])
+
+        return True
+
+    def finish_signup(self, added: bool):
+        """Switch to the main menu if the new user was added.
+
+        Arguments:
+            added
+                whether or not the user was added
+        """
+
+        if added:
+            self.invalid_signup = ""
             # Switch to main menu screen
             self.init_main_screen()
             self.displaying_screen = "main"
+        else:
+            self.invalid_signup = "Username taken"
 
     def get_username(self) -> str:
         """Retrieve the player's username.
@@ -593,7 +819,7 @@ dodging obstacles and\ncollecting coins."""
 
         return self.un
 
-    def get_data(self) -> list[int, int, list[list[str], list[int], list[int]]]:
+    def get_data(self) -> list[int, int, list[tuple[str, int]], int]:
         """Retrieve highest_score, coin_count and leaderboard data from the
         database.
         
@@ -603,37 +829,57 @@ dodging obstacles and\ncollecting coins."""
             coin_count
                 the player's total number of collected coins
             lb
-                the leaderboard information 
-                 : usernames, highest_scores, score_order
-                usernames
-                    all of the usernames in the database
-                highest_scores
-                    the highest_score linked to each username
-                scores_order
-                    an array containing the argsort of highest_scores
+                username and highest_score of the LEADERBOARD_SIZE users with
+                the highest scores, from highest to lowest
+            rank
+                the player's rank on the leaderboard
 
         NOTE: all of this done in one method to reduce the number of times the 
         database is accessed -> improves latency 
+
+        NOTE: runs on the database's worker thread
         """
         
-        # Retrieve a table of all user data
-        user_data = self.database.get_table("USER_DATA")
-
-        # Parse usernames, highest_scores, and coin_counts from the database
-        usernames = list(user_data["username"])
-        highest_scores = list(user_data["highest_score"])
-        coin_counts = list(user_data["coin_count"])
-
-        # Index the id of the current used
-        id = usernames.index(self.un)
+        # Retrieve the user's highest_score and coin_count
+        user = self.database.get_row("USER_DATA", "username", self.un, 
+                                     ["highest_score", "coin_count"])
+        highest_score = user.highest_score
+        coin_count = user.coin_count
+
+        # The server only reads the top rows and the rows ahead of the user 
+        # from the index on highest_score
+        lb = [(user.username, user.highest_score) 
+              for user in self.database.get_top_rows("USER_DATA", 
+                                                     "highest_score",
+                                                     ["username", 
+                                                      "highest_score"],
+                                                     self.LEADERBOARD_SIZE)]
+        rank = self.database.get_rank("USER_DATA", "highest_score", 
+                                      highest_score)
+
+        return highest_score, coin_count, lb, rank
+
+    def set_data(self, data: list):
+        """Set highest_score, coin_count and leaderboard data retrieved by
+        get_data().
         
-        # Index the user's highest_score and coin_count with their id
-        highest_score = highest_scores[id]
-        coin_count = coin_counts[id]
+        Arguments:
+            data
+                what get_data() returned
+        """
 
-        # Argsort highest_scores
-        scores_order = np.argsort(highest_scores)
+        self.highest_score, self.coin_count, self.lb, self.rank = data
 
-        lb = [usernames, highest_scores, scores_order]
+    def fail_get_data(self, error: Exception):
+        """Go back to the login screen since the main menu can't be displayed
+        without the data get_data() failed to retrieve.
+        
+        Arguments:
+            error
+                what get_data() raised
+        """
 
-        return highest_score, coin_count, lb
\ No newline at end of file
+        self.got_data_from_db = False
+        self.enter_game = False
+        self.init_login_screen()
+        self.displaying_screen = "login"
\ No newline at end of file
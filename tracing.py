@@ -0,0 +1,260 @@
+"""
+A Tracer class to record what the game spends its time on as spans that can be
+studied offline in a Chrome trace viewer (chrome://tracing or Perfetto), and a
+function to save a cProfile profile as collapsed stacks for flame graphs.
+"""
+
+# Import modules
+from collections import Counter, deque
+from contextlib import contextmanager
+import cProfile
+import functools
+import json
+import os
+import pstats
+import threading
+import time
+
+class Tracer:
+    """Tracer class. Spans are named intervals of time, with a category, on
+    the thread they ran on; instant events mark a single moment. Only the
+    most recent events are kept, in a ring of a fixed size, so tracing can
+    stay on for a whole session. Nothing is recorded unless enabled."""
+
+    def __init__(self, max_events=100000):
+        """Initialization method.
+
+        Arguments:
+            max_events : int
+                number of most recent events to keep
+        """
+
+        # Whether or not events are recorded
+        self.enabled = False
+
+        # Most recent events; each is (phase, name, category, start, duration,
+        # thread id, args) with times in seconds, where phase is "X" for a
+        # span and "i" for an instant event
+        self.events = deque(maxlen=max_events)
+
+        # Names of the threads events were recorded on, keyed by thread id
+        self.thread_names = {}
+
+        # Events are recorded on the database and loader threads too, so
+        # events and thread_names are only changed or read with the lock held
+        self.lock = threading.Lock()
+
+        # Time every event's timestamp is relative to
+        self.origin = time.perf_counter()
+
+    def add_event(self, phase: str, name: str, category: str, start: float,
+                  duration=0.0, args=None):
+        """Record an event on the current thread.
+
+        Arguments:
+            phase
+                "X" for a span, "i" for an instant event
+            name
+                name of the event
+            category
+                category of the event, e.g. "frame" or "db"
+            start
+                time.perf_counter() when the event started
+            duration : float
+                length of a span in seconds
+            args : dict
+                anything else to show with the event
+        """
+
+        thread = threading.current_thread()
+
+        with self.lock:
+            if thread.ident not in self.thread_names:
+                self.thread_names[thread.ident] = thread.name
+
+            self.events.append((phase, name, category, start, duration,
+                                thread.ident, args))
+
+    @contextmanager
+    def span(self, name: str, category: str, args=None):
+        """Record the code run inside a with statement as a span.
+
+        Arguments:
+            name
+                name of the span
+            category
+                category of the span
+            args : dict
+                anything else to show with the span
+        """
+
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_event("X", name, category, start,
+                           time.perf_counter() - start, args)
+
+    def traced(self, category: str):
+        """Return a decorator recording every call of a function as a span
+        named after the function.
+
+        Arguments:
+            category
+                category of the spans
+
+        Returns:
+            decorator
+        """
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(func.__qualname__, category):
+                    return func(*args, **kwargs)
+            return wrapper
+
+        return decorator
+
+    def instant(self, name: str, category: str, args=None):
+        """Record an instant event.
+
+        Arguments:
+            name
+                name of the event
+            category
+                category of the event
+            args : dict
+                anything else to show with the event
+        """
+
+        if self.enabled:
+            self.add_event("i", name, category, time.perf_counter(),
+                           args=args)
+
+    def get_trace_events(self) -> list[dict]:
+        """Return the recorded events in the Chrome trace event format.
+
+        Returns:
+            trace_events
+                one dict per event, plus one naming each thread
+        """
+
+        pid = os.getpid()
+
+        # Copy what other threads may be adding to
+        with self.lock:
+            thread_names = list(self.thread_names.items())
+            events = list(self.events)
+
+        trace_events = [{"ph": "M", "name": "thread_name", "pid": pid,
+                         "tid": tid, "args": {"name": name}}
+                        for tid, name in thread_names]
+
+        for phase, name, category, start, duration, tid, args in events:
+            event = {"ph": phase, "name": name, "cat": category,
+                     "ts": (start - self.origin) * 1e6,
+                     "pid": pid, "tid": tid}
+
+            if phase == "X":
+                event["dur"] = duration * 1e6
+            else:
+                # Instant events are drawn across their thread's track
+                event["s"] = "t"
+
+            if args is not None:
+                event["args"] = args
+
+            trace_events.append(event)
+
+        return trace_events
+
+    def save(self, path: str):
+        """Save the recorded events as a Chrome trace JSON file.
+
+        Arguments:
+            path
+                file to save to
+        """
+
+        with open(path, "w") as file:
+            json.dump({"traceEvents": self.get_trace_events(),
+                       "displayTimeUnit": "ms"}, file)
+
+def get_frame_label(func: tuple) -> str:
+    """Return how a function is labelled in a collapsed stack.
+
+    Arguments:
+        func
+            (file, line, name) of a function, as keyed in pstats
+
+    Returns:
+        label
+    """
+
+    file, line, name = func
+
+    # Built-in functions have no file
+    if file == "~":
+        return name
+
+    return f"{name} ({os.path.basename(file)}:{line})"
+
+def save_collapsed_stacks(profile: cProfile.Profile, path: str,
+                          min_time=1e-6):
+    """Save a profile as collapsed stacks, one line per stack with its
+    function names separated by semicolons followed by the microseconds spent
+    in its last function, which flamegraph.pl and speedscope can draw.
+
+    cProfile only records which function called which, not whole stacks, so
+    the time of a function called from several places is split between them
+    in proportion to the time each caller spent in it.
+
+    Arguments:
+        profile
+            the profile
+        path
+            file to save to
+        min_time : float
+            stacks under this many seconds are left out
+    """
+
+    stats = pstats.Stats(profile).stats
+
+    # Cumulative time of each function's callees when called from it
+    callees = {}
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, (_, _, _, cumtime) in callers.items():
+            callees.setdefault(caller, {})[func] = cumtime
+
+    stacks = Counter()
+
+    def walk(func: tuple, stack: list[str], on_stack: set, cumtime: float):
+        # Fraction of the function's time spent under this stack
+        fraction = cumtime / stats[func][3] if stats[func][3] > 0 else 0
+        stacks[";".join(stack)] += stats[func][2] * fraction
+
+        for callee, callee_time in callees.get(func, {}).items():
+            # Recursive calls are already counted in the caller's time
+            if callee in on_stack or callee_time * fraction < min_time:
+                continue
+
+            walk(callee, stack + [get_frame_label(callee)],
+                 on_stack | {callee}, callee_time * fraction)
+
+    # Start from the functions nothing profiled called
+    for func, (_, _, _, cumtime, callers) in stats.items():
+        if len(callers) == 0:
+            walk(func, [get_frame_label(func)], {func}, cumtime)
+
+    with open(path, "w") as file:
+        for stack, self_time in stacks.items():
+            if self_time >= min_time:
+                file.write(f"{stack} {round(self_time * 1e6)}\n")
+
+# Traces the whole game
+tracer = Tracer()